@@ -0,0 +1,81 @@
+"""
+aho_corasick.py
+---------------
+Autômato de Aho-Corasick: encontra todas as ocorrências de um conjunto de
+padrões num texto em uma única passada, O(texto + ocorrências), não importa
+quantos padrões existam.
+
+  • trie dos padrões em tabelas planas (uma dict de transições por estado)
+  • links de falha calculados em BFS; a lista de saída de cada estado já
+    inclui as saídas do estado de falha (sem seguir a cadeia na busca)
+  • transições completadas na mesma BFS (goto determinístico), então a
+    busca faz um único lookup por caractere
+
+Uso:
+  from aho_corasick import AhoCorasick
+  ac = AhoCorasick(["GATO", "RATO"])
+  list(ac.iter_matches("OGATORATO"))   → [(0, 5), (1, 9)]   (padrão, fim exclusivo)
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """Multi-pattern matcher; pattern ids are their positions in the input."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("padrão vazio")
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pid)
+
+        # BFS: a state's failure target is shallower, so its transitions are
+        # already complete when the state is processed; missing letters are
+        # filled from it (goto becomes a full DFA, one lookup per character)
+        alphabet = {ch for pattern in self.patterns for ch in pattern}
+        fail = [0] * len(goto)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            children = dict(goto[state])
+            for ch in alphabet:
+                nxt = children.get(ch)
+                if nxt is None:
+                    goto[state][ch] = goto[fail[state]][ch] if state else 0
+                    continue
+                fail[nxt] = goto[fail[state]][ch] if state else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._out = out
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yields (pattern id, end index exclusive) for every occurrence."""
+        goto, out = self._goto, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                yield pid, i + 1
@@ -1,10 +1,8 @@
-import json, unicodedata, sys
+import json, sys
 from pathlib import Path
 
-def normalize(w):
-    nfkd = unicodedata.normalize("NFD", w)
-    without = "".join(c for c in nfkd if unicodedata.category(c) != "Mn" and c not in (" ", "-", "'"))
-    return without.upper()
+from text_normalizer import normalize
+
 
 p = Path(r"c:\repos\unity\WordGames\WordSearch\Assets\_Project\Resources\Data\words\desafio.json")
 with open(p, "r", encoding="utf-8-sig") as f:
@@ -0,0 +1,152 @@
+"""
+bench_packer.py
+---------------
+Compara o GridGenerator atual (sorteio com repetição, port fiel do C#) com o
+ConstraintPacker (slots indexados, mais restrita primeiro, retrocesso) nas
+mesmas palavras e seeds:
+
+  • campanha — todas as categorias × níveis 1–15 (seed do jogo + --samples
+                seeds extras por nível)
+  • desafio  — grids 20x10 / 20x14 / 20x16 com 10 palavras do banco
+                desafio + categorias, --challenge seeds por tamanho
+
+Por algoritmo: níveis completos (todas as palavras posicionadas), palavras
+posicionadas e tempo por nível (média e p95).
+
+Uso:
+  python scripts/data/bench_packer.py [--samples 5] [--challenge 200] [--json saida.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from levelgen import (
+    LEVELS_PER_CATEGORY,
+    ConstraintPacker,
+    GridGenerator,
+    challenge_pool,
+    generate_challenge,
+    generate_level,
+    generate_seed,
+    load_categories,
+    load_desafio,
+    string_hash,
+)
+from levelgen.level import CHALLENGE_SIZES
+
+
+PLACERS = {"random": GridGenerator, "packer": ConstraintPacker}
+
+
+@dataclass
+class PlacerStats:
+    levels: int = 0
+    complete: int = 0
+    words: int = 0
+    placed: int = 0
+    times_ms: list[float] = field(default_factory=list)
+
+    def add(self, requested: int, placed: int, elapsed_ms: float) -> None:
+        self.levels += 1
+        self.complete += placed == requested
+        self.words += requested
+        self.placed += placed
+        self.times_ms.append(elapsed_ms)
+
+    def summary(self) -> dict:
+        times = sorted(self.times_ms)
+        return {
+            "levels": self.levels,
+            "complete_pct": 100.0 * self.complete / self.levels if self.levels else 0.0,
+            "placed_pct": 100.0 * self.placed / self.words if self.words else 0.0,
+            "mean_ms": sum(times) / len(times) if times else 0.0,
+            "p95_ms": times[int(0.95 * (len(times) - 1))] if times else 0.0,
+        }
+
+
+def _timed(build) -> tuple[int, int, float]:
+    started = time.perf_counter()
+    level = build()
+    elapsed = (time.perf_counter() - started) * 1000
+    return len(level.placements) + len(level.dropped), len(level.placements), elapsed
+
+
+def bench_campaign(categories, samples: int) -> dict[str, PlacerStats]:
+    stats = {name: PlacerStats() for name in PLACERS}
+    for category in categories:
+        if not category.normalized:
+            continue
+        for n in range(1, LEVELS_PER_CATEGORY + 1):
+            seeds = [generate_seed(category.category_id, n)]
+            seeds += [string_hash(f"{category.category_id}_{n}_{k}") for k in range(1, samples)]
+            for seed in seeds:
+                for name, placer in PLACERS.items():
+                    stats[name].add(*_timed(lambda: generate_level(
+                        category.category_id, n, category.normalized, category.display,
+                        seed=seed, generator=placer,
+                    )))
+    return stats
+
+
+def bench_challenge(pool, rows: int, cols: int, seeds: int) -> dict[str, PlacerStats]:
+    stats = {name: PlacerStats() for name in PLACERS}
+    for seed in range(seeds):
+        for name, placer in PLACERS.items():
+            stats[name].add(*_timed(lambda: generate_challenge(
+                pool.normalized, pool.display, rows, cols, seed, generator=placer,
+            )))
+    return stats
+
+
+def print_table(title: str, stats: dict[str, PlacerStats]) -> dict:
+    print(f"\n  {title}")
+    print(f"  {'algoritmo':<10} {'níveis':>7} {'completos':>10} {'palavras':>9} "
+          f"{'ms/nível':>9} {'p95 ms':>8}")
+    rows = {}
+    for name, s in stats.items():
+        row = s.summary()
+        rows[name] = row
+        print(f"  {name:<10} {row['levels']:>7,} {row['complete_pct']:>9.1f}% "
+              f"{row['placed_pct']:>8.1f}% {row['mean_ms']:>9.2f} {row['p95_ms']:>8.2f}")
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark: GridGenerator × ConstraintPacker.")
+    parser.add_argument("--samples", type=int, default=5,
+                        help="seeds por nível da campanha (o 1º é o seed do jogo; padrão: 5)")
+    parser.add_argument("--challenge", type=int, default=200,
+                        help="seeds por tamanho de grid do desafio (padrão: 200)")
+    parser.add_argument("--json", type=Path, help="grava o resumo em JSON")
+    args = parser.parse_args()
+
+    categories = load_categories()
+    pool = challenge_pool(categories, load_desafio())
+
+    print(f"\n{'='*60}")
+    print(f"  bench_packer.py — sorteio (GridGenerator) × restrições (ConstraintPacker)")
+    print(f"{'='*60}")
+
+    report = {"campaign": print_table(
+        f"Campanha — {len(categories)} categorias × {LEVELS_PER_CATEGORY} níveis × "
+        f"{args.samples} seeds",
+        bench_campaign(categories, max(1, args.samples)),
+    )}
+    for rows, cols in CHALLENGE_SIZES:
+        report[f"challenge_{rows}x{cols}"] = print_table(
+            f"Desafio {rows}x{cols} — {args.challenge} seeds, {len(pool.normalized):,} palavras",
+            bench_challenge(pool, rows, cols, args.challenge),
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n  Resumo → {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
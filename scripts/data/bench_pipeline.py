@@ -0,0 +1,497 @@
+"""
+bench_pipeline.py
+-----------------
+Benchmark das etapas do pipeline de conteúdo (build_termo.py,
+validate_words.py, build_desafio.py) sobre corpora sintéticos — as fontes
+reais (ICF, Hunspell, ...) não são necessárias.
+
+Etapas:
+  read_icf, read_conj, read_verbos, read_dic, read_names
+                — leitores do build_termo (sem cache) sobre cada fonte
+  read_affix    — expansão .aff/.dic (hunspell_affix) do .dic sintético
+  normalize     — text_normalizer.normalize em todas as entradas do .dic
+  plurals       — bases implícitas + plural_rules (5 letras)
+  build_sets    — build_termo.assemble_sets (5 letras) com as fontes lidas
+  write_json    — words_5.json + valid_5.json numa pasta temporária
+  validate      — validate_words: check_file por categoria + duplicatas
+                  entre categorias
+  desafio       — build_desafio: dedupe pela forma normalizada
+
+Cada etapa roda num processo novo: tempo de parede (melhor de --repeat),
+pico de RSS do processo (inclui a preparação da etapa; indisponível no
+Windows) e vazão em palavras/s.
+
+Corpus: --lines linhas por fonte grande (ICF, conjugações, .dic; verbos
+recebem 1/10 e nomes 1/100), de 10k a 5M. Cada corpus é gerado uma vez,
+com seed fixo, em .cache/bench_pipeline/.
+
+Baseline: --save-baseline grava o resultado; --baseline compara e sai com
+código 1 se alguma etapa ficar mais lenta (ou usar mais memória) que a
+baseline além de --tolerance.
+
+Uso:
+  python scripts/data/bench_pipeline.py [--lines 10k,100k,1M] [--stages read_icf,...]
+                                        [--repeat 3] [--json saida.json]
+                                        [--baseline base.json [--tolerance 0.25]]
+                                        [--save-baseline base.json]
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import build_desafio
+import build_termo
+import validate_words
+from plural_rules import PLURALS, implicit_bases, implicit_span
+from stage_metrics import peak_rss_mb
+from text_normalizer import normalize
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CORPUS_DIR = REPO_ROOT / ".cache" / "bench_pipeline"
+
+# Bump when the synthetic corpus generator changes (old corpora are rebuilt)
+CORPUS_VERSION = 2
+CORPUS_SEED = 20240501
+
+MIN_LINES = 10_000
+MAX_LINES = 5_000_000
+
+# Length built by the build_sets / write_json stages
+BENCH_LENGTH = 5
+
+# Synthetic words files for the validate stage
+BENCH_CATEGORIES = 8
+
+# A stage regresses only when it is also this much slower in absolute terms
+MIN_SLACK_SECONDS = 0.02
+
+BASELINE_VERSION = 2
+
+NAME_FILES = ("municipios-br", "paises", "estados-br")
+
+# Affix rules for the flags of the synthetic .dic (plurals, -mente, verbs)
+SYNTHETIC_AFF = """SET UTF-8
+
+SFX S Y 3
+SFX S 0 s [aeiouáéíóúâêôãõ]
+SFX S 0 es [rsz]
+SFX S l is [aeou]l
+
+SFX M Y 1
+SFX M 0 mente [aeo]
+
+SFX B Y 2
+SFX B 0 s .
+SFX B 0 inho/S [^aeiou]
+
+SFX D Y 4
+SFX D ar o ar
+SFX D ar amos ar
+SFX D er e er
+SFX D 0 do/S [aeiou]
+
+PFX R Y 2
+PFX R 0 re .
+PFX R 0 des [^s]
+"""
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+ONSETS = ["", "b", "c", "d", "f", "g", "l", "m", "n", "p", "r", "s", "t", "v",
+          "br", "cr", "pr", "tr", "ch", "lh", "nh", "qu", "gu"]
+VOWELS = ["a", "e", "i", "o", "u", "á", "é", "í", "ó", "ú", "â", "ê", "ô", "ã", "õ"]
+CODAS = ["", "", "", "r", "s", "l", "m", "n", "z"]
+
+
+def synthetic_word(rng: random.Random) -> str:
+    """A Portuguese-looking word of 1–5 syllables (accents included)."""
+    return "".join(
+        rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS)
+        for _ in range(rng.randint(1, 5))
+    )
+
+
+def parse_lines(text: str) -> list[int]:
+    """Parses "10k,100k,1M" for --lines."""
+    sizes = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        scale = {"k": 1_000, "m": 1_000_000}.get(part[-1], 1)
+        try:
+            size = int(float(part.rstrip("km")) * scale)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"tamanho inválido: {part!r}")
+        if not MIN_LINES <= size <= MAX_LINES:
+            raise argparse.ArgumentTypeError(f"--lines deve ficar entre {MIN_LINES:,} e {MAX_LINES:,}")
+        sizes.append(size)
+    if not sizes:
+        raise argparse.ArgumentTypeError("nenhum tamanho informado")
+    return sorted(set(sizes))
+
+
+def corpus_dir(lines: int) -> Path:
+    return CORPUS_DIR / f"corpus-v{CORPUS_VERSION}-{lines}"
+
+
+def make_corpus(lines: int) -> Path:
+    """Writes (once) the synthetic sources for `lines`; returns their folder."""
+    folder = corpus_dir(lines)
+    if (folder / "meta.json").exists():
+        return folder
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(f"{CORPUS_SEED}-{lines}")
+
+    def write(name: str, rows) -> int:
+        count = 0
+        with (folder / name).open("w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(row + "\n")
+                count += 1
+        return count
+
+    (folder / "pt_BR.aff").write_text(SYNTHETIC_AFF, encoding="utf-8")
+    counts = {
+        "icf": write("icf", (f"{synthetic_word(rng)},{rng.uniform(5, 30):.6f}" for _ in range(lines))),
+        "conj": write("conjugações", (synthetic_word(rng) for _ in range(lines))),
+        "verbos": write("verbos", (synthetic_word(rng) + rng.choice(["ar", "er", "ir"])
+                                   for _ in range(max(1, lines // 10)))),
+        "dic": write("pt_BR.dic", itertools.chain([str(lines)], (
+            synthetic_word(rng) + rng.choice(["", "/S", "/MS", "/BDR"]) for _ in range(lines)
+        ))),
+    }
+    n_names = max(1, lines // 100)
+    for name in NAME_FILES:
+        counts[name] = write(name, (
+            " ".join(synthetic_word(rng).capitalize() for _ in range(rng.choice([1, 1, 2])))
+            for _ in range(n_names)
+        ))
+
+    words_dir = folder / "words"
+    words_dir.mkdir(exist_ok=True)
+    per_category = max(validate_words.MIN_WORDS_PER_CATEGORY, lines // 100)
+    for k in range(BENCH_CATEGORIES):
+        cat_id = f"bench_{k}"
+        (words_dir / f"{cat_id}.json").write_text(json.dumps(
+            {"categoryId": cat_id, "words": [synthetic_word(rng) for _ in range(per_category)]},
+            ensure_ascii=False,
+        ), encoding="utf-8")
+    counts["words"] = per_category * BENCH_CATEGORIES
+
+    (folder / "meta.json").write_text(json.dumps({"lines": lines, "counts": counts}), encoding="utf-8")
+    return folder
+
+
+# ---------------------------------------------------------------------------
+# Stages — setup(corpus) → state (not timed), run(state) → (items in, items out)
+# ---------------------------------------------------------------------------
+
+def _count_lines(path: Path) -> int:
+    with path.open("rb") as f:
+        return sum(1 for _ in f)
+
+
+def _reader_stage(reader: Callable, *names: str):
+    def setup(corpus: Path):
+        paths = [corpus / n for n in names]
+        return paths, sum(_count_lines(p) for p in paths)
+
+    def run(state):
+        paths, lines = state
+        out = sum(len(reader(p)) for p in paths)
+        return lines, out
+    return setup, run
+
+
+def _read_sources(corpus: Path) -> dict:
+    return {
+        "icf": build_termo.read_icf(corpus / "icf"),
+        "conj": build_termo.read_wordlist(corpus / "conjugações"),
+        "verbos": build_termo.read_wordlist(corpus / "verbos"),
+        "dic": build_termo.read_wordlist(corpus / "pt_BR.dic"),
+        "affix": build_termo.read_affix_forms(corpus / "pt_BR.dic"),
+        "municipios": build_termo.read_names(corpus / "municipios-br"),
+        "paises": build_termo.read_names(corpus / "paises"),
+        "estados": build_termo.read_names(corpus / "estados-br"),
+    }
+
+
+def _quiet(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+def _setup_normalize(corpus: Path):
+    with (corpus / "pt_BR.dic").open(encoding="utf-8") as f:
+        next(f)
+        return [build_termo.strip_flags(line) for line in f]
+
+
+def _run_normalize(words):
+    return len(words), len({normalize(w) for w in words})
+
+
+def _setup_plurals(corpus: Path):
+    return build_termo.read_icf(corpus / "icf"), build_termo.read_wordlist(corpus / "pt_BR.dic")
+
+
+def _run_plurals(state):
+    icf, dic = state
+    base_lengths = build_termo.base_lengths_for([BENCH_LENGTH])
+    lengths = base_lengths | implicit_span(base_lengths)
+    icf_by = build_termo.bucket_by_length(icf, lengths)
+    dic_by = build_termo.bucket_by_length(dic, lengths)
+    bases = {b: icf_by[b] | dic_by[b] for b in base_lengths}
+    for found in (implicit_bases(icf_by, base_lengths), implicit_bases(dic_by, base_lengths)):
+        for b, implicit in found.items():
+            bases[b] |= implicit
+    plurals = {p for words in bases.values()
+               for forms in PLURALS.plurals(words, BENCH_LENGTH).values() for p in forms}
+    return len(icf) + len(dic), len(plurals)
+
+
+def _setup_build_sets(corpus: Path):
+    return _read_sources(corpus)
+
+
+def _run_build_sets(sources):
+    results = _quiet(build_termo.assemble_sets, sources, [BENCH_LENGTH])
+    targets, valid = results[BENCH_LENGTH]
+    return sum(len(s) for s in sources.values()), len(targets) + len(valid)
+
+
+def _setup_write_json(corpus: Path):
+    return _quiet(build_termo.assemble_sets, _read_sources(corpus), [BENCH_LENGTH])[BENCH_LENGTH]
+
+
+def _run_write_json(state):
+    targets, valid = state
+    with tempfile.TemporaryDirectory() as tmp:
+        build_termo.write_json(Path(tmp) / f"words_{BENCH_LENGTH}.json", targets)
+        build_termo.write_json(Path(tmp) / f"valid_{BENCH_LENGTH}.json", valid)
+    return len(targets) + len(valid), len(targets) + len(valid)
+
+
+def _setup_validate(corpus: Path):
+    return sorted((corpus / "words").glob("*.json"))
+
+
+def _run_validate(paths):
+    results = {p.name: validate_words.check_file(p, "") for p in paths}
+    errors = validate_words.validate_cross_categories(results)
+    return sum(r["wordCount"] for r in results.values()), len(errors)
+
+
+def _setup_desafio(corpus: Path):
+    with (corpus / "conjugações").open(encoding="utf-8") as f:
+        return [line.strip() for line in f]
+
+
+def _run_desafio(words):
+    return len(words), len(build_desafio.dedupe_by_normalized(words))
+
+
+STAGES: dict[str, tuple[Callable[[Path], object], Callable[[object], tuple[int, int]]]] = {
+    "read_icf":    _reader_stage(build_termo.read_icf, "icf"),
+    "read_conj":   _reader_stage(build_termo.read_wordlist, "conjugações"),
+    "read_verbos": _reader_stage(build_termo.read_wordlist, "verbos"),
+    "read_dic":    _reader_stage(build_termo.read_wordlist, "pt_BR.dic"),
+    "read_names":  _reader_stage(build_termo.read_names, *NAME_FILES),
+    "read_affix":  _reader_stage(build_termo.read_affix_forms, "pt_BR.dic"),
+    "normalize":   (_setup_normalize, _run_normalize),
+    "plurals":     (_setup_plurals, _run_plurals),
+    "build_sets":  (_setup_build_sets, _run_build_sets),
+    "write_json":  (_setup_write_json, _run_write_json),
+    "validate":    (_setup_validate, _run_validate),
+    "desafio":     (_setup_desafio, _run_desafio),
+}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StageResult:
+    stage: str
+    lines: int
+    wall_s: float
+    peak_rss_mb: float | None
+    items_in: int
+    items_out: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.stage}@{self.lines}"
+
+    @property
+    def words_per_s(self) -> float:
+        return self.items_in / self.wall_s if self.wall_s > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """camelCase keys, as in the stage_metrics report (--metrics-json)."""
+        return {
+            "stage": self.stage,
+            "lines": self.lines,
+            "durationSeconds": self.wall_s,
+            "peakRssMb": self.peak_rss_mb,
+            "itemsIn": self.items_in,
+            "itemsOut": self.items_out,
+            "wordsPerSecond": self.words_per_s,
+        }
+
+
+def run_stage(stage: str, corpus: Path, lines: int, repeat: int) -> StageResult:
+    """Runs one stage `repeat` times (in the calling process); keeps the best time."""
+    setup, run = STAGES[stage]
+    state = setup(corpus)
+    best, items = float("inf"), (0, 0)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items = run(state)
+        best = min(best, time.perf_counter() - started)
+    return StageResult(stage, lines, best, peak_rss_mb(), *items)
+
+
+def measure(stage: str, corpus: Path, lines: int, repeat: int) -> StageResult:
+    """run_stage in a fresh process, so the peak RSS belongs to that stage alone."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_stage, stage, corpus, lines, repeat).result()
+
+
+# ---------------------------------------------------------------------------
+# Baseline
+# ---------------------------------------------------------------------------
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        raise SystemExit(f"❌ baseline {path} tem versão {data.get('version')} (esperado {BASELINE_VERSION})")
+    return {f"{r['stage']}@{r['lines']}": r for r in data["results"]}
+
+
+def save_baseline(path: Path, results: list[StageResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [r.to_dict() for r in results],
+    }, indent=2), encoding="utf-8")
+
+
+def regressions(results: list[StageResult], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Stages slower (or with a larger peak RSS) than the baseline beyond `tolerance`."""
+    found = []
+    for r in results:
+        base = baseline.get(r.key)
+        if base is None:
+            continue
+        base_s = base["durationSeconds"]
+        if r.wall_s > base_s * (1 + tolerance) and r.wall_s - base_s > MIN_SLACK_SECONDS:
+            found.append(f"{r.key}: {r.wall_s:.3f}s > {base_s:.3f}s "
+                         f"(+{r.wall_s / base_s - 1:.0%})")
+        if r.peak_rss_mb is not None and base.get("peakRssMb"):
+            if r.peak_rss_mb > base["peakRssMb"] * (1 + tolerance):
+                found.append(f"{r.key}: pico de RSS {r.peak_rss_mb:.1f} MB > "
+                             f"{base['peakRssMb']:.1f} MB")
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def parse_stages(text: str) -> list[str]:
+    stages = [s.strip() for s in text.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown or not stages:
+        raise argparse.ArgumentTypeError(
+            f"etapas inválidas: {unknown} (disponíveis: {', '.join(STAGES)})"
+        )
+    return stages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark das etapas do pipeline de conteúdo.")
+    parser.add_argument("--lines", type=parse_lines, default=[100_000], metavar="10k,100k,1M",
+                        help="linhas por fonte grande do corpus sintético (padrão: 100k)")
+    parser.add_argument("--stages", type=parse_stages, default=list(STAGES), metavar="read_icf,...",
+                        help="etapas a medir (padrão: todas)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="execuções por etapa; vale o melhor tempo (padrão: 3)")
+    parser.add_argument("--json", type=Path, help="grava os resultados em JSON")
+    parser.add_argument("--baseline", type=Path, help="compara com uma baseline gravada")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="piora aceita em relação à baseline (padrão: 0.25 = 25%%)")
+    parser.add_argument("--save-baseline", type=Path, metavar="ARQUIVO",
+                        help="grava os resultados como nova baseline")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("⏱️  Benchmark do pipeline de conteúdo")
+    print("=" * 72)
+
+    results: list[StageResult] = []
+    for lines in args.lines:
+        started = time.perf_counter()
+        corpus = make_corpus(lines)
+        print(f"\n   Corpus de {lines:,} linhas ({time.perf_counter() - started:.1f}s) → {corpus}")
+        print(f"   {'etapa':<12} {'tempo':>9} {'pico RSS':>10} {'entrada':>10} "
+              f"{'saída':>10} {'palavras/s':>12}")
+        for stage in args.stages:
+            r = measure(stage, corpus, lines, args.repeat)
+            results.append(r)
+            rss = f"{r.peak_rss_mb:.1f} MB" if r.peak_rss_mb is not None else "—"
+            print(f"   {r.stage:<12} {r.wall_s:>8.3f}s {rss:>10} {r.items_in:>10,} "
+                  f"{r.items_out:>10,} {r.words_per_s:>12,.0f}")
+
+    if args.json:
+        args.json.write_text(json.dumps([r.to_dict() for r in results], indent=2),
+                             encoding="utf-8")
+        print(f"\n   Resultados → {args.json}")
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"   Baseline → {args.save_baseline}")
+
+    status = 0
+    if args.baseline:
+        baseline = load_baseline(args.baseline)
+        missing = [r.key for r in results if r.key not in baseline]
+        found = regressions(results, baseline, args.tolerance)
+        print()
+        print("=" * 72)
+        if missing:
+            print(f"   ⚠️  sem baseline para: {', '.join(missing)}")
+        for line in found:
+            print(f"   ❌ {line}")
+        if found:
+            print(f"❌ {len(found)} regressão(ões) acima de {args.tolerance:.0%} ({args.baseline})")
+            status = 1
+        else:
+            print(f"✅ Nenhuma regressão acima de {args.tolerance:.0%} ({args.baseline})")
+        print("=" * 72)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
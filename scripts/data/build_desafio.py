@@ -1,11 +1,9 @@
 """Build desafio.json with minimum word counts per normalized length."""
-import json, unicodedata
+import json
 from pathlib import Path
 
-def normalize(w):
-    nfkd = unicodedata.normalize("NFD", w)
-    without = "".join(c for c in nfkd if unicodedata.category(c) != "Mn" and c not in (" ", "-", "'"))
-    return without.upper()
+from text_normalizer import normalize
+
 
 # Keep all existing words
 existing = [
@@ -89,40 +87,60 @@ new_10 = [
     "despedidas","duplicados",
 ]
 
-# Combine all
-all_words = list(existing)
-for batch in [new_3, new_4, new_5, new_6, new_8, new_9, new_10]:
-    all_words.extend(batch)
-
-# Deduplicate by normalized form
-seen = set()
-unique = []
-for w in all_words:
-    n = normalize(w)
-    if n not in seen and len(n) >= 3:
-        seen.add(n)
-        unique.append(w)
-
-# Count by length
-by_len = {}
-for w in unique:
-    n = len(normalize(w))
-    by_len.setdefault(n, []).append(w)
-
-print(f"Total unique: {len(unique)}")
-targets = {3:30, 4:30, 5:100, 6:30, 7:30, 8:30, 9:30, 10:30}
-for k in sorted(by_len.keys()):
-    t = targets.get(k, 0)
-    gap = max(0, t - len(by_len[k]))
-    mark = f" *** NEED {gap} MORE ***" if gap > 0 else " OK"
-    print(f"  {k} chars: {len(by_len[k])}{mark}")
-    if gap > 0 or k in (10, 11):
-        for w in by_len[k]:
-            print(f"    {w} -> {normalize(w)} ({len(normalize(w))})")
-
-# Write
-out = {"categoryId": "desafio", "words": unique}
-p = Path(r"c:\repos\unity\WordGames\WordSearch\Assets\_Project\Resources\Data\words\desafio.json")
-with open(p, "w", encoding="utf-8") as f:
-    json.dump(out, f, ensure_ascii=False, indent=4)
-print(f"\nWrote {len(unique)} words to desafio.json")
+# Normalized length → minimum number of words
+LENGTH_TARGETS = {3:30, 4:30, 5:100, 6:30, 7:30, 8:30, 9:30, 10:30}
+
+OUTPUT_FILE = Path(r"c:\repos\unity\WordGames\WordSearch\Assets\_Project\Resources\Data\words\desafio.json")
+
+
+def collect_words() -> list[str]:
+    """Existing words followed by every new batch, in order."""
+    all_words = list(existing)
+    for batch in [new_3, new_4, new_5, new_6, new_8, new_9, new_10]:
+        all_words.extend(batch)
+    return all_words
+
+
+def dedupe_by_normalized(words: list[str]) -> list[str]:
+    """First word of each normalized form, dropping forms under 3 letters."""
+    seen = set()
+    unique = []
+    for w in words:
+        n = normalize(w)
+        if n not in seen and len(n) >= 3:
+            seen.add(n)
+            unique.append(w)
+    return unique
+
+
+def group_by_length(words: list[str]) -> dict[int, list[str]]:
+    by_len = {}
+    for w in words:
+        n = len(normalize(w))
+        by_len.setdefault(n, []).append(w)
+    return by_len
+
+
+def main() -> None:
+    unique = dedupe_by_normalized(collect_words())
+    by_len = group_by_length(unique)
+
+    print(f"Total unique: {len(unique)}")
+    for k in sorted(by_len.keys()):
+        t = LENGTH_TARGETS.get(k, 0)
+        gap = max(0, t - len(by_len[k]))
+        mark = f" *** NEED {gap} MORE ***" if gap > 0 else " OK"
+        print(f"  {k} chars: {len(by_len[k])}{mark}")
+        if gap > 0 or k in (10, 11):
+            for w in by_len[k]:
+                print(f"    {w} -> {normalize(w)} ({len(normalize(w))})")
+
+    # Write
+    out = {"categoryId": "desafio", "words": unique}
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(out, f, ensure_ascii=False, indent=4)
+    print(f"\nWrote {len(unique)} words to desafio.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+build_levels.py
+---------------
+Pré-computa todos os níveis do Caça-Palavras (categoria × nível 1–15) com o
+port Python do LevelGenerator (ver levelgen/) e grava um arquivo de níveis
+prontos que o jogo pode carregar em vez de gerar em runtime.
+
+Para cada nível: seed, tamanho do grid, letras (uma string por linha),
+posicionamentos e as palavras sorteadas que o gerador não conseguiu
+posicionar (descartadas em silêncio pelo C#).
+
+Com --fill frequency as letras de preenchimento seguem a frequência de
+letras e bigramas do ICF (sem ICF, das próprias categorias) e nunca formam
+uma palavra de categoria nem da lista de bloqueio (Data/bloqueadas), em
+nenhuma direção (ver levelgen/filler.py). O padrão, uniform, é o
+FillEmptyCells do C#.
+
+Uso:
+  python scripts/data/build_levels.py [--jobs N] [--levels 1-15]
+                                      [--categories animais,esportes]
+                                      [--fill uniform|frequency] [--blocklist arquivo]
+                                      [--output caminho/levels.json]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from levelgen import (
+    LEVELS_PER_CATEGORY,
+    ForbiddenIndex,
+    LetterFiller,
+    LetterModel,
+    generate_catalog,
+    load_categories,
+    load_desafio,
+    write_levels,
+)
+from levelgen.catalog import DATA_DIR, REPO_ROOT, Category
+from text_normalizer import normalize
+
+
+OUTPUT_FILE = DATA_DIR / "levels.json"
+
+# Words the filler letters must never spell (one per line, accents allowed)
+BLOCKLIST_FILE = REPO_ROOT / "Data" / "bloqueadas"
+
+FILL_MODES = ["uniform", "frequency"]
+
+
+def parse_levels(text: str) -> list[int]:
+    """ "1-15" or "1,2,10-12" → sorted level numbers."""
+    levels: set[int] = set()
+    try:
+        for part in filter(None, (p.strip() for p in text.split(","))):
+            first, _, last = part.partition("-")
+            levels.update(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"níveis inválidos: {text!r}")
+    if not levels or min(levels) < 1:
+        raise argparse.ArgumentTypeError("níveis devem ser ≥ 1")
+    return sorted(levels)
+
+
+def read_blocklist(path: Path) -> list[str]:
+    if not path.exists():
+        print(f"  ⚠️  {path.name} não encontrado — só as palavras das categorias são bloqueadas")
+        return []
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [normalize(line.strip()) for line in lines if line.strip() and not line.startswith("#")]
+
+
+def make_filler(categories: list[Category], blocklist: Path) -> LetterFiller:
+    """Letter model from the well-known ICF words (category words without ICF)
+    and the forbidden index of every category word plus the blocklist.
+    """
+    from build_termo import TARGET_FREQ_MAX, read_source
+
+    icf, _ = read_source("icf")
+    words = [w for w, freq in icf.items() if freq <= TARGET_FREQ_MAX]
+    source = f"ICF ({len(words):,} palavras)"
+    if not words:
+        words = [w for c in categories for w in c.normalized]
+        source = f"categorias ({len(words):,} palavras, ICF ausente)"
+    desafio = load_desafio()
+    forbidden = ForbiddenIndex(
+        [w for c in categories for w in c.normalized]
+        + (desafio.normalized if desafio else [])
+        + read_blocklist(blocklist)
+    )
+    print(f"  Letras     : {source}")
+    print(f"  Proibidas  : {len(forbidden):,} palavras (até {forbidden.max_length} letras)")
+    return LetterFiller(LetterModel.from_words(words), forbidden)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pré-computa os níveis do Caça-Palavras.")
+    parser.add_argument(
+        "--jobs", type=int, default=0, metavar="N",
+        help="processos em paralelo, um por categoria (0 = todos os núcleos; padrão: 0)",
+    )
+    parser.add_argument(
+        "--levels", type=parse_levels, default=list(range(1, LEVELS_PER_CATEGORY + 1)),
+        metavar="1-15", help=f"níveis a gerar (padrão: 1-{LEVELS_PER_CATEGORY})",
+    )
+    parser.add_argument("--categories", metavar="ID,ID", help="só estas categorias")
+    parser.add_argument(
+        "--fill", choices=FILL_MODES, default="uniform",
+        help="letras de preenchimento: uniform (igual ao C#, padrão) ou frequency "
+             "(frequência do português, sem formar palavras proibidas)",
+    )
+    parser.add_argument("--blocklist", type=Path, default=BLOCKLIST_FILE,
+                        help="com --fill frequency: palavras bloqueadas, uma por linha")
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE, help="arquivo de saída")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    categories = load_categories()
+    if args.categories:
+        wanted = {c.strip() for c in args.categories.split(",") if c.strip()}
+        unknown = wanted - {c.category_id for c in categories}
+        if unknown:
+            parser.error(f"categorias desconhecidas: {', '.join(sorted(unknown))}")
+        categories = [c for c in categories if c.category_id in wanted]
+
+    print(f"\n{'='*60}")
+    print(f"  build_levels.py — Níveis pré-computados")
+    print(f"{'='*60}")
+    print(f"  Categorias : {len(categories)}")
+    print(f"  Níveis     : {args.levels[0]}–{args.levels[-1]} ({len(args.levels)})")
+    print(f"  Processos  : {jobs}")
+    print(f"  Preenchim. : {args.fill}")
+    filler = make_filler(categories, args.blocklist) if args.fill == "frequency" else None
+    print()
+
+    started = time.perf_counter()
+    levels = generate_catalog(categories, args.levels, jobs, filler)
+    elapsed = time.perf_counter() - started
+
+    incomplete = [lv for lv in levels if lv.dropped]
+    for lv in incomplete:
+        print(f"  ⚠️  {lv.category_id} #{lv.level_number}: "
+              f"{len(lv.dropped)} palavra(s) não posicionada(s) — {', '.join(lv.dropped)}")
+
+    write_levels(args.output, levels)
+    try:
+        shown = args.output.resolve().relative_to(REPO_ROOT)
+    except ValueError:
+        shown = args.output
+    print(f"\n  ✓ {len(levels)} níveis em {elapsed:.2f}s "
+          f"({len(incomplete)} incompletos) → {shown}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
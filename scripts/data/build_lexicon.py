@@ -0,0 +1,138 @@
+"""
+build_lexicon.py
+----------------
+Mescla todas as fontes de Data/ (ICF, conjugações, verbos, pt_BR.dic e as
+flexões do pt_BR.aff, municípios, países, estados) num léxico SQLite
+indexado (ver lexicon.py): palavra normalizada, forma de exibição,
+tamanho, frequência ICF e máscara de bits das fontes.
+
+As fontes passam pelos mesmos parsers do build_termo.py (mesmos filtros e
+normalização). A forma de exibição é a grafia da primeira fonte, na ordem
+de SOURCES, em que a palavra aparece (ICF primeiro), em maiúsculas.
+
+O léxico só é regerado quando alguma fonte ou regra de leitura muda.
+
+Uso:
+  python scripts/data/build_lexicon.py [--output lexicon.sqlite] [--force]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from build_termo import SOURCE_EXTRAS, SOURCES, iter_source, reader_fingerprint
+from lexicon import LEXICON_FILE, LEXICON_VERSION, SCHEMA, SOURCE_BITS
+from source_cache import file_digest, rules_fingerprint
+from text_normalizer import to_display
+
+
+def lexicon_fingerprint() -> str:
+    """Reader rules plus the digest of every source file that exists."""
+    parts = [f"lexicon={LEXICON_VERSION}"]
+    for key, (_, path) in SOURCES.items():
+        parts.append(reader_fingerprint(key))
+        for source in [path, *SOURCE_EXTRAS.get(key, [])]:
+            parts.append(f"{source.name}={file_digest(source) if source.exists() else '-'}")
+    return rules_fingerprint(parts)
+
+
+def merge_sources() -> tuple[dict[str, list], dict[str, int]]:
+    """{normalized: [display, freq, mask]} over every source, plus words per source."""
+    merged: dict[str, list] = {}
+    counts: dict[str, int] = {}
+    for key in SOURCES:
+        bit = SOURCE_BITS[key]
+        seen = 0
+        for n, raw, extra in iter_source(key):
+            seen += 1
+            entry = merged.get(n)
+            if entry is None:
+                entry = merged[n] = [to_display(raw), None, 0]
+            entry[2] |= bit
+            if key == "icf":
+                freq = float(extra)
+                if entry[1] is None or freq < entry[1]:
+                    entry[1] = freq
+        counts[key] = seen
+    return merged, counts
+
+
+def write_lexicon(path: Path, merged: dict[str, list], fingerprint: str) -> None:
+    """Writes a fresh database next to `path` and swaps it in."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    db = sqlite3.connect(tmp)
+    try:
+        db.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;")
+        db.executescript(SCHEMA)
+        db.executemany(
+            "INSERT INTO words (word, display, length, freq, sources) VALUES (?, ?, ?, ?, ?)",
+            ((word, display, len(word), freq, mask)
+             for word, (display, freq, mask) in sorted(merged.items())),
+        )
+        db.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+            ("version", str(LEXICON_VERSION)),
+            ("fingerprint", fingerprint),
+            ("builtAt", datetime.now(timezone.utc).isoformat(timespec="seconds")),
+            ("sourceBits", ",".join(f"{k}={v}" for k, v in SOURCE_BITS.items())),
+        ])
+        db.commit()
+        db.execute("ANALYZE")
+        db.commit()
+    finally:
+        db.close()
+    os.replace(tmp, path)
+
+
+def stored_fingerprint(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    try:
+        db = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = db.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        finally:
+            db.close()
+    except sqlite3.DatabaseError:
+        return None
+    return row[0] if row else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gera o léxico indexado a partir de Data/.")
+    parser.add_argument("--output", type=Path, default=LEXICON_FILE, help="arquivo SQLite de saída")
+    parser.add_argument("--force", action="store_true", help="regera mesmo sem mudanças")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📚 Léxico indexado — fontes de Data/")
+    print("=" * 60)
+
+    fingerprint = lexicon_fingerprint()
+    if not args.force and stored_fingerprint(args.output) == fingerprint:
+        print(f"  ✓ Em dia (fontes inalteradas) → {args.output}")
+        return 0
+
+    started = time.perf_counter()
+    merged, counts = merge_sources()
+    for key, count in counts.items():
+        _, path = SOURCES[key]
+        status = f"{count:>9,} entradas" if path.exists() else "    ausente"
+        print(f"  {key:<12} {status}  ({path.name})")
+    read = time.perf_counter()
+
+    write_lexicon(args.output, merged, fingerprint)
+    done = time.perf_counter()
+
+    print(f"\n  ✓ {len(merged):,} palavras, {args.output.stat().st_size:,} bytes → {args.output}")
+    print(f"    leitura {read - started:.1f}s, gravação {done - read:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
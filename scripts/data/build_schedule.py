@@ -0,0 +1,255 @@
+"""
+build_schedule.py
+-----------------
+Pré-calcula o calendário da palavra do dia do Termo BR (vários anos) a
+partir de words_N.json e o grava em daily_N.bytes (ver daily_schedule.py:
+a palavra de uma data é um acesso O(1) no dispositivo).
+
+Regras:
+  • nenhuma palavra se repete no calendário
+  • palavras com o mesmo radical (as primeiras N−2 letras) ficam a pelo
+    menos STEM_GAP_DAYS dias uma da outra, e anagramas a ANAGRAM_GAP_DAYS
+  • curva de dificuldade semanal (DIFFICULTY_CURVE, segunda → domingo)
+    sobre a frequência ICF: cada dia pede um percentil de dificuldade entre
+    as palavras ainda livres (mais comum = mais fácil; fora do ICF = mais
+    difícil) e recebe a palavra livre mais próxima que respeita os
+    espaçamentos
+  • determinístico: mesmas entradas e --seed → mesmo calendário
+
+Regenerar (lista de alvos mudou, calendário acabando) preserva os dias já
+publicados: o calendário anterior é lido e os dias até --keep-through
+(padrão: hoje) são copiados como estão — mesmo palavras que saíram da
+lista; só os dias seguintes são replanejados, sem repetir nenhuma palavra
+já usada.
+
+Uso:
+  python scripts/data/build_schedule.py [--length 5] [--years 3] [--start 2026-01-01]
+                                        [--keep-through 2026-10-18] [--previous arquivo]
+                                        [--seed S] [--fresh]
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+from build_termo import OUTPUT_DIR, read_source, target_file
+from daily_schedule import DailySchedule, ScheduleFormatError, write_schedule
+
+
+DEFAULT_YEARS = 3
+DEFAULT_SEED = "termo-br"
+
+# Minimum days between two words sharing a stem / between anagrams
+STEM_GAP_DAYS = 30
+ANAGRAM_GAP_DAYS = 90
+
+# Requested difficulty percentile per weekday (Monday first): easy start,
+# harder toward the weekend, a breather on Sunday
+DIFFICULTY_CURVE = [0.20, 0.30, 0.40, 0.50, 0.60, 0.75, 0.35]
+
+# Random spread around the requested percentile (fraction of the free pool)
+JITTER = 0.05
+
+
+def schedule_file(length: int) -> Path:
+    return OUTPUT_DIR / f"daily_{length}.bytes"
+
+
+def stem_key(word: str) -> str:
+    return word[:max(3, len(word) - 2)]
+
+
+def anagram_key(word: str) -> str:
+    return "".join(sorted(word))
+
+
+def difficulty_order(words: list[str], icf: dict[str, float], seed: str) -> list[str]:
+    """Easiest first: ICF frequency, absent words last; ties in seeded hash order."""
+    def key(w: str) -> tuple[float, bytes]:
+        return icf.get(w, float("inf")), hashlib.sha256(f"{seed}:{w}".encode()).digest()
+    return sorted(words, key=key)
+
+
+class Planner:
+    """Assigns free words to consecutive days under the spacing rules."""
+
+    def __init__(self, pool: list[str], seed: str):
+        self.free = pool                       # easiest first
+        self.rng = random.Random(seed)
+        self.last_stem: dict[str, int] = {}
+        self.last_anagram: dict[str, int] = {}
+        self.relaxed = 0
+
+    def mark(self, word: str, index: int) -> None:
+        self.last_stem[stem_key(word)] = index
+        self.last_anagram[anagram_key(word)] = index
+
+    def _gap(self, word: str, index: int) -> float:
+        """How well `word` clears the spacing rules on day `index` (≥ 0 = clears)."""
+        stem = self.last_stem.get(stem_key(word))
+        anagram = self.last_anagram.get(anagram_key(word))
+        return min(
+            float("inf") if stem is None else (index - stem) - STEM_GAP_DAYS,
+            float("inf") if anagram is None else (index - anagram) - ANAGRAM_GAP_DAYS,
+        )
+
+    def pick(self, index: int, difficulty: float) -> str:
+        """Free word nearest to `difficulty` (percentile of the free pool) that
+        clears the spacing rules; the least-violating word if none does.
+        """
+        size = len(self.free)
+        spread = round(JITTER * size)
+        wanted = round(difficulty * (size - 1)) + self.rng.randint(-spread, spread)
+        wanted = min(max(wanted, 0), size - 1)
+
+        best, best_gap = wanted, float("-inf")
+        for offset in range(size):
+            for position in (wanted + offset, wanted - offset) if offset else (wanted,):
+                if not 0 <= position < size:
+                    continue
+                gap = self._gap(self.free[position], index)
+                if gap >= 0:
+                    return self._take(position, index)
+                if gap > best_gap:
+                    best, best_gap = position, gap
+        self.relaxed += 1
+        return self._take(best, index)
+
+    def _take(self, position: int, index: int) -> str:
+        word = self.free.pop(position)
+        self.mark(word, index)
+        return word
+
+
+def plan_schedule(
+    targets: list[str],
+    icf: dict[str, float],
+    epoch: date,
+    days: int,
+    kept: list[str],
+    seed: str = DEFAULT_SEED,
+) -> tuple[list[str], int]:
+    """Calendar of `days` words from `epoch`, starting with the `kept` ones.
+
+    Returns (words, days that had to relax a spacing rule). Stops early
+    when the target list runs out.
+    """
+    used = set(kept)
+    pool = difficulty_order([w for w in dict.fromkeys(targets) if w not in used], icf, seed)
+    # Seeded by the first replanned day too, so a regeneration is reproducible
+    planner = Planner(pool, f"{seed}:{epoch + timedelta(days=len(kept))}")
+    for index, word in enumerate(kept):
+        planner.mark(word, index)
+
+    words = list(kept)
+    for index in range(len(kept), days):
+        if not planner.free:
+            break
+        weekday = (epoch + timedelta(days=index)).weekday()
+        words.append(planner.pick(index, DIFFICULTY_CURVE[weekday]))
+    return words, planner.relaxed
+
+
+def load_previous(path: Path, length: int) -> DailySchedule | None:
+    if not path.exists():
+        return None
+    try:
+        previous = DailySchedule.load(path)
+    except ScheduleFormatError as e:
+        raise SystemExit(f"❌ {path}: {e}")
+    if previous.length != length:
+        raise SystemExit(f"❌ {path} tem palavras de {previous.length} letras, não {length}")
+    return previous
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Calendário da palavra do dia do Termo BR.")
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("--years", type=float, default=DEFAULT_YEARS,
+                        help=f"extensão do calendário a partir da época (padrão: {DEFAULT_YEARS})")
+    parser.add_argument("--start", type=date.fromisoformat, metavar="AAAA-MM-DD",
+                        help="época de um calendário novo (padrão: hoje); ignorada se já existe um")
+    parser.add_argument("--keep-through", type=date.fromisoformat, default=date.today(),
+                        metavar="AAAA-MM-DD",
+                        help="último dia publicado, preservado como está (padrão: hoje)")
+    parser.add_argument("--previous", type=Path,
+                        help="calendário publicado (padrão: o próprio daily_N.bytes)")
+    parser.add_argument("--seed", default=DEFAULT_SEED)
+    parser.add_argument("--fresh", action="store_true",
+                        help="ignora o calendário anterior (só antes do lançamento!)")
+    args = parser.parse_args()
+
+    n = args.length
+    output = schedule_file(n)
+    targets_path = target_file(n)
+    if not targets_path.exists():
+        print(f"❌ {targets_path} não existe — rode build_termo.py --lengths {n}")
+        return 1
+    targets = json.loads(targets_path.read_text(encoding="utf-8"))["words"]
+    icf, _ = read_source("icf")
+    if not icf:
+        print("  ⚠️  ICF ausente — dificuldade uniforme (ordem só pelo seed)")
+
+    previous = None if args.fresh else load_previous(args.previous or output, n)
+    if previous is not None:
+        epoch = previous.epoch
+        published = min(max((args.keep_through - epoch).days + 1, 0), len(previous))
+        kept = previous.words()[:published]
+    else:
+        epoch = args.start or date.today()
+        kept = []
+
+    days = round(args.years * 365.25)
+    if len(kept) > days:
+        days = len(kept)
+    words, relaxed = plan_schedule(targets, icf, epoch, days, kept, args.seed)
+    write_schedule(output, words, n, epoch)
+
+    print("=" * 60)
+    print(f"📅 Calendário diário ({n} letras)")
+    print("=" * 60)
+    print(f"  Alvos (words_{n})    : {len(set(targets)):,}")
+    print(f"  Época              : {epoch}")
+    kept_until = f" (até {epoch + timedelta(days=len(kept) - 1)})" if kept else ""
+    print(f"  Dias preservados   : {len(kept):,}{kept_until}")
+    print(f"  Dias planejados    : {len(words) - len(kept):,}")
+    print(f"  Último dia         : {epoch + timedelta(days=len(words) - 1)}")
+    if len(words) < days:
+        print(f"  ⚠️  Alvos insuficientes: {days - len(words):,} dia(s) sem palavra "
+              f"(pedido: {days:,})")
+    if relaxed:
+        print(f"  ⚠️  {relaxed} dia(s) sem palavra que respeitasse os espaçamentos "
+              f"(usada a menos próxima)")
+
+    target_set = set(targets)
+    removed = [w for w in kept if w not in target_set]
+    if removed:
+        print(f"  ⚠️  {len(removed)} palavra(s) publicada(s) já fora de words_{n}: {removed[:10]}")
+
+    # Mean ICF rank per weekday, to eyeball the curve
+    ranked = difficulty_order(targets, icf, args.seed)
+    order = {w: i / max(len(ranked) - 1, 1) for i, w in enumerate(ranked)}
+    totals: Counter = Counter()
+    counts: Counter = Counter()
+    for index, w in enumerate(words[len(kept):], start=len(kept)):
+        if w in order:
+            weekday = (epoch + timedelta(days=index)).weekday()
+            totals[weekday] += order[w]
+            counts[weekday] += 1
+    labels = ["seg", "ter", "qua", "qui", "sex", "sáb", "dom"]
+    curve = "  ".join(
+        f"{labels[d]} {totals[d] / counts[d]:.2f}" for d in range(7) if counts[d]
+    )
+    if icf and curve:
+        print(f"  Dificuldade média  : {curve}")
+    print(f"\n  ✓ {output} ({output.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+build_shards.py
+---------------
+Pré-normaliza o banco de palavras do Caça-Palavras em um shard binário por
+categoria (ver word_shards.py): formas normalizada e de exibição, na ordem
+do JSON, mais um índice por tamanho e os buckets de seleção por largura
+de grid (8, 10, 12 e 20 — a lista que o SelectWords filtra a cada nível).
+O resultado é o mesmo que o WordDatabase.AddCategory monta em runtime
+(palavras com menos de 3 letras já descartadas), então o jogo pode
+carregar cada categoria sob demanda sem normalizar nada.
+
+Saída (Resources/Data/shards/):
+  <categoria>.bytes  ← um shard por categoria (inclui desafio)
+  manifest.json      ← id, arquivo, palavras, maior tamanho, palavras por
+                       bucket de seleção e SHA-256 de cada shard — basta
+                       para listar categorias sem abrir os shards
+
+Shards cujo conteúdo não mudou não são regravados.
+
+Uso:
+  python scripts/data/build_shards.py [--output pasta]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from levelgen.catalog import CATEGORIES_FILE, DATA_DIR, WORDS_DIR, load_json, make_category
+from levelgen.level import CHALLENGE_ID, MIN_WORD_LENGTH, selection_widths
+from word_shards import MANIFEST_NAME, SHARD_SUFFIX, SHARD_VERSION, encode_shard
+
+
+SHARDS_DIR = DATA_DIR / "shards"
+
+
+def shard_ids(categories_file: Path = CATEGORIES_FILE, words_dir: Path = WORDS_DIR) -> list[str]:
+    """Category ids in categories.json order, then desafio when present."""
+    ids = [c["id"] for c in load_json(categories_file).get("categories", [])]
+    if (words_dir / f"{CHALLENGE_ID}.json").exists() and CHALLENGE_ID not in ids:
+        ids.append(CHALLENGE_ID)
+    return ids
+
+
+def build_shards(output: Path, words_dir: Path = WORDS_DIR) -> tuple[dict, int]:
+    """Writes every shard plus the manifest; returns (manifest, shards rewritten)."""
+    output.mkdir(parents=True, exist_ok=True)
+    widths = selection_widths()
+    entries, written = [], 0
+    for cat_id in shard_ids(words_dir=words_dir):
+        source = words_dir / f"{cat_id}.json"
+        if not source.exists():
+            print(f"  ⚠️  {source.name} não encontrado — sem shard para '{cat_id}'")
+            continue
+        category = make_category(cat_id, load_json(source).get("words", []))
+        data = encode_shard(category.normalized, category.display, widths)
+
+        path = output / f"{cat_id}{SHARD_SUFFIX}"
+        if not path.exists() or path.read_bytes() != data:
+            path.write_bytes(data)
+            written += 1
+        entries.append({
+            "id": cat_id,
+            "file": path.name,
+            "words": len(category.normalized),
+            "maxLength": max((len(w) for w in category.normalized), default=0),
+            "selectable": {
+                str(w): sum(MIN_WORD_LENGTH <= len(n) <= w for n in category.normalized)
+                for w in widths
+            },
+            "sha256": hashlib.sha256(data).hexdigest(),
+        })
+
+    manifest = {"version": SHARD_VERSION, "selectionWidths": widths, "categories": entries}
+    (output / MANIFEST_NAME).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return manifest, written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gera shards pré-normalizados por categoria.")
+    parser.add_argument("--output", type=Path, default=SHARDS_DIR, help="pasta de saída")
+    args = parser.parse_args()
+
+    manifest, written = build_shards(args.output)
+    total_words = sum(e["words"] for e in manifest["categories"])
+    total_bytes = sum((args.output / e["file"]).stat().st_size for e in manifest["categories"])
+    for e in manifest["categories"]:
+        print(f"  {e['file']:<24} {e['words']:>7,} palavras  (máx. {e['maxLength']} letras)")
+    print(f"\n  ✓ {len(manifest['categories'])} shards, {total_words:,} palavras, "
+          f"{total_bytes:,} bytes ({written} regravado(s)) → {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,46 +7,107 @@ Gera os dois bancos de palavras do Termo BR usando múltiplas fontes:
   ② conjugações  (todas as formas conjugadas de verbos PT-BR, 1 por linha)
   ③ verbos       (infinitivos, 1 por linha)
   ④ pt_BR.dic    (dicionário Hunspell do LibreOffice — fallback)
+     + pt_BR.aff    (regras de afixo: todas as flexões do .dic, ver
+                     hunspell_affix.py — entram no valid_N)
   ⑤ municipios-br, paises, estados-br  (nomes próprios, aceitos como válidos)
 
-Saída:
-  words_5.json   ← palavras-alvo (conhecidas, boa frequência / qualidade curada)
-  valid_5.json   ← dicionário completo (tudo aceito como palpite)
+Saída (para cada tamanho N pedido em --lengths, padrão 5):
+  words_N.json   ← palavras-alvo (conhecidas, boa frequência / qualidade curada)
+  valid_N.json   ← dicionário completo (tudo aceito como palpite)
 
 Critérios:
-  • words_5 (alvos): palavras bem conhecidas — ICF freq ≤ TARGET_FREQ_MAX,
+  • words_N (alvos): palavras bem conhecidas — ICF freq ≤ TARGET_FREQ_MAX,
     ou presentes no Hunspell, excluindo romanos e nomes-só-próprios.
-  • valid_5 (palpites): todas as fontes + plurais gerados + conjugações.
+  • valid_N (palpites): todas as fontes + plurais gerados + conjugações
+    + flexões do Hunspell.
+
+Cada fonte é lida uma única vez e distribuída por tamanho numa só passada;
+os plurais de N letras vêm de bases com N-1 e N-2 letras (regras compiladas
+em plural_rules.py, cada base expandida uma única vez).
+
+Com --format packed/both também grava words_N.bytes / valid_N.bytes:
+registros de N bytes ordenados, consultados por busca binária
+(ver packed_words.py). Com --dawg grava valid_N_dawg.bytes, o DAWG
+minimizado do dicionário para consultas por prefixo/padrão (ver word_dawg.py).
 
 Uso:
-  python scripts/data/build_termo.py
+  python scripts/data/build_termo.py [--lengths 4,5,6,7] [--jobs N] [--no-cache]
+                                     [--format json|packed|both] [--dawg] [--encoded]
+                                     [--rank [--max-repeats R] [--max-remaining X]
+                                             [--max-targets K]]
+                                     [--profile [arquivo.prof]] [--metrics-json arquivo.json]
+
+Com --encoded a álgebra de conjuntos de cada tamanho (valid_N, words_N,
+exclusivos) roda sobre arrays NumPy ordenados de palavras codificadas em
+inteiros de 5 bits por letra (ver word_codes.py): mesma saída, fração da
+memória dos set[str] — para builds grandes (muitos tamanhos, .aff).
+
+Com --rank os alvos são pontuados e podados (ver target_scoring.py) e
+words_N.json sai ordenado do mais fácil ao mais difícil. Só com --format
+json: o .bytes é sempre reordenado alfabeticamente (busca binária) e
+perderia a ordem.
+
+Métricas:
+  Cada etapa (leitura, buckets por fonte, bases dos plurais, montagem por
+  tamanho, ranking, gravação) é cronometrada (ver stage_metrics.py) e o
+  resumo sai no fim; --metrics-json grava duração, pico de memória, itens
+  e tamanhos dos conjuntos por etapa, e --profile liga cProfile +
+  tracemalloc.
+
+Cache:
+  O resultado de cada leitor fica em .cache/build_termo/, chaveado por
+  tamanho, mtime e SHA-256 da fonte; fontes inalteradas não são relidas.
 """
 
+import codecs
 import json
+import os
 import re
-import unicodedata
 import argparse
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import hunspell_affix
+import text_normalizer
+from hunspell_affix import expand_dictionary
+from packed_words import PACKED_SUFFIX, write_packed
+from plural_rules import PLURALS, implicit_bases, implicit_span
+from source_cache import cached_read, file_digest, rules_fingerprint
+from source_io import decode_lines
+from stage_metrics import StageMetrics, profiling
+from termo_paths import OUTPUT_DIR, REPO_ROOT, dawg_file, target_file, valid_file
+from text_normalizer import normalize
+from word_dawg import write_dawg
+
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = REPO_ROOT / "Data"
 
-OUTPUT_DIR = (
-    REPO_ROOT / "TermoBR" / "Termo" / "Assets" / "_Project" / "Resources" / "Data"
-)
-WORDS_TARGET_FILE = OUTPUT_DIR / "words_5.json"
-WORDS_VALID_FILE  = OUTPUT_DIR / "valid_5.json"
+# Word lengths built when --lengths is not given
+DEFAULT_LENGTHS = [5]
+
+# --format choices: JSON list, packed fixed-width records (.bytes), or both
+OUTPUT_FORMATS = ["json", "packed", "both"]
+
+# Parsed, normalized output of each source reader (see source_cache.py)
+CACHE_DIR = REPO_ROOT / ".cache" / "build_termo"
+
+# Default output of --profile (cProfile stats, open with pstats/snakeviz)
+PROFILE_FILE = REPO_ROOT / ".cache" / "profile" / "build_termo.prof"
+
+# Bump when a reader/parser below changes what it returns for the same input
+READER_VERSION = 2
 
 # Source files
 ICF_FILE        = DATA_DIR / "icf"
 CONJ_FILE       = DATA_DIR / "conjugações"
 VERBOS_FILE     = DATA_DIR / "verbos"
 DIC_FILE        = DATA_DIR / "pt_BR.dic"
+AFF_FILE        = DATA_DIR / "pt_BR.aff"
 MUNICIPIOS_FILE = DATA_DIR / "municipios-br"
 PAISES_FILE     = DATA_DIR / "paises"
 ESTADOS_FILE    = DATA_DIR / "estados-br"
@@ -55,9 +116,16 @@ ESTADOS_FILE    = DATA_DIR / "estados-br"
 # Words with freq <= this are considered "well-known" for targets.
 TARGET_FREQ_MAX = 18.0
 
+# Longest inflected form kept from the .aff expansion (bounds its memory;
+# raise it before building longer words)
+AFFIX_MAX_LENGTH = 10
+
 # Encodings to try for Hunspell .dic
 ENCODINGS = ["utf-8", "iso-8859-1", "latin-1"]
 
+# Prefix size used to sniff the encoding of a source (bytes)
+SNIFF_BYTES = 64 * 1024
+
 # Only uppercase A-Z after normalization
 VALID_CHARS = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
@@ -84,8 +152,7 @@ def _build_roman_set():
             while n >= v:
                 roman += s
                 n -= v
-        if len(roman) <= 5:
-            ROMAN_NUMERALS.add(roman)
+        ROMAN_NUMERALS.add(roman)
 
 
 _build_roman_set()
@@ -99,11 +166,6 @@ def is_roman(norm: str) -> bool:
 # Normalization
 # ---------------------------------------------------------------------------
 
-def normalize(word: str) -> str:
-    nfd = unicodedata.normalize("NFD", word)
-    return "".join(c for c in nfd if unicodedata.category(c) != "Mn").upper()
-
-
 def strip_flags(entry: str) -> str:
     return entry.split("/")[0].strip()
 
@@ -112,204 +174,472 @@ def is_pure(raw: str) -> bool:
     return bool(LETTERS_ONLY.match(raw))
 
 
-def is_valid_5(n: str) -> bool:
-    return len(n) == 5 and all(c in VALID_CHARS for c in n) and not is_roman(n)
-
-
 def is_valid_n(n: str, length: int) -> bool:
     return len(n) == length and all(c in VALID_CHARS for c in n)
 
 
 # ---------------------------------------------------------------------------
-# Plural expansion (4-letter base → 5-letter plural)
+# Plural expansion (N-1 / N-2 letter base → N-letter plural)
 # ---------------------------------------------------------------------------
 
-def expand_plurals(base: str) -> list[str]:
-    """Portuguese plural rules for a 4-letter normalized word → 5-letter forms."""
-    if len(base) != 4:
-        return []
-    cands: list[str] = []
-    if base.endswith(("AL", "EL", "OL", "UL")):
-        cands.append(base[:-1] + "IS")       # oral→orais
-    elif base.endswith("IL"):
-        cands.append(base[:-2] + "IS")        # funil→funis (but 4→4)
-        cands.append(base[:-2] + "EIS")       # fácil→fáceis
-    elif base.endswith(("EM", "AM", "OM", "UM", "IM")):
-        cands.append(base[:-1] + "NS")        # item→itens
-    elif base.endswith("AO"):
-        cands.append(base[:-2] + "OES")       # leão→leões
-        cands.append(base[:-2] + "AES")       # cão→cães
-        cands.append(base + "S")              # mão→mãos (MAOS)
-    elif base.endswith(("R", "Z", "S")):
-        cands.append(base + "ES")             # mar→mares (5 letters)
-    else:
-        cands.append(base + "S")              # gato→gatos
-    return [c for c in cands if len(c) == 5 and all(x in VALID_CHARS for x in c)]
+def expand_plurals(base: str, length: int = 5) -> list[str]:
+    """Portuguese plural rules for a normalized singular → forms with `length` letters.
+
+    Bases one letter short take the +S family (gato→gatos, oral→orais);
+    bases two letters short take +ES (mar→mares). See plural_rules.py.
+    """
+    return PLURALS.expand(base, length)
+
+
+def base_lengths_for(lengths: list[int]) -> set[int]:
+    """Singular lengths whose plurals can reach any of `lengths`."""
+    return PLURALS.base_lengths(lengths)
 
 
 # ---------------------------------------------------------------------------
 # Source readers
 # ---------------------------------------------------------------------------
 
-def read_icf(path: Path) -> dict[str, float]:
-    """Returns {normalized_word: frequency}. Lower freq = more common."""
-    result: dict[str, float] = {}
-    if not path.exists():
-        return result
-    with path.open(encoding="utf-8") as f:
-        for line in f:
-            parts = line.strip().split(",")
-            if len(parts) < 2:
-                continue
-            raw = parts[0]
-            if not is_pure(raw):
-                continue
-            n = normalize(raw)
-            if all(c in VALID_CHARS for c in n):
-                freq = float(parts[1])
-                if n not in result or freq < result[n]:
-                    result[n] = freq
-    return result
-
-
-def read_wordlist(path: Path) -> set[str]:
-    """Reads a file with one word per line, returns set of ALL normalized words."""
-    words: set[str] = set()
-    if not path.exists():
-        return words
-    text = None
+def detect_encoding(path: Path) -> str | None:
+    """Detects the source encoding from a prefix of the file (SNIFF_BYTES)."""
+    with path.open("rb") as f:
+        prefix = f.read(SNIFF_BYTES)
     for enc in ENCODINGS:
+        decoder = codecs.getincrementaldecoder(enc)(errors="strict")
         try:
-            text = path.read_text(encoding=enc, errors="strict")
-            break
+            # final=False: a multibyte char cut at the prefix boundary is not an error
+            decoder.decode(prefix, final=False)
+            return enc
         except (UnicodeDecodeError, ValueError):
             continue
-    if text is None:
-        print(f"  ⚠ Não foi possível ler {path}")
-        return words
+    return None
+
 
-    for line in text.splitlines():
-        raw = strip_flags(line).strip()
-        if not raw or raw[0].isdigit():
+def iter_lines(path: Path) -> Iterator[str]:
+    """Streams the lines of a source, one at a time, in the sniffed encoding.
+
+    Decoding is strict: a line past the sniffed prefix that does not decode
+    is read with the next entries of ENCODINGS (and counted in a warning)
+    instead of being lost.
+    """
+    if not path.exists():
+        return
+    enc = detect_encoding(path)
+    if enc is None:
+        print(f"  ⚠ Não foi possível ler {path}")
+        return
+    with path.open("rb") as f:
+        yield from decode_lines(f, ENCODINGS[ENCODINGS.index(enc):], path.name)
+
+
+def iter_entries(
+    path: Path, parse: Callable[[str], tuple[str, str] | None]
+) -> Iterator[tuple[str, str, str]]:
+    """Yields (normalized_word, raw_word, extra) for every accepted line of a source.
+
+    `parse` turns a raw line into (raw_word, extra) or None to skip it;
+    words with non-letters or that normalize outside VALID_CHARS are dropped.
+    """
+    for line in iter_lines(path):
+        entry = parse(line)
+        if entry is None:
             continue
+        raw, extra = entry
         if not is_pure(raw):
             continue
         n = normalize(raw)
         if all(c in VALID_CHARS for c in n):
-            words.add(n)
-    return words
+            yield n, raw, extra
 
 
-def read_names(path: Path) -> set[str]:
-    """Reads names — only single-word entries without spaces/hyphens."""
-    names: set[str] = set()
-    if not path.exists():
-        return names
-    with path.open(encoding="utf-8") as f:
-        for line in f:
-            raw = line.strip()
-            if not raw or " " in raw or "'" in raw or "-" in raw:
-                continue
-            if not is_pure(raw):
+def iter_words(
+    path: Path, parse: Callable[[str], tuple[str, str] | None]
+) -> Iterator[tuple[str, str]]:
+    """Yields (normalized_word, extra) for every accepted line of a source."""
+    for n, _, extra in iter_entries(path, parse):
+        yield n, extra
+
+
+def _parse_icf(line: str) -> tuple[str, str] | None:
+    parts = line.strip().split(",")
+    if len(parts) < 2:
+        return None
+    return parts[0], parts[1]
+
+
+def _parse_wordlist(line: str) -> tuple[str, str] | None:
+    raw = strip_flags(line).strip()
+    if not raw or raw[0].isdigit():
+        return None
+    return raw, ""
+
+
+def _parse_name(line: str) -> tuple[str, str] | None:
+    raw = line.strip()
+    if not raw or " " in raw or "'" in raw or "-" in raw:
+        return None
+    return raw, ""
+
+
+def read_icf(path: Path) -> dict[str, float]:
+    """Returns {normalized_word: frequency}. Lower freq = more common."""
+    result: dict[str, float] = {}
+    for n, value in iter_words(path, _parse_icf):
+        freq = float(value)
+        if n not in result or freq < result[n]:
+            result[n] = freq
+    return result
+
+
+def read_wordlist(path: Path) -> set[str]:
+    """Reads a file with one word per line, returns set of ALL normalized words."""
+    return {n for n, _ in iter_words(path, _parse_wordlist)}
+
+
+def iter_affix_forms(path: Path) -> Iterator[tuple[str, str]]:
+    """Yields (normalized_form, raw_form) for every inflected form of a Hunspell
+    .dic, expanded with the .aff next to it (nothing when either is missing).
+
+    Forms longer than AFFIX_MAX_LENGTH are dropped while streaming.
+    """
+    aff = path.with_suffix(".aff")
+    if not (path.exists() and aff.exists()):
+        return
+    for forms in expand_dictionary(aff, path):
+        for raw in forms:
+            # Cheap pre-filter: normalizing only ever shortens a word
+            if len(raw) > 2 * AFFIX_MAX_LENGTH or not is_pure(raw):
                 continue
             n = normalize(raw)
-            if all(c in VALID_CHARS for c in n):
-                names.add(n)
-    return names
+            if len(n) <= AFFIX_MAX_LENGTH and VALID_CHARS.issuperset(n):
+                yield n, raw
+
+
+def read_affix_forms(path: Path) -> set[str]:
+    """Every inflected form of a Hunspell .dic (see iter_affix_forms); only
+    the kept forms are ever held in memory.
+    """
+    return {n for n, _ in iter_affix_forms(path)}
+
+
+def read_names(path: Path) -> set[str]:
+    """Reads names — only single-word entries without spaces/hyphens."""
+    return {n for n, _ in iter_words(path, _parse_name)}
 
 
 # ---------------------------------------------------------------------------
 # Main build
 # ---------------------------------------------------------------------------
 
-def build_sets() -> tuple[list[str], list[str]]:
-    # ── 1. Read all sources ──────────────────────────────────────────
+# Independent source readers: {key: (reader, path)}. build_sets runs them
+# sequentially or in a process pool (--jobs) and merges the results.
+SOURCES: dict[str, tuple[Callable[[Path], dict[str, float] | set[str]], Path]] = {
+    "icf":        (read_icf, ICF_FILE),
+    "conj":       (read_wordlist, CONJ_FILE),
+    "verbos":     (read_wordlist, VERBOS_FILE),
+    "dic":        (read_wordlist, DIC_FILE),
+    "affix":      (read_affix_forms, DIC_FILE),
+    "municipios": (read_names, MUNICIPIOS_FILE),
+    "paises":     (read_names, PAISES_FILE),
+    "estados":    (read_names, ESTADOS_FILE),
+}
+
+
+# Line parser of each plain-text source in SOURCES ("affix" expands the .dic)
+LINE_PARSERS: dict[str, Callable[[str], tuple[str, str] | None]] = {
+    "icf":        _parse_icf,
+    "conj":       _parse_wordlist,
+    "verbos":     _parse_wordlist,
+    "dic":        _parse_wordlist,
+    "municipios": _parse_name,
+    "paises":     _parse_name,
+    "estados":    _parse_name,
+}
+
+
+def iter_source(key: str) -> Iterator[tuple[str, str, str]]:
+    """(normalized, raw word, extra) of every accepted entry of a SOURCES key,
+    uncached and in file order — for tools that need the original spelling.
+    """
+    _, path = SOURCES[key]
+    if key == "affix":
+        for n, raw in iter_affix_forms(path):
+            yield n, raw, ""
+    else:
+        yield from iter_entries(path, LINE_PARSERS[key])
+
+
+# Files besides the source path a reader depends on
+SOURCE_EXTRAS: dict[str, list[Path]] = {
+    "affix": [AFF_FILE],
+}
+
+
+def reader_fingerprint(key: str | None = None) -> str:
+    """Everything besides the source bytes that changes a reader's output."""
+    extras = [
+        file_digest(path) if path.exists() else f"{path.name}: ausente"
+        for path in SOURCE_EXTRAS.get(key, [])
+    ]
+    return rules_fingerprint([
+        f"readers={READER_VERSION}",
+        "".join(sorted(VALID_CHARS)),
+        LETTERS_ONLY.pattern,
+        f"affix_max={AFFIX_MAX_LENGTH}",
+        Path(text_normalizer.__file__).read_bytes(),
+        Path(hunspell_affix.__file__).read_bytes(),
+        *extras,
+    ])
+
+
+def read_source(key: str, use_cache: bool = True) -> tuple[dict[str, float] | set[str], bool]:
+    """Runs one reader from SOURCES. Returns (result, cache_hit)."""
+    reader, path = SOURCES[key]
+    if not use_cache:
+        return reader(path), False
+    return cached_read(CACHE_DIR, key, path, reader_fingerprint(key), reader)
+
+
+def read_sources(jobs: int = 1, use_cache: bool = True) -> dict[str, dict[str, float] | set[str]]:
+    """Runs every reader in SOURCES, using up to `jobs` worker processes."""
+    if jobs <= 1:
+        results = {key: read_source(key, use_cache) for key in SOURCES}
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(SOURCES))) as pool:
+            futures = {key: pool.submit(read_source, key, use_cache) for key in SOURCES}
+            results = {key: future.result() for key, future in futures.items()}
+
+    if use_cache:
+        hits = [key for key, (_, hit) in results.items() if hit]
+        print(f"  Cache: {len(hits)}/{len(SOURCES)} fontes reaproveitadas {hits if hits else ''}".rstrip())
+    return {key: result for key, (result, _) in results.items()}
+
+
+def bucket_by_length(words, lengths: set[int]) -> dict[int, set[str]]:
+    """Single pass over `words`, grouping the ones whose length is in `lengths`."""
+    buckets: dict[int, set[str]] = {n: set() for n in lengths}
+    for w in words:
+        bucket = buckets.get(len(w))
+        if bucket is not None:
+            bucket.add(w)
+    return buckets
+
+
+def _fmt_lengths(buckets: dict[int, set[str]], lengths) -> str:
+    return "  |  ".join(f"{n}-letras: {len(buckets[n]):,}" for n in sorted(lengths))
+
+
+def build_sets(
+    jobs: int = 1,
+    use_cache: bool = True,
+    lengths: list[int] | None = None,
+    ranking=None,
+    metrics: StageMetrics | None = None,
+    encoded: bool = False,
+) -> dict[int, tuple[list[str], list[str]]]:
+    """Builds (targets, valid) for every requested word length.
+
+    With `ranking` (target_scoring.RankCutoffs) the targets are scored,
+    pruned and returned from easiest to hardest instead of alphabetically.
+    With `encoded` the per-length set algebra runs on integer-coded NumPy
+    arrays (build_length_encoded). Each stage is timed into `metrics` when
+    given.
+    """
+    metrics = metrics or StageMetrics("build_termo")
+    print(f"  Lendo {len(SOURCES)} fontes ({jobs} processo(s))...")
+    with metrics.stage("read_sources") as st:
+        sources = read_sources(jobs, use_cache)
+        st.items_out = sum(len(words) for words in sources.values())
+        st.sizes = {key: len(words) for key, words in sources.items()}
+    return assemble_sets(sources, lengths, ranking, metrics, encoded)
+
+
+def _bucket_stage(metrics: StageMetrics, name: str, words, lengths) -> dict[int, set[str]]:
+    with metrics.stage(name) as st:
+        buckets = bucket_by_length(words, set(lengths))
+        st.items_in = len(words)
+        st.items_out = sum(len(b) for b in buckets.values())
+        st.sizes = {str(n): len(b) for n, b in sorted(buckets.items())}
+    return buckets
+
+
+def assemble_sets(
+    sources: dict[str, dict[str, float] | set[str]],
+    lengths: list[int] | None = None,
+    ranking=None,
+    metrics: StageMetrics | None = None,
+    encoded: bool = False,
+) -> dict[int, tuple[list[str], list[str]]]:
+    """build_sets from already-read sources (keys of SOURCES)."""
+    metrics = metrics or StageMetrics("build_termo")
+    lengths = sorted(set(lengths or DEFAULT_LENGTHS))
+    base_lengths = base_lengths_for(lengths)
+    all_lengths = set(lengths) | base_lengths
+    # ICF and Hunspell also feed the implicit bases (longer words)
+    base_sources = all_lengths | implicit_span(base_lengths)
+
+    # ── 1. Bucket every source by length (single pass) ───────────────
 
     print("  [1/6] Lendo ICF (corpus de frequência)...")
-    icf = read_icf(ICF_FILE)
-    icf_5 = {w for w in icf if is_valid_5(w)}
-    icf_4 = {w for w in icf if is_valid_n(w, 4)}
-    print(f"         ICF total: {len(icf):,}  |  5-letras: {len(icf_5):,}  |  4-letras: {len(icf_4):,}")
+    icf = sources["icf"]
+    icf_by = _bucket_stage(metrics, "icf", icf, base_sources)
+    print(f"         ICF total: {len(icf):,}  |  {_fmt_lengths(icf_by, all_lengths)}")
 
     print("  [2/6] Lendo conjugações...")
-    conj_all = read_wordlist(CONJ_FILE)
-    conj_5 = {w for w in conj_all if is_valid_5(w)}
-    print(f"         Conjugações total: {len(conj_all):,}  |  5-letras: {len(conj_5):,}")
+    conj_all = sources["conj"]
+    conj_by = _bucket_stage(metrics, "conj", conj_all, lengths)
+    print(f"         Conjugações total: {len(conj_all):,}  |  {_fmt_lengths(conj_by, lengths)}")
 
     print("  [3/6] Lendo verbos (infinitivos)...")
-    verbos_all = read_wordlist(VERBOS_FILE)
-    verbos_5 = {w for w in verbos_all if is_valid_5(w)}
-    print(f"         Verbos total: {len(verbos_all):,}  |  5-letras: {len(verbos_5):,}")
+    verbos_all = sources["verbos"]
+    verbos_by = _bucket_stage(metrics, "verbos", verbos_all, lengths)
+    print(f"         Verbos total: {len(verbos_all):,}  |  {_fmt_lengths(verbos_by, lengths)}")
 
     print("  [4/6] Lendo pt_BR.dic (Hunspell)...")
-    dic_all = read_wordlist(DIC_FILE)
-    dic_5 = {w for w in dic_all if is_valid_5(w)}
-    dic_4 = {w for w in dic_all if is_valid_n(w, 4)}
-    print(f"         Hunspell total: {len(dic_all):,}  |  5-letras: {len(dic_5):,}  |  4-letras: {len(dic_4):,}")
+    dic_all = sources["dic"]
+    dic_by = _bucket_stage(metrics, "dic", dic_all, base_sources)
+    print(f"         Hunspell total: {len(dic_all):,}  |  {_fmt_lengths(dic_by, all_lengths)}")
+    affix_all = sources["affix"]
+    affix_by = _bucket_stage(metrics, "affix", affix_all, lengths)
+    print(f"         Flexões (.aff): {len(affix_all):,}  |  {_fmt_lengths(affix_by, lengths)}")
+    if lengths[-1] > AFFIX_MAX_LENGTH:
+        print(f"         ⚠ flexões limitadas a {AFFIX_MAX_LENGTH} letras (AFFIX_MAX_LENGTH)")
 
     print("  [5/6] Lendo nomes (municípios, países, estados)...")
-    names = set()
-    for p in [MUNICIPIOS_FILE, PAISES_FILE, ESTADOS_FILE]:
-        n = read_names(p)
-        names |= n
-    names_5 = {w for w in names if is_valid_5(w)}
-    print(f"         Nomes 5-letras: {len(names_5):,}")
+    names = sources["municipios"] | sources["paises"] | sources["estados"]
+    names_by = _bucket_stage(metrics, "names", names, lengths)
+    print(f"         Nomes: {_fmt_lengths(names_by, lengths)}")
 
-    # ── 2. Generate plurals from all 4-letter bases ──────────────────
+    # ── 2. Singular bases for the plurals (explicit + implicit) ──────
 
     print("  [6/6] Gerando plurais...")
-    all_bases_4 = icf_4 | dic_4
-    # Also extract implicit 4-letter bases from longer words
-    for w in icf:
-        if len(w) >= 5 and len(w) <= 8 and w[3] in "AEIOU":
-            all_bases_4.add(w[:4])
-    for w in dic_all:
-        if len(w) >= 5 and len(w) <= 8 and w[3] in "AEIOU":
-            all_bases_4.add(w[:4])
-
-    plurals: set[str] = set()
-    for base in all_bases_4:
-        for p in expand_plurals(base):
-            if not is_roman(p):
-                plurals.add(p)
-    print(f"         Bases de 4 letras: {len(all_bases_4):,}  |  Plurais gerados: {len(plurals):,}")
-
-    # ── 3. Build valid_5 (all accepted guesses) ─────────────────────
-
-    valid_set = icf_5 | conj_5 | dic_5 | names_5 | plurals | verbos_5
+    with metrics.stage("plural_bases") as st:
+        bases = {b: icf_by[b] | dic_by[b] for b in base_lengths}
+        for found in (implicit_bases(icf_by, base_lengths), implicit_bases(dic_by, base_lengths)):
+            for b, implicit in found.items():
+                bases[b] |= implicit
+        st.items_in = sum(len(icf_by[size]) + len(dic_by[size]) for size in base_sources)
+        st.items_out = sum(len(b) for b in bases.values())
+        st.sizes = {str(b): len(found) for b, found in sorted(bases.items())}
+    print(f"         Bases: {_fmt_lengths(bases, base_lengths)}")
+
+    def no_roman(words: set[str]) -> set[str]:
+        return {w for w in words if not is_roman(w)}
+
+    if encoded:
+        # build_length_encoded drops roman numerals itself, as one vectorized mask
+        prepare, build = (lambda words: words), build_length_encoded
+    else:
+        prepare, build = no_roman, build_length
+
+    results: dict[int, tuple[list[str], list[str]]] = {}
+    for n in lengths:
+        with metrics.stage(f"length_{n}") as st:
+            inputs = {
+                "icf": prepare(icf_by[n]),
+                "conj": prepare(conj_by[n]),
+                "dic": prepare(dic_by[n]),
+                "affix": prepare(affix_by[n]),
+                "verbos": prepare(verbos_by[n]),
+                "names": prepare(names_by[n]),
+            }
+            results[n] = build(
+                n, icf, bases,
+                icf_n=inputs["icf"],
+                conj_n=inputs["conj"],
+                dic_n=inputs["dic"],
+                affix_n=inputs["affix"],
+                verbos_n=inputs["verbos"],
+                names_n=inputs["names"],
+            )
+            targets, valid = results[n]
+            st.items_in = sum(len(words) for words in inputs.values())
+            st.items_out = len(valid)
+            st.sizes = {key: len(words) for key, words in inputs.items()}
+            st.sizes |= {"targets": len(targets), "valid": len(valid)}
+        if ranking is not None:
+            with metrics.stage(f"rank_{n}") as st:
+                ranked = rank_stage(n, *results[n], icf, ranking)
+                st.items_in, st.items_out = len(results[n][0]), len(ranked)
+            results[n] = (ranked, results[n][1])
+    return results
+
+
+def rank_stage(
+    n: int, targets: list[str], valid: list[str], icf: dict[str, float], cutoffs
+) -> list[str]:
+    """Scores the N-letter targets and applies the cut-offs (needs NumPy)."""
+    from target_scoring import rank_targets, report_file, score_targets, write_report
+
+    print()
+    print(f"  ── Ranking de alvos ({n} letras) ─────────────")
+    scores = score_targets(targets, valid, icf, n)
+    ranked = rank_targets(scores, cutoffs)
+    write_report(report_file(n), scores)
+    print(f"  Melhor abertura           : {scores.opener} "
+          f"(restam {scores.opener_expected:,.1f} em média)")
+    print(f"  Alvos mantidos            : {len(ranked):>7,} de {len(targets):,}")
+    print(f"  Relatório                 : {report_file(n)}")
+    return ranked
+
+
+def build_length(
+    n: int,
+    icf: dict[str, float],
+    bases: dict[int, set[str]],
+    icf_n: set[str],
+    conj_n: set[str],
+    dic_n: set[str],
+    affix_n: set[str],
+    verbos_n: set[str],
+    names_n: set[str],
+) -> tuple[list[str], list[str]]:
+    """Selects targets and valid guesses of `n` letters from the bucketed sources."""
+
+    # ── 2. Generate plurals from the N-1 / N-2 letter bases ──────────
+
+    plural_bases = set().union(*(bases.get(b, set()) for b in base_lengths_for([n])))
+    # {base: its n-letter plurals}, each base expanded once (memoized in PLURALS)
+    expansions = {
+        base: [p for p in forms if not is_roman(p)]
+        for base, forms in PLURALS.plurals(plural_bases, n).items()
+    }
+    plurals = {p for forms in expansions.values() for p in forms}
+
+    # ── 3. Build valid_N (all accepted guesses) ─────────────────────
+
+    valid_set = icf_n | conj_n | dic_n | affix_n | names_n | plurals | verbos_n
     valid_set = {w for w in valid_set if not is_roman(w)}
 
-    # ── 4. Build words_5 (target words — curated quality) ───────────
+    # ── 4. Build words_N (target words — curated quality) ───────────
 
     target_set: set[str] = set()
 
     # 4a. ICF words with good frequency (well-known)
-    icf_targets = {w for w in icf_5 if icf[w] <= TARGET_FREQ_MAX}
+    icf_targets = {w for w in icf_n if icf[w] <= TARGET_FREQ_MAX}
     target_set |= icf_targets
 
-    # 4b. Hunspell 5-letter words (already curated by dictionary maintainers)
-    target_set |= dic_5
+    # 4b. Hunspell N-letter words (already curated by dictionary maintainers)
+    target_set |= dic_n
 
-    # 4c. 5-letter infinitives from verbos list
-    target_set |= verbos_5
+    # 4c. N-letter infinitives from verbos list
+    target_set |= verbos_n
 
     # 4d. Plurals: confirmed by ICF directly, OR whose singular base is in ICF
     icf_confirmed_plurals = plurals & set(icf.keys())
-    # Also: if the 4-letter base is in ICF with good freq, accept the plural as target
+    # Also: if the base is in ICF with good freq, accept the plural as target
     base_confirmed_plurals: set[str] = set()
-    for base in all_bases_4:
+    for base, forms in expansions.items():
         if base in icf and icf[base] <= TARGET_FREQ_MAX:
-            for p in expand_plurals(base):
-                if not is_roman(p):
-                    base_confirmed_plurals.add(p)
+            base_confirmed_plurals.update(forms)
     target_set |= icf_confirmed_plurals | base_confirmed_plurals
 
     # 4e. Conjugations that are confirmed by ICF with good frequency
-    icf_confirmed_conj = {w for w in conj_5 if w in icf and icf[w] <= TARGET_FREQ_MAX}
+    icf_confirmed_conj = {w for w in conj_n if w in icf and icf[w] <= TARGET_FREQ_MAX}
     target_set |= icf_confirmed_conj
 
     # 4f. Exclude names that are ONLY proper nouns (not common words)
-    proper_only = names_5 - icf_5 - dic_5
+    proper_only = names_n - icf_n - dic_n
     target_set -= proper_only
 
     # 4e. Final roman filter
@@ -320,29 +650,121 @@ def build_sets() -> tuple[list[str], list[str]]:
 
     # ── 5. Stats ─────────────────────────────────────────────────────
 
-    only_icf  = icf_5 - dic_5 - conj_5 - plurals
-    only_dic  = dic_5 - icf_5 - conj_5 - plurals
-    only_conj = conj_5 - icf_5 - dic_5 - plurals
-    only_plur = plurals - icf_5 - dic_5 - conj_5
+    print_summary(n, {
+        "icf": len(icf_n), "conj": len(conj_n), "dic": len(dic_n), "affix": len(affix_n),
+        "verbos": len(verbos_n), "names": len(names_n), "plurals": len(plurals),
+        "only_icf": len(icf_n - dic_n - conj_n - plurals),
+        "only_dic": len(dic_n - icf_n - conj_n - plurals),
+        "only_conj": len(conj_n - icf_n - dic_n - plurals),
+        "only_plur": len(plurals - icf_n - dic_n - conj_n),
+        "only_aff": len(affix_n - icf_n - dic_n - conj_n - plurals),
+        "valid": len(valid_set), "targets": len(target_set),
+    })
+
+    return sorted(target_set), sorted(valid_set)
+
+
+def build_length_encoded(
+    n: int,
+    icf: dict[str, float],
+    bases: dict[int, set[str]],
+    icf_n: set[str],
+    conj_n: set[str],
+    dic_n: set[str],
+    affix_n: set[str],
+    verbos_n: set[str],
+    names_n: set[str],
+) -> tuple[list[str], list[str]]:
+    """build_length over integer-coded NumPy arrays (see word_codes.py).
+
+    Same selection and output; the roman filter is applied here as one
+    vectorized mask, so the buckets may still contain roman numerals.
+    """
+    import numpy as np
+
+    from word_codes import contains, decode_words, difference, encode_words, intersect, union
+
+    romans = encode_words((r for r in ROMAN_NUMERALS if len(r) == n), n)
+
+    def encode(words) -> np.ndarray:
+        return difference(encode_words(words, n), romans)
+
+    # ── 2. Generate plurals from the N-1 / N-2 letter bases ──────────
+
+    plural_bases = set().union(*(bases.get(b, set()) for b in base_lengths_for([n])))
+    expansions = PLURALS.plurals(plural_bases, n)
+    plurals = encode(p for forms in expansions.values() for p in forms)
+    base_confirmed_plurals = encode(
+        p
+        for base, forms in expansions.items()
+        if base in icf and icf[base] <= TARGET_FREQ_MAX
+        for p in forms
+    )
+
+    icf_words = sorted(icf_n)
+    icf_codes = encode_words(icf_words, n)
+    icf_freqs = np.fromiter((icf[w] for w in icf_words), dtype=np.float64, count=len(icf_words))
+    keep = ~contains(icf_codes, romans)
+    icf_codes, icf_freqs = icf_codes[keep], icf_freqs[keep]
+    icf_good = icf_codes[icf_freqs <= TARGET_FREQ_MAX]
+
+    conj_c, dic_c, affix_c = encode(conj_n), encode(dic_n), encode(affix_n)
+    verbos_c, names_c = encode(verbos_n), encode(names_n)
+
+    # ── 3. Build valid_N (all accepted guesses) ─────────────────────
+
+    valid = union(icf_codes, conj_c, dic_c, affix_c, names_c, plurals, verbos_c)
+
+    # ── 4. Build words_N (target words — curated quality) ───────────
 
+    target = union(
+        icf_good,                         # 4a. well-known ICF words
+        dic_c,                            # 4b. Hunspell
+        verbos_c,                         # 4c. infinitives
+        intersect(plurals, icf_codes),    # 4d. plurals confirmed by ICF …
+        base_confirmed_plurals,           #     … or by their singular base
+        intersect(conj_c, icf_good),      # 4e. conjugations confirmed by ICF
+    )
+    # 4f. Exclude names that are ONLY proper nouns; all targets are valid
+    target = difference(target, difference(names_c, icf_codes, dic_c))
+    valid = union(valid, target)
+
+    # ── 5. Stats ─────────────────────────────────────────────────────
+
+    print_summary(n, {
+        "icf": len(icf_codes), "conj": len(conj_c), "dic": len(dic_c), "affix": len(affix_c),
+        "verbos": len(verbos_c), "names": len(names_c), "plurals": len(plurals),
+        "only_icf": len(difference(icf_codes, union(dic_c, conj_c, plurals))),
+        "only_dic": len(difference(dic_c, union(icf_codes, conj_c, plurals))),
+        "only_conj": len(difference(conj_c, union(icf_codes, dic_c, plurals))),
+        "only_plur": len(difference(plurals, union(icf_codes, dic_c, conj_c))),
+        "only_aff": len(difference(affix_c, union(icf_codes, dic_c, conj_c, plurals))),
+        "valid": len(valid), "targets": len(target),
+    })
+
+    return decode_words(target, n), decode_words(valid, n)
+
+
+def print_summary(n: int, counts: dict[str, int]) -> None:
+    """Per-source, exclusive and total counts of one word length."""
     print()
-    print(f"  ── Resumo ──────────────────────────────────")
-    print(f"  ICF 5-letras              : {len(icf_5):>7,}")
-    print(f"  Conjugações 5-letras      : {len(conj_5):>7,}")
-    print(f"  Hunspell 5-letras         : {len(dic_5):>7,}")
-    print(f"  Verbos 5-letras           : {len(verbos_5):>7,}")
-    print(f"  Nomes 5-letras            : {len(names_5):>7,}")
-    print(f"  Plurais gerados           : {len(plurals):>7,}")
+    print(f"  ── Resumo ({n} letras) ─────────────────────")
+    print(f"  ICF                       : {counts['icf']:>7,}")
+    print(f"  Conjugações               : {counts['conj']:>7,}")
+    print(f"  Hunspell                  : {counts['dic']:>7,}")
+    print(f"  Flexões Hunspell (.aff)   : {counts['affix']:>7,}")
+    print(f"  Verbos                    : {counts['verbos']:>7,}")
+    print(f"  Nomes                     : {counts['names']:>7,}")
+    print(f"  Plurais gerados           : {counts['plurals']:>7,}")
     print(f"  ─────────────────────────────────────────────")
-    print(f"  Exclusivos ICF            : {len(only_icf):>7,}")
-    print(f"  Exclusivos Hunspell       : {len(only_dic):>7,}")
-    print(f"  Exclusivos Conjugações    : {len(only_conj):>7,}")
-    print(f"  Exclusivos Plurais        : {len(only_plur):>7,}")
+    print(f"  Exclusivos ICF            : {counts['only_icf']:>7,}")
+    print(f"  Exclusivos Hunspell       : {counts['only_dic']:>7,}")
+    print(f"  Exclusivos Conjugações    : {counts['only_conj']:>7,}")
+    print(f"  Exclusivos Plurais        : {counts['only_plur']:>7,}")
+    print(f"  Exclusivos Flexões        : {counts['only_aff']:>7,}")
     print(f"  ─────────────────────────────────────────────")
-    print(f"  Total valid_5             : {len(valid_set):>7,}")
-    print(f"  Total words_5 (alvos)     : {len(target_set):>7,}")
-
-    return sorted(target_set), sorted(valid_set)
+    print(f"  Total valid_{n}             : {counts['valid']:>7,}")
+    print(f"  Total words_{n} (alvos)     : {counts['targets']:>7,}")
 
 
 def write_json(path: Path, words: list[str]) -> None:
@@ -353,6 +775,40 @@ def write_json(path: Path, words: list[str]) -> None:
     )
 
 
+def write_outputs(
+    results: dict[int, tuple[list[str], list[str]]],
+    fmt: str,
+    dawg: bool,
+    metrics: StageMetrics,
+) -> None:
+    """Writes words_N / valid_N in `fmt` (OUTPUT_FORMATS), plus the DAWG."""
+    for n, (targets, valid) in results.items():
+        with metrics.stage(f"write_{n}") as st:
+            for kind, path, words in (
+                ("palavras-alvo", target_file(n), targets),
+                ("dicionário completo", valid_file(n), valid),
+            ):
+                if fmt in ("json", "both"):
+                    print(f"→ Gravando {path.name} ({kind})...")
+                    write_json(path, words)
+                    print(f"  {path}")
+                if fmt in ("packed", "both"):
+                    packed = path.with_suffix(PACKED_SUFFIX)
+                    print(f"→ Gravando {packed.name} ({kind}, {n} bytes/palavra)...")
+                    write_packed(packed, words, n)
+                    print(f"  {packed}")
+            st.items_in = st.items_out = len(targets) + len(valid)
+
+        if dawg:
+            with metrics.stage(f"dawg_{n}") as st:
+                dawg_path = dawg_file(n)
+                print(f"→ Gravando {dawg_path.name} (DAWG do dicionário)...")
+                write_dawg(dawg_path, valid)
+                print(f"  {dawg_path}")
+                st.items_in = len(valid)
+                st.sizes = {"bytes": dawg_path.stat().st_size}
+
+
 # ---------------------------------------------------------------------------
 # Verification
 # ---------------------------------------------------------------------------
@@ -424,34 +880,121 @@ def verify(targets: list[str], valid: list[str]):
 # Main
 # ---------------------------------------------------------------------------
 
+def parse_lengths(text: str) -> list[int]:
+    """Parses "4,5,6,7" for --lengths."""
+    try:
+        lengths = sorted({int(part) for part in text.split(",") if part.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tamanhos inválidos: {text!r}")
+    if not lengths or lengths[0] < 3:
+        raise argparse.ArgumentTypeError("tamanhos devem ser ≥ 3")
+    return lengths
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Gera bancos de palavras para o Termo BR.")
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="N",
+        help="processos para ler as fontes em paralelo (0 = todos os núcleos; padrão: 1)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"ignora o cache de fontes processadas ({CACHE_DIR.relative_to(REPO_ROOT)})",
+    )
+    parser.add_argument(
+        "--lengths", type=parse_lengths, default=DEFAULT_LENGTHS, metavar="4,5,6,7",
+        help="tamanhos de palavra a gerar, separados por vírgula (padrão: 5)",
+    )
+    parser.add_argument(
+        "--format", choices=OUTPUT_FORMATS, default="json",
+        help="formato de saída: json (padrão), packed (.bytes) ou both",
+    )
+    parser.add_argument(
+        "--dawg", action="store_true",
+        help="também grava valid_N_dawg.bytes (DAWG minimizado do dicionário)",
+    )
+    parser.add_argument(
+        "--encoded", action="store_true",
+        help="monta os conjuntos de cada tamanho como arrays NumPy de palavras codificadas "
+             "em inteiros (5 bits por letra) — menos memória e álgebra de conjuntos "
+             "vetorizada em builds grandes; mesma saída",
+    )
+    parser.add_argument(
+        "--rank", action="store_true",
+        help="pontua os alvos (ICF, restantes após a melhor abertura, letras repetidas), "
+             "aplica os cortes abaixo e grava words_N do mais fácil ao mais difícil (NumPy); "
+             "só com --format json — o .bytes é ordenado alfabeticamente",
+    )
+    parser.add_argument("--max-repeats", type=int, metavar="R",
+                        help="com --rank: descarta alvos com mais de R letras repetidas")
+    parser.add_argument("--max-remaining", type=int, metavar="X",
+                        help="com --rank: descarta alvos que deixam mais de X candidatos "
+                             "após a melhor abertura")
+    parser.add_argument("--max-targets", type=int, metavar="K",
+                        help="com --rank: mantém só os K alvos mais fáceis")
+    parser.add_argument(
+        "--profile", nargs="?", type=Path, const=PROFILE_FILE, metavar="ARQUIVO",
+        help="roda sob cProfile + tracemalloc, imprime as funções/linhas mais caras e grava "
+             f"o perfil (padrão: {PROFILE_FILE.relative_to(REPO_ROOT)}; só o processo principal)",
+    )
+    parser.add_argument(
+        "--metrics-json", type=Path, metavar="ARQUIVO",
+        help="grava duração, pico de memória, itens e tamanhos de cada etapa em JSON",
+    )
     args = parser.parse_args()
+    if args.rank and args.format != "json":
+        parser.error("--rank exige --format json (words_N.bytes é ordenado alfabeticamente "
+                     "e perderia a ordem de dificuldade)")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     print(f"\n{'='*60}")
     print(f"  build_termo.py — Banco de palavras Termo BR (v2)")
     print(f"{'='*60}")
     print(f"  Fontes   : ICF, conjugações, verbos, pt_BR.dic")
     print(f"             municípios, países, estados")
+    print(f"  Tamanhos : {', '.join(map(str, args.lengths))}")
     print(f"  Saída    : {OUTPUT_DIR}")
     print()
 
-    targets, valid = build_sets()
-    print()
-
-    print("→ Gravando words_5.json (palavras-alvo)...")
-    write_json(WORDS_TARGET_FILE, targets)
-    print(f"  {WORDS_TARGET_FILE}")
-
-    print("→ Gravando valid_5.json (dicionário completo)...")
-    write_json(WORDS_VALID_FILE, valid)
-    print(f"  {WORDS_VALID_FILE}")
-
-    verify(targets, valid)
-
+    ranking = None
+    if args.rank:
+        from target_scoring import RankCutoffs
+
+        ranking = RankCutoffs(args.max_repeats, args.max_remaining, args.max_targets)
+    elif any(v is not None for v in (args.max_repeats, args.max_remaining, args.max_targets)):
+        parser.error("--max-repeats/--max-remaining/--max-targets exigem --rank")
+
+    if args.encoded:
+        from word_codes import MAX_LENGTH
+
+        if args.lengths[-1] > MAX_LENGTH:
+            parser.error(f"--encoded suporta palavras de até {MAX_LENGTH} letras")
+
+    # Owns the process: stages may reset the RSS high-water mark
+    metrics = StageMetrics("build_termo", per_stage_rss=True)
+    with profiling(args.profile):
+        results = build_sets(
+            jobs, use_cache=not args.no_cache, lengths=args.lengths, ranking=ranking,
+            metrics=metrics, encoded=args.encoded,
+        )
+        print()
+        write_outputs(results, args.format, args.dawg, metrics)
+
+    if 5 in results:
+        verify(*results[5])
+
+    for n, (targets, valid) in results.items():
+        target_set = set(targets)
+        print()
+        print(f"  Amostra words_{n} : {targets[:10]}")
+        print(f"  Amostra valid_{n} : {[w for w in valid if w not in target_set][:10]}")
     print()
-    print(f"  Amostra words_5 : {targets[:10]}")
-    print(f"  Amostra valid_5 : {[w for w in valid if w not in set(targets)][:10]}")
+    print("  ── Tempo por etapa ─────────────────────────")
+    print(metrics.summary())
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json, lengths=args.lengths, jobs=jobs,
+                           cache=not args.no_cache, format=args.format, encoded=args.encoded)
+        print(f"  Métricas → {args.metrics_json}")
     print()
     print("✓ Concluído.")
     print()
@@ -0,0 +1,133 @@
+"""
+check_levels.py
+---------------
+Verifica a solidez de todos os níveis do Caça-Palavras (categoria × nível
+1–15): gera os grids com o port do LevelGenerator (ou lê um arquivo de
+build_levels.py) e procura cada palavra-alvo em todas as linhas, colunas e
+diagonais, nos dois sentidos, com um autômato de Aho-Corasick por categoria
+(ver levelgen/checker.py).
+
+Reporta:
+  • DUPLICADA  — palavra-alvo que aparece mais de uma vez no grid; o
+                 WordFinder só aceita a ocorrência registrada
+  • DESCARTADA — palavra sorteada que o gerador não conseguiu posicionar
+  • QUEBRADA   — posicionamento cujas células não soletram a palavra
+
+Com --from, --levels filtra os níveis lidos do arquivo (--jobs só vale ao
+gerar os grids).
+
+Uso:
+  python scripts/data/check_levels.py [--from levels.json] [--jobs N]
+                                      [--levels 1-15] [--json relatorio.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from build_levels import parse_levels
+from levelgen import (
+    LEVELS_PER_CATEGORY,
+    check_levels,
+    generate_catalog,
+    load_categories,
+    read_levels,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Solidez dos níveis do Caça-Palavras.")
+    parser.add_argument("--from", dest="source", type=Path, metavar="levels.json",
+                        help="verifica um arquivo de níveis em vez de gerar os grids")
+    parser.add_argument("--jobs", type=int, metavar="N",
+                        help="processos para gerar os grids (0 = todos os núcleos; padrão: 0); "
+                             "não combina com --from")
+    parser.add_argument(
+        "--levels", type=parse_levels, metavar="1-15",
+        help=f"níveis a gerar — com --from, a verificar (padrão: 1-{LEVELS_PER_CATEGORY}; "
+             "com --from, todos os do arquivo)",
+    )
+    parser.add_argument("--json", type=Path, help="grava o relatório completo em JSON")
+    args = parser.parse_args()
+    if args.source and args.jobs is not None:
+        parser.error("--jobs só vale ao gerar os grids (sem --from)")
+    jobs = args.jobs if args.jobs and args.jobs > 0 else (os.cpu_count() or 1)
+
+    print("=" * 60)
+    print("🔍 Verificação de níveis — Caça-Palavras")
+    print("=" * 60)
+
+    categories = load_categories()
+    words = {c.category_id: c.normalized for c in categories}
+
+    started = time.perf_counter()
+    if args.source:
+        levels = read_levels(args.source)
+        print(f"   {len(levels)} níveis lidos de {args.source}")
+        if args.levels:
+            wanted = set(args.levels)
+            levels = [lv for lv in levels if lv.level_number in wanted]
+            print(f"   {len(levels)} no(s) nível(is) pedido(s) em --levels")
+    else:
+        levels = args.levels or list(range(1, LEVELS_PER_CATEGORY + 1))
+        levels = generate_catalog(categories, levels, jobs)
+        print(f"   {len(levels)} níveis gerados ({len(categories)} categorias)")
+    generated = time.perf_counter()
+
+    reports = check_levels(levels, words)
+    checked = time.perf_counter()
+
+    issues = 0
+    for r in reports:
+        where = f"{r.category_id} #{r.level_number}"
+        for word, occs in r.duplicates.items():
+            issues += 1
+            spots = ", ".join(
+                f"[{o.start_row},{o.start_col}] {o.direction.name}{' (inv.)' if o.reversed else ''}"
+                for o in occs
+            )
+            print(f"   ❌ DUPLICADA  {where}: {word} × {len(occs)} — {spots}")
+        for word in r.dropped:
+            issues += 1
+            print(f"   ❌ DESCARTADA {where}: {word}")
+        for detail in r.broken:
+            issues += 1
+            print(f"   ❌ QUEBRADA   {where}: {detail}")
+
+    bad = sum(not r.ok for r in reports)
+    print()
+    print("=" * 60)
+    print(f"📊 {len(reports)} níveis, {bad} com problema(s), {issues} ocorrência(s)")
+    print(f"   geração {generated - started:.2f}s, verificação {checked - generated:.2f}s")
+    print("=" * 60)
+
+    if args.json:
+        args.json.write_text(json.dumps([
+            {
+                "categoryId": r.category_id,
+                "levelNumber": r.level_number,
+                "seed": r.seed,
+                "targets": r.targets,
+                "duplicates": {
+                    word: [
+                        {"startRow": o.start_row, "startCol": o.start_col,
+                         "direction": int(o.direction), "reversed": o.reversed}
+                        for o in occs
+                    ]
+                    for word, occs in r.duplicates.items()
+                },
+                "dropped": r.dropped,
+                "broken": r.broken,
+            }
+            for r in reports
+        ], ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"   Relatório → {args.json}")
+
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
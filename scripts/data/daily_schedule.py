@@ -0,0 +1,159 @@
+"""
+daily_schedule.py
+-----------------
+Formato binário do calendário da palavra do dia do Termo BR (daily_N.bytes),
+gerado por build_schedule.py.
+
+Layout (little-endian):
+
+  offset  tamanho  campo
+  0       4        magic  b"TDAY"
+  4       1        versão (SCHEDULE_VERSION)
+  5       1        tamanho da palavra N
+  6       2        reservado (0)
+  8       4        época: dia 0 do calendário, em dias desde 1970-01-01
+  12      4        quantidade de dias
+  16      N × qtd  uma palavra ASCII A-Z por dia, em ordem de data
+
+A palavra de uma data é o registro (data − época): acesso O(1), sem parse
+nem busca. O app calcula o dia local, subtrai a época e lê N bytes.
+
+Uso:
+  python scripts/data/daily_schedule.py lookup daily_5.bytes [2026-10-18]
+  python scripts/data/daily_schedule.py verify daily_5.bytes words_5.json
+"""
+
+import json
+import struct
+import sys
+from collections.abc import Iterable
+from datetime import date, timedelta
+from pathlib import Path
+
+
+MAGIC = b"TDAY"
+SCHEDULE_VERSION = 1
+HEADER = struct.Struct("<4sBBHII")
+
+UNIX_EPOCH = date(1970, 1, 1)
+
+
+class ScheduleFormatError(ValueError):
+    """Raised when a schedule file is truncated, corrupt or has an unknown version."""
+
+
+def day_number(day: date) -> int:
+    """Days since 1970-01-01."""
+    return (day - UNIX_EPOCH).days
+
+
+def encode_schedule(words: Iterable[str], length: int, epoch: date) -> bytes:
+    """Serializes one word per day, starting at `epoch`."""
+    words = list(words)
+    for w in words:
+        if len(w) != length or not w.isascii() or not w.isalpha() or not w.isupper():
+            raise ValueError(f"palavra inválida para registro de {length} bytes: {w!r}")
+    body = "".join(words).encode("ascii")
+    return HEADER.pack(MAGIC, SCHEDULE_VERSION, length, 0, day_number(epoch), len(words)) + body
+
+
+def write_schedule(path: Path, words: Iterable[str], length: int, epoch: date) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_schedule(words, length, epoch))
+
+
+class DailySchedule:
+    """Read-only view over a schedule file; the word of a date is one slice."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise ScheduleFormatError("arquivo menor que o cabeçalho")
+        magic, version, length, _, epoch, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ScheduleFormatError(f"magic inválido: {magic!r}")
+        if version != SCHEDULE_VERSION:
+            raise ScheduleFormatError(f"versão {version} não suportada")
+        if length == 0 or len(data) != HEADER.size + length * count:
+            raise ScheduleFormatError(
+                f"tamanho {len(data)} incompatível com {count} dias de {length} bytes"
+            )
+        self.length = length
+        self.epoch = UNIX_EPOCH + timedelta(days=epoch)
+        self._count = count
+        self._body = memoryview(data)[HEADER.size:]
+
+    @classmethod
+    def load(cls, path: Path) -> "DailySchedule":
+        return cls(path.read_bytes())
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_day(self) -> date:
+        return self.epoch + timedelta(days=self._count - 1)
+
+    def word_at(self, index: int) -> str:
+        start = index * self.length
+        return bytes(self._body[start:start + self.length]).decode("ascii")
+
+    def word_for(self, day: date) -> str | None:
+        """The word of `day`, or None outside the calendar."""
+        index = (day - self.epoch).days
+        if not 0 <= index < self._count:
+            return None
+        return self.word_at(index)
+
+    def words(self) -> list[str]:
+        text = bytes(self._body).decode("ascii")
+        return [text[i:i + self.length] for i in range(0, len(text), self.length)]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def lookup(path: Path, day: date) -> int:
+    schedule = DailySchedule.load(path)
+    word = schedule.word_for(day)
+    if word is None:
+        print(f"❌ {day} fora do calendário ({schedule.epoch} … {schedule.last_day})")
+        return 1
+    print(f"  {day} ({(day - schedule.epoch).days}º dia): {word}")
+    return 0
+
+
+def verify(path: Path, words_path: Path) -> int:
+    """No repeated word, and every word present in the target list."""
+    schedule = DailySchedule.load(path)
+    days = schedule.words()
+    targets = set(json.loads(words_path.read_text(encoding="utf-8"))["words"])
+    seen: dict[str, int] = {}
+    problems = 0
+    for i, w in enumerate(days):
+        if w in seen:
+            problems += 1
+            print(f"  ✗ {w} repetida: dias {seen[w]} e {i}")
+        seen.setdefault(w, i)
+    missing = [w for w in days if w not in targets]
+    if missing:
+        print(f"  ⚠️  {len(missing)} palavra(s) fora de {words_path.name} "
+              f"(removidas depois de publicadas?): {missing[:10]}")
+    status = "✓" if not problems else "✗"
+    print(f"  {status} {path.name}: {len(days):,} dias, {schedule.epoch} … {schedule.last_day}, "
+          f"{problems} repetição(ões)")
+    return 1 if problems else 0
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) >= 2 and argv[0] == "lookup":
+        day = date.fromisoformat(argv[2]) if len(argv) > 2 else date.today()
+        return lookup(Path(argv[1]), day)
+    if len(argv) == 3 and argv[0] == "verify":
+        return verify(Path(argv[1]), Path(argv[2]))
+    print(__doc__)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
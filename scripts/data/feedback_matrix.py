@@ -0,0 +1,222 @@
+"""
+feedback_matrix.py
+------------------
+Pré-computa a matriz de feedback do Termo (palpite × alvo) com NumPy e a
+grava como .npy mapeável em memória, para que as análises seguintes
+(dificuldade, solver, …) abram o arquivo em vez de recalcular.
+
+  • palpites  = valid_N.json, alvos = words_N.json (codificados em uint8, A=0)
+  • feedback  = Σ cor_i · 3^i, cor ∈ {0 cinza, 1 amarelo, 2 verde}
+                (uint8 até 5 letras — 3^5 = 243 códigos; uint16 até 10;
+                uint32 até MAX_LENGTH)
+  • cálculo vetorizado em blocos de palpites (--chunk), com a regra de letras
+    repetidas do Termo: verdes consomem primeiro, amarelos da esquerda p/ direita
+
+Saída (em .cache/termo_analysis/):
+  feedback_N.npy         ← matriz [palpite, alvo]
+  feedback_N.words.json  ← listas de palpites/alvos + hash, para detectar
+                           matriz desatualizada
+
+Uso:
+  python scripts/data/feedback_matrix.py [--length 5] [--chunk 512]
+  (abrir em outra análise: open_matrix(5) → (matriz memmap, palpites, alvos))
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from termo_paths import REPO_ROOT, target_file, valid_file
+
+
+ANALYSIS_DIR = REPO_ROOT / ".cache" / "termo_analysis"
+
+GRAY, YELLOW, GREEN = 0, 1, 2
+
+DEFAULT_CHUNK = 512
+
+# Longest word whose 3^L feedback codes fit the widest dtype (uint32)
+MAX_LENGTH = 20
+
+
+def matrix_file(length: int) -> Path:
+    return ANALYSIS_DIR / f"feedback_{length}.npy"
+
+
+def words_meta_file(length: int) -> Path:
+    return ANALYSIS_DIR / f"feedback_{length}.words.json"
+
+
+def code_dtype(length: int) -> np.dtype:
+    """Narrowest unsigned dtype holding every feedback code (0 … 3^length − 1)."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if 3 ** length - 1 <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"palavras de {length} letras: 3^{length} códigos não cabem em uint32 "
+                     f"(máximo: {MAX_LENGTH} letras)")
+
+
+def load_words(path: Path) -> list[str]:
+    return json.loads(path.read_text(encoding="utf-8"))["words"]
+
+
+def words_digest(guesses: list[str], targets: list[str]) -> str:
+    h = hashlib.sha256()
+    h.update("\n".join(guesses).encode("ascii"))
+    h.update(b"\0")
+    h.update("\n".join(targets).encode("ascii"))
+    return h.hexdigest()
+
+
+def encode(words: list[str], length: int) -> np.ndarray:
+    """Words → uint8 array of shape (len(words), length), A=0 … Z=25."""
+    if not words:
+        return np.zeros((0, length), dtype=np.uint8)
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (raw.reshape(len(words), length) - ord("A")).astype(np.uint8)
+
+
+# ---------------------------------------------------------------------------
+# Feedback
+# ---------------------------------------------------------------------------
+
+def feedback(guess: str, target: str) -> int:
+    """Reference (scalar) feedback code for one guess/target pair."""
+    colors = [GRAY] * len(guess)
+    remaining: dict[str, int] = {}
+    for i, (g, t) in enumerate(zip(guess, target)):
+        if g == t:
+            colors[i] = GREEN
+        else:
+            remaining[t] = remaining.get(t, 0) + 1
+    for i, g in enumerate(guess):
+        if colors[i] != GREEN and remaining.get(g, 0) > 0:
+            colors[i] = YELLOW
+            remaining[g] -= 1
+    return sum(c * 3 ** i for i, c in enumerate(colors))
+
+
+def decode(code: int, length: int = 5) -> str:
+    """Feedback code → "⬛🟨🟩"-style string, handy for debugging."""
+    symbols = "⬛🟨🟩"
+    out = []
+    for _ in range(length):
+        out.append(symbols[code % 3])
+        code //= 3
+    return "".join(out)
+
+
+def feedback_block(guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Vectorized feedback codes for every (guess, target) pair of a block.
+
+    guesses: (g, L) uint8, targets: (t, L) uint8 → (g, t) codes. Works on
+    L×L boolean (g, t) planes: eq[i][j] = guess letter i == target letter j.
+    """
+    length = guesses.shape[1]
+    dtype = code_dtype(length)
+    shape = (guesses.shape[0], targets.shape[0])
+    eq = [
+        [guesses[:, i][:, None] == targets[:, j][None, :] for j in range(length)]
+        for i in range(length)
+    ]
+    # Target positions not consumed by a green
+    free = [~eq[j][j] for j in range(length)]
+
+    code = np.zeros(shape, dtype=dtype)
+    yellows: list[np.ndarray] = []
+    for i in range(length):
+        remaining = np.zeros(shape, dtype=np.uint8)
+        for j in range(length):
+            remaining += eq[i][j] & free[j]
+        # Earlier yellows already spent on the same letter
+        for k in range(i):
+            same = (guesses[:, k] == guesses[:, i])[:, None]
+            remaining -= same & yellows[k]
+        yellow = free[i] & (remaining > 0)
+        yellows.append(yellow)
+        code += (eq[i][i] * dtype.type(GREEN) + yellow * dtype.type(YELLOW)) * dtype.type(3 ** i)
+    return code
+
+
+def compute_matrix(
+    guesses: list[str], targets: list[str], length: int, out: Path, chunk: int = DEFAULT_CHUNK
+) -> np.ndarray:
+    """Computes the full matrix into a memory-mapped .npy, `chunk` guesses at a time."""
+    g_arr = encode(guesses, length)
+    t_arr = encode(targets, length)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    matrix = np.lib.format.open_memmap(
+        out, mode="w+", dtype=code_dtype(length), shape=(len(guesses), len(targets))
+    )
+    for start in range(0, len(guesses), chunk):
+        matrix[start:start + chunk] = feedback_block(g_arr[start:start + chunk], t_arr)
+    matrix.flush()
+    return matrix
+
+
+def open_matrix(length: int = 5) -> tuple[np.ndarray, list[str], list[str]]:
+    """Opens a precomputed matrix read-only (memmap) with its guess/target lists.
+
+    Raises FileNotFoundError if missing and ValueError if words_N/valid_N
+    changed since it was computed.
+    """
+    meta = json.loads(words_meta_file(length).read_text(encoding="utf-8"))
+    guesses, targets = meta["guesses"], meta["targets"]
+    current = words_digest(load_words(valid_file(length)), load_words(target_file(length)))
+    if meta["digest"] != current:
+        raise ValueError(
+            f"{matrix_file(length).name} desatualizada — rode feedback_matrix.py --length {length}"
+        )
+    matrix = np.load(matrix_file(length), mmap_mode="r")
+    return matrix, guesses, targets
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Matriz de feedback palpite × alvo do Termo BR.")
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="palpites por bloco")
+    parser.add_argument("--force", action="store_true", help="recalcula mesmo se atualizada")
+    args = parser.parse_args()
+
+    n = args.length
+    try:
+        guesses = load_words(valid_file(n))
+        targets = load_words(target_file(n))
+    except FileNotFoundError as e:
+        print(f"❌ {e.filename} não existe — rode build_termo.py --lengths {n}")
+        return 1
+    digest = words_digest(guesses, targets)
+
+    print(f"  Palpites (valid_{n}) : {len(guesses):,}")
+    print(f"  Alvos    (words_{n}) : {len(targets):,}")
+
+    meta_path = words_meta_file(n)
+    if not args.force and matrix_file(n).exists() and meta_path.exists():
+        if json.loads(meta_path.read_text(encoding="utf-8")).get("digest") == digest:
+            print(f"  ✓ {matrix_file(n)} já está atualizada (use --force para recalcular)")
+            return 0
+
+    started = time.perf_counter()
+    matrix = compute_matrix(guesses, targets, n, matrix_file(n), args.chunk)
+    elapsed = time.perf_counter() - started
+
+    meta_path.write_text(
+        json.dumps({"length": n, "digest": digest, "guesses": guesses, "targets": targets}),
+        encoding="utf-8",
+    )
+    print(f"  Matriz {matrix.shape[0]:,} × {matrix.shape[1]:,} ({matrix.nbytes / 2**20:,.1f} MiB) "
+          f"em {elapsed:.1f}s → {matrix_file(n)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+"""
+hunspell_affix.py
+-----------------
+Parser de .aff/.dic do Hunspell e expansão das regras de afixo (PFX/SFX):
+gera todas as formas flexionadas de cada entrada do dicionário em vez de
+descartar as flags depois da "/".
+
+Suporta:
+  • SET (codificação), FLAG char/long/num/UTF-8, AF (aliases de flags),
+    IGNORE, FULLSTRIP, NEEDAFFIX/PSEUDOROOT, FORBIDDENWORD, ONLYINCOMPOUND
+  • PFX/SFX com strip, append, condição e produto cruzado (Y/N)
+  • classes de continuação: sufixo duplo (SFX sobre SFX) e prefixo
+    liberado por um sufixo
+
+Compostos (COMPOUND*) e CIRCUMFIX não são expandidos.
+
+Desempenho:
+  • as regras são compiladas uma vez: por flag, e dentro da flag indexadas
+    pela última (SFX) ou primeira (PFX) letra exigida pela condição — cada
+    palavra só testa as entradas que podem casar, com a condição em regex
+    já compilada
+  • a expansão é um gerador, entrada por entrada do .dic (streaming); em
+    modo de memória limitada (padrão do CLI) só as formas de uma mesma
+    raiz são deduplicadas, com --unique o conjunto inteiro
+
+Uso:
+  from hunspell_affix import Affixes, expand_dictionary
+  python scripts/data/hunspell_affix.py pt_BR.aff pt_BR.dic [--output formas.txt]
+                                        [--max-length N] [--unique]
+"""
+
+import argparse
+import itertools
+import re
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from source_io import decode_lines
+
+
+# Python codec for each SET value that is not a codec name already
+ENCODING_ALIASES = {"microsoft-cp1251": "cp1251", "iso-8859-1": "iso8859-1"}
+
+FLAG_MODES = ("char", "long", "num", "UTF-8")
+
+
+class AffixFormatError(ValueError):
+    """Raised for a malformed .aff file."""
+
+
+def _compile_condition(condition: str, suffix: bool) -> tuple[re.Pattern | None, frozenset[str] | None]:
+    """Hunspell condition → (anchored regex or None for ".", letters allowed at the edge).
+
+    The edge is the last position for suffixes and the first for prefixes;
+    None means any letter (".", negated class or no condition).
+    """
+    if condition in ("", "."):
+        return None, None
+    parts: list[tuple[str, frozenset[str] | None]] = []
+    i = 0
+    while i < len(condition):
+        c = condition[i]
+        if c == "[":
+            end = condition.find("]", i)
+            if end < 0:
+                raise AffixFormatError(f"condição sem ']': {condition!r}")
+            body = condition[i + 1:end]
+            if body.startswith("^"):
+                parts.append((f"[^{re.escape(body[1:])}]", None))
+            else:
+                parts.append((f"[{re.escape(body)}]", frozenset(body)))
+            i = end + 1
+        elif c == ".":
+            parts.append((".", None))
+            i += 1
+        else:
+            parts.append((re.escape(c), frozenset(c)))
+            i += 1
+    pattern = "".join(p for p, _ in parts)
+    if suffix:
+        return re.compile(f"(?:{pattern})$"), parts[-1][1]
+    return re.compile(f"^(?:{pattern})"), parts[0][1]
+
+
+@dataclass(frozen=True)
+class AffixEntry:
+    strip: str
+    append: str
+    flags: tuple[str, ...]
+    condition: re.Pattern | None
+
+
+@dataclass
+class AffixClass:
+    """Every PFX or SFX entry of one flag, indexed by the edge letter."""
+    flag: str
+    suffix: bool
+    cross_product: bool
+    by_letter: dict[str, list[AffixEntry]] = field(default_factory=dict)
+    any_letter: list[AffixEntry] = field(default_factory=list)
+
+    def add(self, entry: AffixEntry, letters: frozenset[str] | None) -> None:
+        if letters is None:
+            self.any_letter.append(entry)
+        else:
+            for c in letters:
+                self.by_letter.setdefault(c, []).append(entry)
+
+    def freeze(self) -> None:
+        """Merges the any-letter entries into every letter list (after parsing)."""
+        for entries in self.by_letter.values():
+            entries.extend(self.any_letter)
+
+    def candidates(self, word: str) -> list[AffixEntry]:
+        return self.by_letter.get(word[-1] if self.suffix else word[0], self.any_letter)
+
+
+class Affixes:
+    """Compiled .aff rules."""
+
+    def __init__(self):
+        self.encoding = "iso8859-1"
+        self.flag_mode = "char"
+        self.aliases: list[tuple[str, ...]] = []
+        self.prefixes: dict[str, AffixClass] = {}
+        self.suffixes: dict[str, AffixClass] = {}
+        self.need_affix: str | None = None
+        self.forbidden: str | None = None
+        self.only_in_compound: str | None = None
+        self.full_strip = False
+        self._ignore: dict[int, None] | None = None
+
+    # -- Parsing -----------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path) -> "Affixes":
+        """Parses a .aff file; the encoding comes from its SET line."""
+        raw = path.read_bytes()
+        affixes = cls()
+        match = re.search(rb"^SET\s+(\S+)", raw, re.MULTILINE)
+        if match:
+            name = match.group(1).decode("ascii", "replace").lower()
+            affixes.encoding = ENCODING_ALIASES.get(name, name)
+        lines = decode_lines(raw.splitlines(), [affixes.encoding], path.name)
+        affixes._parse(list(lines))
+        return affixes
+
+    def _parse(self, lines: list[str]) -> None:
+        pending: AffixClass | None = None
+        remaining = aliases_left = 0
+        for number, line in enumerate(lines, 1):
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            key = fields[0]
+            try:
+                if key in ("PFX", "SFX"):
+                    if remaining:
+                        self._add_entry(pending, fields)
+                        remaining -= 1
+                    else:
+                        pending, remaining = self._open_class(key, fields)
+                elif key == "FLAG":
+                    self.flag_mode = fields[1]
+                    if self.flag_mode not in FLAG_MODES:
+                        raise AffixFormatError(f"FLAG desconhecido: {self.flag_mode}")
+                elif key == "AF":
+                    # "AF <count>" header, then one "AF <flags>" line per alias
+                    if aliases_left:
+                        self.aliases.append(self._split_flags(fields[1]))
+                        aliases_left -= 1
+                    else:
+                        aliases_left = int(fields[1])
+                elif key in ("NEEDAFFIX", "PSEUDOROOT"):
+                    self.need_affix = self._split_flags(fields[1])[0]
+                elif key == "FORBIDDENWORD":
+                    self.forbidden = self._split_flags(fields[1])[0]
+                elif key == "ONLYINCOMPOUND":
+                    self.only_in_compound = self._split_flags(fields[1])[0]
+                elif key == "FULLSTRIP":
+                    self.full_strip = True
+                elif key == "IGNORE":
+                    self._ignore = dict.fromkeys(map(ord, fields[1]))
+            except (IndexError, ValueError) as e:
+                raise AffixFormatError(f"linha {number}: {line.strip()!r} — {e}") from None
+        if remaining:
+            raise AffixFormatError(f"{pending.flag}: faltam {remaining} entrada(s) de afixo")
+        for cls in (*self.prefixes.values(), *self.suffixes.values()):
+            cls.freeze()
+
+    def _open_class(self, key: str, fields: list[str]) -> tuple[AffixClass, int]:
+        flag = self._split_flags(fields[1])[0]
+        suffix = key == "SFX"
+        table = self.suffixes if suffix else self.prefixes
+        cls = table.get(flag)
+        if cls is None:
+            cls = table[flag] = AffixClass(flag, suffix, fields[2] == "Y")
+        return cls, int(fields[3])
+
+    def _add_entry(self, cls: AffixClass, fields: list[str]) -> None:
+        strip = "" if fields[2] == "0" else fields[2]
+        append, _, flags = fields[3].partition("/")
+        if append == "0":
+            append = ""
+        condition = fields[4] if len(fields) > 4 else "."
+        pattern, letters = _compile_condition(condition, cls.suffix)
+        if self._ignore:
+            append = append.translate(self._ignore)
+        cls.add(AffixEntry(strip, append, self.parse_flags(flags) if flags else (), pattern), letters)
+
+    def _split_flags(self, text: str) -> tuple[str, ...]:
+        if self.flag_mode == "long":
+            return tuple(text[i:i + 2] for i in range(0, len(text), 2))
+        if self.flag_mode == "num":
+            return tuple(part for part in text.split(",") if part)
+        return tuple(text)
+
+    def parse_flags(self, text: str) -> tuple[str, ...]:
+        """Flags of a .dic entry or affix continuation (AF aliases resolved)."""
+        if self.aliases and text.isdigit():
+            index = int(text)
+            return self.aliases[index - 1] if 0 < index <= len(self.aliases) else ()
+        return self._split_flags(text)
+
+    # -- Expansion ---------------------------------------------------------
+
+    def _apply(self, cls: AffixClass, word: str) -> Iterator[tuple[str, AffixEntry]]:
+        if not word:
+            return
+        n = len(word)
+        for entry in cls.candidates(word):
+            strip = entry.strip
+            if len(strip) > n or (len(strip) == n and not self.full_strip):
+                continue
+            if cls.suffix:
+                if strip and not word.endswith(strip):
+                    continue
+                if entry.condition is not None and entry.condition.search(word) is None:
+                    continue
+                yield word[:n - len(strip)] + entry.append, entry
+            else:
+                if strip and not word.startswith(strip):
+                    continue
+                if entry.condition is not None and entry.condition.match(word) is None:
+                    continue
+                yield entry.append + word[len(strip):], entry
+
+    def _valid(self, flags: tuple[str, ...]) -> bool:
+        return self.need_affix not in flags and self.only_in_compound not in flags
+
+    def expand(self, word: str, flags: tuple[str, ...]) -> Iterator[str]:
+        """Every form of one .dic entry (may repeat; the root unless NEEDAFFIX)."""
+        if self.forbidden is not None and self.forbidden in flags:
+            return
+        if self._ignore:
+            word = word.translate(self._ignore)
+        if self._valid(flags):
+            yield word
+
+        # (form, continuation flags, usable in a cross product)
+        suffixed: list[tuple[str, tuple[str, ...], bool]] = []
+        for flag in flags:
+            cls = self.suffixes.get(flag)
+            if cls is None:
+                continue
+            for form, entry in self._apply(cls, word):
+                if self.only_in_compound in entry.flags:
+                    continue
+                if self._valid(entry.flags):
+                    yield form
+                suffixed.append((form, entry.flags, cls.cross_product))
+                # Twofold suffixes: the continuation class applies to the form
+                for flag2 in entry.flags:
+                    cls2 = self.suffixes.get(flag2)
+                    if cls2 is None:
+                        continue
+                    for form2, entry2 in self._apply(cls2, form):
+                        if self._valid(entry2.flags):
+                            yield form2
+                        suffixed.append((form2, entry2.flags, cls.cross_product and cls2.cross_product))
+
+        for flag in flags:
+            cls = self.prefixes.get(flag)
+            if cls is None:
+                continue
+            for form, entry in self._apply(cls, word):
+                if self._valid(entry.flags):
+                    yield form
+            if cls.cross_product:
+                for stem, _, cross in suffixed:
+                    if cross:
+                        for form, entry in self._apply(cls, stem):
+                            if self._valid(entry.flags):
+                                yield form
+
+        # Prefixes allowed by a suffix's continuation class
+        for stem, cont, _ in suffixed:
+            for flag in cont:
+                cls = self.prefixes.get(flag)
+                if cls is not None and flag not in flags:
+                    for form, entry in self._apply(cls, stem):
+                        if self._valid(entry.flags):
+                            yield form
+
+
+def iter_dic(path: Path, affixes: Affixes) -> Iterator[tuple[str, tuple[str, ...]]]:
+    """(word, flags) for every entry of a .dic, streamed in the .aff encoding."""
+    with path.open("rb") as f:
+        lines = decode_lines(f, [affixes.encoding], path.name)
+        first = next(lines, "")
+        if first.strip() and not first.strip().isdigit():
+            lines = itertools.chain([first], lines)
+        for line in lines:
+            entry = line.split(None, 1)[0] if line.strip() else ""
+            if not entry or entry.startswith("#"):
+                continue
+            word, slash, flags = entry.partition("/")
+            # "\/" escapes a slash inside the word
+            while word.endswith("\\") and slash:
+                rest, slash, flags = flags.partition("/")
+                word = word[:-1] + "/" + rest
+            yield word, affixes.parse_flags(flags) if slash and flags else ()
+
+
+def expand_dictionary(aff_path: Path, dic_path: Path) -> Iterator[list[str]]:
+    """Streams the forms of each .dic entry (deduplicated per entry), entry by entry."""
+    affixes = Affixes.load(aff_path)
+    for word, flags in iter_dic(dic_path, affixes):
+        yield list(dict.fromkeys(affixes.expand(word, flags)))
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Expande um dicionário Hunspell (.aff/.dic).")
+    parser.add_argument("aff", type=Path)
+    parser.add_argument("dic", type=Path)
+    parser.add_argument("--output", type=Path, help="grava as formas, uma por linha (UTF-8)")
+    parser.add_argument("--max-length", type=int, metavar="N", help="só formas com até N letras")
+    parser.add_argument("--unique", action="store_true",
+                        help="deduplica todas as formas (memória proporcional ao total); "
+                             "sem ela só as formas de cada raiz são deduplicadas")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    seen: set[str] | None = set() if args.unique else None
+    entries = forms = 0
+    out = args.output.open("w", encoding="utf-8") if args.output else None
+    try:
+        for expanded in expand_dictionary(args.aff, args.dic):
+            entries += 1
+            for form in expanded:
+                if args.max_length is not None and len(form) > args.max_length:
+                    continue
+                if seen is not None:
+                    if form in seen:
+                        continue
+                    seen.add(form)
+                forms += 1
+                if out:
+                    out.write(form + "\n")
+    finally:
+        if out:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"  ✓ {entries:,} entradas → {forms:,} formas em {elapsed:.1f}s"
+          f"{f' → {args.output}' if args.output else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+levelgen
+--------
+Port em Python da geração de níveis do Caça-Palavras (LevelGenerator.cs /
+GridGenerator.cs), fiel ao C#: mesmo seed, mesmo System.Random, mesma
+ordem de sorteios — o grid gerado aqui é o grid que o jogo monta em runtime.
+
+  dotnet   — System.Random, string.GetHashCode e Array.Sort do runtime
+  grid     — GridData, WordPlacement, WordPlacer, GridGenerator
+  level    — DifficultyConfig, LevelData, generate_level, generate_challenge,
+             select_words / select_from_bucket (sorteio das palavras)
+  packer   — ConstraintPacker: posicionamento por restrições com retrocesso
+  filler   — LetterFiller: letras de preenchimento por frequência (ICF),
+             sem formar palavras das categorias nem da lista de bloqueio
+  catalog  — carga das categorias, geração em lote (todos os núcleos) e
+             leitura/gravação do arquivo de níveis
+  checker  — varredura Aho-Corasick dos grids: palavras duplicadas/descartadas
+
+Uso:
+  from levelgen import generate_level, load_categories, generate_catalog
+  (CLI: python scripts/data/build_levels.py)
+"""
+
+from .catalog import (
+    Category,
+    challenge_pool,
+    generate_catalog,
+    load_categories,
+    load_desafio,
+    make_category,
+    read_levels,
+    write_levels,
+)
+from .checker import LevelReport, Occurrence, WordIndex, check_level, check_levels
+from .dotnet import DotNetRandom, string_hash
+from .filler import FillStats, ForbiddenIndex, LetterFiller, LetterModel
+from .grid import Direction, GridData, GridGenerator, WordPlacement
+from .level import (
+    LEVELS_PER_CATEGORY,
+    DifficultyConfig,
+    LevelData,
+    generate_challenge,
+    generate_level,
+    generate_seed,
+    select_from_bucket,
+    select_words,
+    selection_widths,
+)
+from .packer import ConstraintPacker
+
+__all__ = [
+    "LEVELS_PER_CATEGORY",
+    "Category",
+    "ConstraintPacker",
+    "DifficultyConfig",
+    "Direction",
+    "DotNetRandom",
+    "FillStats",
+    "ForbiddenIndex",
+    "GridData",
+    "GridGenerator",
+    "LevelData",
+    "LetterFiller",
+    "LetterModel",
+    "LevelReport",
+    "Occurrence",
+    "WordIndex",
+    "WordPlacement",
+    "challenge_pool",
+    "check_level",
+    "check_levels",
+    "generate_catalog",
+    "generate_challenge",
+    "generate_level",
+    "generate_seed",
+    "load_categories",
+    "load_desafio",
+    "make_category",
+    "read_levels",
+    "select_from_bucket",
+    "select_words",
+    "selection_widths",
+    "string_hash",
+    "write_levels",
+]
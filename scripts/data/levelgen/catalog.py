@@ -0,0 +1,198 @@
+"""
+levelgen/catalog.py
+-------------------
+Catálogo completo de níveis: carrega categories.json + words/<id>.json como
+o BootLoader/WordDatabase (normaliza, descarta < 3 letras) e gera todos os
+níveis categoria × 1..15, opcionalmente em vários processos.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from text_normalizer import normalize, to_display
+
+from .filler import LetterFiller
+from .grid import Direction, GridData, WordPlacement
+from .level import (
+    CHALLENGE_ID,
+    LEVELS_PER_CATEGORY,
+    MIN_WORD_LENGTH,
+    DifficultyConfig,
+    LevelData,
+    generate_level,
+)
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+DATA_DIR = REPO_ROOT / "WordSearch" / "Assets" / "_Project" / "Resources" / "Data"
+CATEGORIES_FILE = DATA_DIR / "categories.json"
+WORDS_DIR = DATA_DIR / "words"
+
+# Bump when the layout of the precomputed levels file changes
+LEVELS_FORMAT = 1
+
+
+@dataclass
+class Category:
+    """WordCategory: normalized and display forms, same order."""
+    category_id: str
+    normalized: list[str]
+    display: list[str]
+
+
+def load_json(path: Path) -> dict:
+    # The words JSONs are saved with a UTF-8 BOM
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def make_category(category_id: str, words: list[str]) -> Category:
+    """WordDatabase.AddCategory: words shorter than 3 letters once normalized are skipped."""
+    normalized, display = [], []
+    for word in words:
+        norm = normalize(word)
+        if len(norm) < MIN_WORD_LENGTH:
+            continue
+        normalized.append(norm)
+        display.append(to_display(word))
+    return Category(category_id, normalized, display)
+
+
+def load_categories(
+    categories_file: Path = CATEGORIES_FILE, words_dir: Path = WORDS_DIR
+) -> list[Category]:
+    """Every category of categories.json that has a words file (desafio is not a level category)."""
+    categories = []
+    for entry in load_json(categories_file).get("categories", []):
+        path = words_dir / f"{entry['id']}.json"
+        if not path.exists():
+            print(f"  ⚠️  {path.name} não encontrado — categoria '{entry['id']}' ignorada")
+            continue
+        categories.append(make_category(entry["id"], load_json(path).get("words", [])))
+    return categories
+
+
+def load_desafio(words_dir: Path = WORDS_DIR) -> Category | None:
+    """The challenge-only bank (desafio.json), or None when absent."""
+    path = words_dir / f"{CHALLENGE_ID}.json"
+    if not path.exists():
+        return None
+    return make_category(CHALLENGE_ID, load_json(path).get("words", []))
+
+
+def challenge_pool(categories: list[Category], desafio: Category | None) -> Category:
+    """Challenge word pool: desafio first, then every regular category in load order."""
+    sources = ([desafio] if desafio else []) + [c for c in categories if c.category_id != CHALLENGE_ID]
+    return Category(
+        CHALLENGE_ID,
+        [w for c in sources for w in c.normalized],
+        [w for c in sources for w in c.display],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Batch generation
+# ---------------------------------------------------------------------------
+
+def generate_category(
+    category: Category, levels: list[int], filler: LetterFiller | None = None
+) -> list[LevelData]:
+    if not category.normalized:
+        return []
+    generated = [
+        generate_level(category.category_id, n, category.normalized, category.display)
+        for n in levels
+    ]
+    if filler is not None:
+        for level in generated:
+            filler.refill(level)
+    return generated
+
+
+def generate_catalog(
+    categories: list[Category],
+    levels: list[int] | None = None,
+    jobs: int = 1,
+    filler: LetterFiller | None = None,
+) -> list[LevelData]:
+    """All levels of all categories, in category order then level order.
+
+    With jobs > 1 each category is generated in its own process; the result
+    is identical to the serial run. With `filler` the filler letters are
+    replaced by LetterFiller.refill (seeded by each level's seed).
+    """
+    levels = levels or list(range(1, LEVELS_PER_CATEGORY + 1))
+    if jobs <= 1 or len(categories) <= 1:
+        per_category = [generate_category(c, levels, filler) for c in categories]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(categories))) as pool:
+            per_category = list(pool.map(
+                generate_category, categories,
+                [levels] * len(categories), [filler] * len(categories),
+            ))
+    return [level for batch in per_category for level in batch]
+
+
+# ---------------------------------------------------------------------------
+# Precomputed levels file
+# ---------------------------------------------------------------------------
+
+def level_to_dict(level: LevelData) -> dict:
+    """camelCase fields, like LevelData/WordPlacement, so JsonUtility can read them."""
+    return {
+        "categoryId": level.category_id,
+        "levelNumber": level.level_number,
+        "seed": level.seed,
+        "gridRows": level.difficulty.grid_rows,
+        "gridCols": level.difficulty.grid_cols,
+        "rows": level.grid.row_strings(),
+        "placements": [
+            {
+                "normalizedWord": p.normalized_word,
+                "displayWord": p.display_word,
+                "startRow": p.start_row,
+                "startCol": p.start_col,
+                "direction": int(p.direction),
+            }
+            for p in level.placements
+        ],
+        "dropped": level.dropped,
+    }
+
+
+def write_levels(path: Path, levels: list[LevelData]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": LEVELS_FORMAT, "levels": [level_to_dict(lv) for lv in levels]}
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def read_levels(path: Path) -> list[LevelData]:
+    """Loads a levels file written by write_levels.
+
+    Word-count bounds are not stored; the difficulty carries the level's
+    actual count as both min and max.
+    """
+    payload = load_json(path)
+    if payload.get("version") != LEVELS_FORMAT:
+        raise ValueError(f"{path.name}: versão {payload.get('version')} não suportada")
+
+    levels = []
+    for entry in payload["levels"]:
+        grid = GridData(entry["gridRows"], entry["gridCols"])
+        grid.cells = [list(row) for row in entry["rows"]]
+        placements = [
+            WordPlacement(
+                p["normalizedWord"], p["displayWord"], p["startRow"], p["startCol"],
+                Direction(p["direction"]),
+            )
+            for p in entry["placements"]
+        ]
+        count = len(placements) + len(entry.get("dropped", []))
+        levels.append(LevelData(
+            entry["categoryId"], entry["levelNumber"], entry["seed"],
+            DifficultyConfig(grid.rows, grid.cols, count, count),
+            grid, placements, list(entry.get("dropped", [])),
+        ))
+    return levels
@@ -0,0 +1,146 @@
+"""
+levelgen/checker.py
+-------------------
+Verificação de solidez dos níveis gerados.
+
+O WordFinder só aceita a seleção exata registrada no WordPlacement; se o
+FillEmptyCells (ou o cruzamento de outras palavras) formar a mesma palavra
+em outro lugar, o jogador a encontra, seleciona — e nada acontece. Aqui
+cada grid é varrido inteiro:
+
+  • linhas (→), colunas (↓) e diagonais (↘), cada uma lida também ao
+    contrário (padrões invertidos no mesmo autômato)
+  • um autômato de Aho-Corasick por categoria, com todas as palavras dela,
+    construído uma vez e reusado nos 15 níveis
+
+Por nível: palavras-alvo com mais de uma ocorrência (ambíguas), palavras
+sorteadas que não foram posicionadas e posicionamentos cujas células não
+soletram a palavra.
+"""
+
+from dataclasses import dataclass, field
+
+from aho_corasick import AhoCorasick
+
+from .grid import DELTAS, Direction
+from .level import MIN_WORD_LENGTH, LevelData
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    word: str
+    start_row: int
+    start_col: int
+    direction: Direction
+    # True when the word reads against `direction` (ending at the start cell)
+    reversed: bool
+
+    def cells(self) -> frozenset[tuple[int, int]]:
+        d_row, d_col = DELTAS[self.direction]
+        sign = -1 if self.reversed else 1
+        return frozenset(
+            (self.start_row + sign * i * d_row, self.start_col + sign * i * d_col)
+            for i in range(len(self.word))
+        )
+
+
+@dataclass
+class LevelReport:
+    category_id: str
+    level_number: int
+    seed: int
+    targets: int
+    duplicates: dict[str, list[Occurrence]] = field(default_factory=dict)
+    dropped: list[str] = field(default_factory=list)
+    broken: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.duplicates or self.dropped or self.broken)
+
+
+def grid_lines(rows: list[str]) -> list[tuple[str, Direction, int, int]]:
+    """Every row, column and ↘ diagonal with ≥ 3 cells: (text, direction, start row, start col)."""
+    n_rows, n_cols = len(rows), len(rows[0]) if rows else 0
+    lines = [(row, Direction.HORIZONTAL, r, 0) for r, row in enumerate(rows)]
+    lines += [
+        ("".join(rows[r][c] for r in range(n_rows)), Direction.VERTICAL, 0, c)
+        for c in range(n_cols)
+    ]
+    starts = [(r, 0) for r in range(n_rows)] + [(0, c) for c in range(1, n_cols)]
+    for r0, c0 in starts:
+        size = min(n_rows - r0, n_cols - c0)
+        if size >= MIN_WORD_LENGTH:
+            text = "".join(rows[r0 + i][c0 + i] for i in range(size))
+            lines.append((text, Direction.DIAGONAL_DOWN, r0, c0))
+    return lines
+
+
+class WordIndex:
+    """Aho-Corasick over a word list and its reversed forms."""
+
+    def __init__(self, words: list[str]):
+        words = sorted(set(words))
+        patterns, self._meta = [], []
+        for w in words:
+            patterns.append(w)
+            self._meta.append((w, False))
+            if w[::-1] != w:
+                patterns.append(w[::-1])
+                self._meta.append((w, True))
+        self._automaton = AhoCorasick(patterns)
+
+    def find(self, rows: list[str], only: set[str] | None = None) -> dict[str, list[Occurrence]]:
+        """All occurrences per word (restricted to `only`), one per distinct cell set."""
+        found: dict[str, dict[frozenset, Occurrence]] = {}
+        for text, direction, r0, c0 in grid_lines(rows):
+            d_row, d_col = DELTAS[direction]
+            for pid, end in self._automaton.iter_matches(text):
+                word, rev = self._meta[pid]
+                if only is not None and word not in only:
+                    continue
+                i = end - 1 if rev else end - len(word)
+                occ = Occurrence(word, r0 + i * d_row, c0 + i * d_col, direction, rev)
+                found.setdefault(word, {}).setdefault(occ.cells(), occ)
+        return {w: list(by_cells.values()) for w, by_cells in found.items()}
+
+
+def check_level(level: LevelData, index: WordIndex) -> LevelReport:
+    """Checks one level, generated or loaded with catalog.read_levels."""
+    rows = level.grid.row_strings()
+    targets = [p.normalized_word for p in level.placements]
+    report = LevelReport(
+        level.category_id, level.level_number, level.seed, len(targets),
+        dropped=list(level.dropped),
+    )
+
+    for p in level.placements:
+        spelled = "".join(rows[r][c] for r, c in p.cell_positions())
+        if spelled != p.normalized_word:
+            report.broken.append(f"{p.normalized_word} ≠ {spelled}")
+
+    occurrences = index.find(rows, set(targets))
+    for word in sorted(set(targets)):
+        expected = targets.count(word)
+        if len(occurrences.get(word, [])) > expected:
+            report.duplicates[word] = occurrences[word]
+    return report
+
+
+def check_levels(levels: list[LevelData], words_by_category: dict[str, list[str]]) -> list[LevelReport]:
+    """Checks every level, building each category index once.
+
+    Levels of a category missing from `words_by_category` get an index of
+    their own targets.
+    """
+    indexes: dict[str, WordIndex] = {}
+    reports = []
+    for level in levels:
+        if level.category_id not in words_by_category:
+            index = WordIndex([p.normalized_word for p in level.placements])
+        elif level.category_id not in indexes:
+            index = indexes[level.category_id] = WordIndex(words_by_category[level.category_id])
+        else:
+            index = indexes[level.category_id]
+        reports.append(check_level(level, index))
+    return reports
@@ -0,0 +1,248 @@
+"""
+levelgen/dotnet.py
+------------------
+Ports bit-a-bit das peças do runtime .NET que decidem o resultado do
+LevelGenerator.cs — sem elas o Python gera grids diferentes do jogo:
+
+  • DotNetRandom  — System.Random (gerador subtrativo de Knuth, como no
+                    .NET Framework / Mono usados pelo Unity)
+  • string_hash   — string.GetHashCode do Mono/IL2CPP (h·31 + c em int32)
+  • sort          — Array.Sort(T[], Comparison<T>) — IntroSort do
+                    ArraySortHelper, incluindo a ordem exata das chamadas ao
+                    comparador (o GridGenerator sorteia dentro dele)
+
+Observação: no .NET Core/5+ o GetHashCode de string é randomizado por
+processo; o valor aqui é o do runtime do Unity. Por isso o seed de cada
+nível também é gravado no arquivo gerado.
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+INT32_MIN = -(1 << 31)
+INT32_MAX = (1 << 31) - 1
+
+
+def to_int32(value: int) -> int:
+    """Wraps a Python int like an unchecked C# int."""
+    return ((value + (1 << 31)) & 0xFFFFFFFF) - (1 << 31)
+
+
+# ---------------------------------------------------------------------------
+# System.Random
+# ---------------------------------------------------------------------------
+
+class DotNetRandom:
+    """System.Random(seed) — same sequence as the C# class for the same seed."""
+
+    MBIG = INT32_MAX
+    MSEED = 161803398
+
+    def __init__(self, seed: int):
+        seed_array = [0] * 56
+        subtraction = self.MBIG if seed == INT32_MIN else abs(seed)
+        mj = to_int32(self.MSEED - subtraction)
+        seed_array[55] = mj
+        mk = 1
+        for i in range(1, 55):
+            ii = (21 * i) % 55
+            seed_array[ii] = mk
+            mk = to_int32(mj - mk)
+            if mk < 0:
+                mk += self.MBIG
+            mj = seed_array[ii]
+        for _ in range(4):
+            for i in range(1, 56):
+                seed_array[i] = to_int32(seed_array[i] - seed_array[1 + (i + 30) % 55])
+                if seed_array[i] < 0:
+                    seed_array[i] += self.MBIG
+        self._seed_array = seed_array
+        self._inext = 0
+        self._inextp = 21
+
+    def _internal_sample(self) -> int:
+        inext = self._inext + 1
+        if inext >= 56:
+            inext = 1
+        inextp = self._inextp + 1
+        if inextp >= 56:
+            inextp = 1
+
+        value = to_int32(self._seed_array[inext] - self._seed_array[inextp])
+        if value == self.MBIG:
+            value -= 1
+        if value < 0:
+            value += self.MBIG
+
+        self._seed_array[inext] = value
+        self._inext = inext
+        self._inextp = inextp
+        return value
+
+    def sample(self) -> float:
+        """Random.NextDouble(): float in [0, 1)."""
+        return self._internal_sample() * (1.0 / self.MBIG)
+
+    def next(self, min_or_max: int, max_value: int | None = None) -> int:
+        """Random.Next(maxValue) or Random.Next(minValue, maxValue)."""
+        if max_value is None:
+            if min_or_max < 0:
+                raise ValueError("maxValue deve ser ≥ 0")
+            return int(self.sample() * min_or_max)
+        if min_or_max > max_value:
+            raise ValueError("minValue deve ser ≤ maxValue")
+        span = max_value - min_or_max
+        if span > INT32_MAX:
+            raise ValueError("intervalo maior que int.MaxValue não é suportado")
+        return int(self.sample() * span) + min_or_max
+
+
+# ---------------------------------------------------------------------------
+# string.GetHashCode
+# ---------------------------------------------------------------------------
+
+def string_hash(text: str) -> int:
+    """string.GetHashCode() as computed by Mono/IL2CPP (Unity runtime).
+
+    h = h·31 + c over the UTF-16 code units, wrapping at 32 bits.
+    """
+    data = text.encode("utf-16-le")
+    h = 0
+    for i in range(0, len(data), 2):
+        h = (h * 31 + (data[i] | data[i + 1] << 8)) & 0xFFFFFFFF
+    return to_int32(h)
+
+
+# ---------------------------------------------------------------------------
+# Array.Sort(T[], Comparison<T>)
+# ---------------------------------------------------------------------------
+
+# IntrospectiveSortUtilities.IntrosortSizeThreshold
+INTROSORT_SIZE_THRESHOLD = 16
+
+
+def _floor_log2(n: int) -> int:
+    # Same as IntrospectiveSortUtilities.FloorLog2 (really ⌊log2 n⌋ + 1)
+    result = 0
+    while n >= 1:
+        result += 1
+        n //= 2
+    return result
+
+
+def sort(keys: list[T], comparer: Callable[[T, T], int]) -> None:
+    """Sorts `keys` in place exactly like Array.Sort(keys, comparison).
+
+    The comparer may be inconsistent (random); the call sequence matches
+    .NET so a seeded comparer consumes the same random numbers. Raises
+    ValueError where .NET throws InvalidOperationException ("IComparer.Compare()
+    method returns inconsistent results").
+    """
+    if len(keys) < 2:
+        return
+    try:
+        _intro_sort(keys, 0, len(keys) - 1, 2 * _floor_log2(len(keys)), comparer)
+    except IndexError:
+        raise ValueError("IComparer.Compare() retornou resultados inconsistentes") from None
+
+
+def _swap_if_greater(keys: list[T], comparer: Callable[[T, T], int], a: int, b: int) -> None:
+    if a != b and comparer(keys[a], keys[b]) > 0:
+        keys[a], keys[b] = keys[b], keys[a]
+
+
+def _swap(keys: list[T], i: int, j: int) -> None:
+    if i != j:
+        keys[i], keys[j] = keys[j], keys[i]
+
+
+def _intro_sort(keys: list[T], lo: int, hi: int, depth_limit: int,
+                comparer: Callable[[T, T], int]) -> None:
+    while hi > lo:
+        size = hi - lo + 1
+        if size <= INTROSORT_SIZE_THRESHOLD:
+            if size == 1:
+                return
+            if size == 2:
+                _swap_if_greater(keys, comparer, lo, hi)
+                return
+            if size == 3:
+                _swap_if_greater(keys, comparer, lo, hi - 1)
+                _swap_if_greater(keys, comparer, lo, hi)
+                _swap_if_greater(keys, comparer, hi - 1, hi)
+                return
+            _insertion_sort(keys, lo, hi, comparer)
+            return
+
+        if depth_limit == 0:
+            _heapsort(keys, lo, hi, comparer)
+            return
+        depth_limit -= 1
+
+        p = _pick_pivot_and_partition(keys, lo, hi, comparer)
+        _intro_sort(keys, p + 1, hi, depth_limit, comparer)
+        hi = p - 1
+
+
+def _pick_pivot_and_partition(keys: list[T], lo: int, hi: int,
+                              comparer: Callable[[T, T], int]) -> int:
+    middle = lo + ((hi - lo) >> 1)
+    _swap_if_greater(keys, comparer, lo, middle)
+    _swap_if_greater(keys, comparer, lo, hi)
+    _swap_if_greater(keys, comparer, middle, hi)
+
+    pivot = keys[middle]
+    _swap(keys, middle, hi - 1)
+    left, right = lo, hi - 1
+    while left < right:
+        left += 1
+        while comparer(keys[left], pivot) < 0:
+            left += 1
+        right -= 1
+        while comparer(pivot, keys[right]) < 0:
+            right -= 1
+            if right < 0:
+                # keys[-1] would silently wrap in Python; .NET throws here
+                raise IndexError(right)
+        if left >= right:
+            break
+        _swap(keys, left, right)
+
+    _swap(keys, left, hi - 1)
+    return left
+
+
+def _insertion_sort(keys: list[T], lo: int, hi: int,
+                    comparer: Callable[[T, T], int]) -> None:
+    for i in range(lo, hi):
+        j = i
+        t = keys[i + 1]
+        while j >= lo and comparer(t, keys[j]) < 0:
+            keys[j + 1] = keys[j]
+            j -= 1
+        keys[j + 1] = t
+
+
+def _heapsort(keys: list[T], lo: int, hi: int, comparer: Callable[[T, T], int]) -> None:
+    n = hi - lo + 1
+    for i in range(n // 2, 0, -1):
+        _down_heap(keys, i, n, lo, comparer)
+    for i in range(n, 1, -1):
+        _swap(keys, lo, lo + i - 1)
+        _down_heap(keys, 1, i - 1, lo, comparer)
+
+
+def _down_heap(keys: list[T], i: int, n: int, lo: int,
+               comparer: Callable[[T, T], int]) -> None:
+    d = keys[lo + i - 1]
+    while i <= n // 2:
+        child = 2 * i
+        if child < n and comparer(keys[lo + child - 1], keys[lo + child]) < 0:
+            child += 1
+        if not comparer(d, keys[lo + child - 1]) < 0:
+            break
+        keys[lo + i - 1] = keys[lo + child - 1]
+        i = child
+    keys[lo + i - 1] = d
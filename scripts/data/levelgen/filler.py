@@ -0,0 +1,217 @@
+"""
+levelgen/filler.py
+------------------
+Preenchimento das células livres com letras "de português", alternativo ao
+FillEmptyCells (sorteio uniforme de FILL_LETTERS).
+
+  • LetterModel — frequência das letras e dos bigramas (letra → próxima
+    letra) de uma lista de palavras (o ICF, em build_levels.py); cada
+    célula sorteia pelo bigrama a partir da letra à esquerda, misturado
+    com a frequência simples (BIGRAM_WEIGHT)
+  • ForbiddenIndex — autômato (trie + links de falha) das palavras
+    proibidas e das suas inversas: todas as palavras das categorias e a
+    lista de bloqueio. A cada letra gravada, as quatro linhas que passam
+    pela célula (→, ↓, ↘, ↙ — com as inversas, as oito direções) são
+    checadas só no trecho já preenchido em volta dela
+  • retrocesso local: se nenhuma letra serve numa célula, as anteriores
+    (até MAX_BACKTRACK células) trocam de letra; esgotado o orçamento, fica
+    a letra mais provável e a célula é contada em FillStats.forced
+
+Mesmo grid + mesmo seed → mesmas letras (System.Random, portável p/ C#).
+As células das palavras posicionadas nunca mudam.
+"""
+
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from aho_corasick import AhoCorasick
+
+from .dotnet import DotNetRandom
+from .grid import EMPTY, FILL_LETTERS, GridData
+from .level import MIN_WORD_LENGTH, LevelData
+
+
+# Share of the bigram (vs. single-letter) frequency in each draw
+BIGRAM_WEIGHT = 0.7
+
+# Filler cells that may be revisited when a cell has no acceptable letter
+MAX_BACKTRACK = 6
+
+# Letters tried past the furthest cell reached before forcing a letter
+MAX_TRIES = 2_000
+
+# Lines checked through each cell: →, ↓, ↘, ↙ (reversed patterns cover ←, ↑, ↖, ↗)
+LINE_DELTAS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+_INDEX = {letter: i for i, letter in enumerate(FILL_LETTERS)}
+
+
+class LetterModel:
+    """Letter and bigram frequencies; weights(prev) blends both for one draw."""
+
+    def __init__(self, unigram: list[float], bigram: list[list[float]]):
+        self.unigram = unigram
+        self.bigram = bigram
+        # Context None (no letter to the left) plus one per letter
+        self._tables: dict[str | None, tuple[list[float], float, list[str]]] = {}
+        for prev in (None, *FILL_LETTERS):
+            weights = self.weights(prev)
+            cumulative, total = [], 0.0
+            for w in weights:
+                total += w
+                cumulative.append(total)
+            order = [FILL_LETTERS[i] for i in sorted(range(len(weights)), key=lambda i: -weights[i])]
+            self._tables[prev] = (cumulative, total, order)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "LetterModel":
+        """Counts over normalized words (A-Z); add-one smoothing on the bigrams."""
+        size = len(FILL_LETTERS)
+        unigram = [0] * size
+        pairs = [[1] * size for _ in range(size)]
+        for word in words:
+            prev = None
+            for ch in word:
+                i = _INDEX.get(ch)
+                if i is None:
+                    prev = None
+                    continue
+                unigram[i] += 1
+                if prev is not None:
+                    pairs[prev][i] += 1
+                prev = i
+        total = sum(unigram)
+        if not total:
+            raise ValueError("nenhuma letra A-Z para o modelo")
+        return cls(
+            [count / total for count in unigram],
+            [[count / sum(row) for count in row] for row in pairs],
+        )
+
+    def weights(self, prev: str | None) -> list[float]:
+        if prev is None or prev not in _INDEX:
+            return list(self.unigram)
+        row = self.bigram[_INDEX[prev]]
+        return [
+            BIGRAM_WEIGHT * row[i] + (1 - BIGRAM_WEIGHT) * self.unigram[i]
+            for i in range(len(FILL_LETTERS))
+        ]
+
+    def candidates(self, prev: str | None, random: DotNetRandom) -> list[str]:
+        """A weighted draw first, then the other letters from most to least likely."""
+        cumulative, total, order = self._tables[prev if prev in _INDEX else None]
+        first = FILL_LETTERS[min(bisect.bisect_right(cumulative, random.sample() * total),
+                                 len(FILL_LETTERS) - 1)]
+        return [first] + [letter for letter in order if letter != first]
+
+
+class ForbiddenIndex:
+    """Forbidden strings (≥ MIN_WORD_LENGTH letters) in both reading directions."""
+
+    def __init__(self, words: Iterable[str]):
+        words = sorted({w for w in words if len(w) >= MIN_WORD_LENGTH})
+        patterns = sorted(set(words) | {w[::-1] for w in words})
+        self.words = words
+        self.max_length = max((len(w) for w in words), default=0)
+        self._lengths = [len(p) for p in patterns]
+        self._automaton = AhoCorasick(patterns) if patterns else None
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def spans(self, text: str, position: int) -> bool:
+        """Whether some forbidden string in `text` covers index `position`."""
+        if self._automaton is None:
+            return False
+        for pid, end in self._automaton.iter_matches(text):
+            if end - self._lengths[pid] <= position < end:
+                return True
+        return False
+
+
+@dataclass
+class FillStats:
+    cells: int = 0
+    backtracks: int = 0
+    forced: int = 0     # cells left with a forbidden string (budget exhausted)
+
+
+class LetterFiller:
+    """Fills the cells outside the placements under a LetterModel and a ForbiddenIndex."""
+
+    def __init__(self, model: LetterModel, forbidden: ForbiddenIndex, max_backtrack: int = MAX_BACKTRACK):
+        self.model = model
+        self.forbidden = forbidden
+        self.max_backtrack = max_backtrack
+
+    def refill(self, level: LevelData) -> FillStats:
+        """Replaces the filler letters of a generated level, seeded by its seed."""
+        fixed = {cell for p in level.placements for cell in p.cell_positions()}
+        return self.fill(level.grid, fixed, level.seed)
+
+    def fill(self, grid: GridData, fixed: set[tuple[int, int]], seed: int) -> FillStats:
+        """Fills every cell not in `fixed` in row-major order, in place."""
+        random = DotNetRandom(seed)
+        order = [
+            (r, c) for r in range(grid.rows) for c in range(grid.cols) if (r, c) not in fixed
+        ]
+        for r, c in order:
+            grid.cells[r][c] = EMPTY
+
+        stats = FillStats(cells=len(order))
+        options: list[list[str] | None] = [None] * len(order)
+        k = furthest = tries = 0
+        while k < len(order):
+            r, c = order[k]
+            if options[k] is None:
+                options[k] = self.model.candidates(grid.cells[r][c - 1] if c else None, random)
+            pending = options[k]
+            while pending:
+                grid.cells[r][c] = pending.pop(0)
+                tries += 1
+                if not self._forms_forbidden(grid, r, c):
+                    break
+            else:
+                grid.cells[r][c] = EMPTY
+                options[k] = None
+                if k > 0 and furthest - k < self.max_backtrack and tries < MAX_TRIES:
+                    stats.backtracks += 1
+                    k -= 1
+                    continue
+                # Budget spent: keep the most likely letter and move on
+                grid.cells[r][c] = self.model.candidates(grid.cells[r][c - 1] if c else None, random)[0]
+                stats.forced += 1
+            k += 1
+            if k > furthest:
+                furthest, tries = k, 0
+        return stats
+
+    def _forms_forbidden(self, grid: GridData, r: int, c: int) -> bool:
+        reach = self.forbidden.max_length - 1
+        if reach < MIN_WORD_LENGTH - 1:
+            return False
+        cells = grid.cells
+        for d_row, d_col in LINE_DELTAS:
+            before = []
+            rr, cc = r - d_row, c - d_col
+            while len(before) < reach and 0 <= rr < grid.rows and 0 <= cc < grid.cols:
+                letter = cells[rr][cc]
+                if letter == EMPTY:
+                    break
+                before.append(letter)
+                rr, cc = rr - d_row, cc - d_col
+            after = []
+            rr, cc = r + d_row, c + d_col
+            while len(after) < reach and 0 <= rr < grid.rows and 0 <= cc < grid.cols:
+                letter = cells[rr][cc]
+                if letter == EMPTY:
+                    break
+                after.append(letter)
+                rr, cc = rr + d_row, cc + d_col
+            if len(before) + len(after) + 1 < MIN_WORD_LENGTH:
+                continue
+            text = "".join(reversed(before)) + cells[r][c] + "".join(after)
+            if self.forbidden.spans(text, len(before)):
+                return True
+        return False
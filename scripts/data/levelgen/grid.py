@@ -0,0 +1,185 @@
+"""
+levelgen/grid.py
+----------------
+Port de Core/Domain/Grid (GridData, WordPlacement, WordPlacer e
+GridGenerator) com o mesmo consumo de números aleatórios do C#.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+from .dotnet import DotNetRandom, sort
+
+
+FILL_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# GridData.GetLetter() of an empty cell
+EMPTY = "\0"
+
+
+class Direction(IntEnum):
+    """Same order/values as Direction.cs (JsonUtility serializes the int)."""
+    HORIZONTAL = 0     # →
+    VERTICAL = 1       # ↓
+    DIAGONAL_DOWN = 2  # ↘
+
+
+DIRECTIONS = list(Direction)
+
+# WordPlacer.GetDirectionDeltas
+DELTAS = {
+    Direction.HORIZONTAL: (0, 1),
+    Direction.VERTICAL: (1, 0),
+    Direction.DIAGONAL_DOWN: (1, 1),
+}
+
+
+class GridData:
+    """Letter matrix; EMPTY marks cells not filled yet."""
+
+    def __init__(self, rows: int, cols: int):
+        if rows <= 0 or cols <= 0:
+            raise ValueError(f"dimensões do grid devem ser positivas: {rows}x{cols}")
+        self.rows = rows
+        self.cols = cols
+        self.cells = [[EMPTY] * cols for _ in range(rows)]
+
+    def is_in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def get_letter(self, row: int, col: int) -> str:
+        return self.cells[row][col] if self.is_in_bounds(row, col) else EMPTY
+
+    def count_empty(self) -> int:
+        return sum(row.count(EMPTY) for row in self.cells)
+
+    def row_strings(self) -> list[str]:
+        """One string per row ('.' for empty cells)."""
+        return ["".join(c if c != EMPTY else "." for c in row) for row in self.cells]
+
+    def __str__(self) -> str:
+        return "\n".join(" ".join(row) for row in self.row_strings())
+
+
+@dataclass(frozen=True)
+class WordPlacement:
+    normalized_word: str
+    display_word: str
+    start_row: int
+    start_col: int
+    direction: Direction
+
+    @property
+    def length(self) -> int:
+        return len(self.normalized_word)
+
+    def cell_positions(self) -> list[tuple[int, int]]:
+        d_row, d_col = DELTAS[self.direction]
+        return [
+            (self.start_row + i * d_row, self.start_col + i * d_col)
+            for i in range(self.length)
+        ]
+
+
+# ---------------------------------------------------------------------------
+# WordPlacer
+# ---------------------------------------------------------------------------
+
+def can_place(grid: GridData, word: str, start_row: int, start_col: int,
+              direction: Direction) -> bool:
+    """Fits in bounds and every cell is empty or already holds the same letter."""
+    if not word:
+        return False
+    d_row, d_col = DELTAS[direction]
+    for i, letter in enumerate(word):
+        row = start_row + i * d_row
+        col = start_col + i * d_col
+        if not grid.is_in_bounds(row, col):
+            return False
+        existing = grid.cells[row][col]
+        if existing != EMPTY and existing != letter:
+            return False
+    return True
+
+
+def place(grid: GridData, word: str, start_row: int, start_col: int,
+          direction: Direction) -> None:
+    d_row, d_col = DELTAS[direction]
+    for i, letter in enumerate(word):
+        grid.cells[start_row + i * d_row][start_col + i * d_col] = letter
+
+
+def try_place(grid: GridData, word: str, start_row: int, start_col: int,
+              direction: Direction) -> bool:
+    if not can_place(grid, word, start_row, start_col, direction):
+        return False
+    place(grid, word, start_row, start_col, direction)
+    return True
+
+
+def get_max_start(grid: GridData, word_length: int, direction: Direction) -> tuple[int, int]:
+    """Largest valid start (row, col); negative when the word does not fit."""
+    d_row, d_col = DELTAS[direction]
+    max_row = grid.rows - (1 if d_row == 0 else word_length * d_row)
+    max_col = grid.cols - (1 if d_col == 0 else word_length * d_col)
+    return max_row, max_col
+
+
+# ---------------------------------------------------------------------------
+# GridGenerator
+# ---------------------------------------------------------------------------
+
+class GridGenerator:
+    """GridGenerator.cs: random trial placement, words that never fit are dropped."""
+
+    def __init__(self, seed: int):
+        self._random = DotNetRandom(seed)
+
+    def generate(
+        self, rows: int, cols: int,
+        normalized_words: list[str], display_words: list[str],
+    ) -> tuple[GridData, list[WordPlacement]]:
+        if len(normalized_words) != len(display_words):
+            raise ValueError("normalized_words e display_words devem ter o mesmo tamanho")
+
+        grid = GridData(rows, cols)
+        placements = []
+        for idx in self._shuffled_length_order(normalized_words):
+            placement = self._try_place_word(grid, normalized_words[idx], display_words[idx])
+            if placement is not None:
+                placements.append(placement)
+
+        self._fill_empty_cells(grid)
+        return grid, placements
+
+    def _try_place_word(self, grid: GridData, normalized: str, display: str) -> WordPlacement | None:
+        max_attempts = grid.rows * grid.cols * len(DIRECTIONS)
+        for _ in range(max_attempts):
+            direction = DIRECTIONS[self._random.next(len(DIRECTIONS))]
+            max_row, max_col = get_max_start(grid, len(normalized), direction)
+            if max_row < 0 or max_col < 0:
+                continue
+
+            start_row = self._random.next(max_row + 1)
+            start_col = self._random.next(max_col + 1)
+            if try_place(grid, normalized, start_row, start_col, direction):
+                return WordPlacement(normalized, display, start_row, start_col, direction)
+        return None
+
+    def _fill_empty_cells(self, grid: GridData) -> None:
+        for row in grid.cells:
+            for c, letter in enumerate(row):
+                if letter == EMPTY:
+                    row[c] = FILL_LETTERS[self._random.next(len(FILL_LETTERS))]
+
+    def _shuffled_length_order(self, words: list[str]) -> list[int]:
+        """Longest first; ties broken by a random comparer, as in C#."""
+        def compare(a: int, b: int) -> int:
+            cmp = (len(words[b]) > len(words[a])) - (len(words[b]) < len(words[a]))
+            if cmp != 0:
+                return cmp
+            return self._random.next(-1, 2)
+
+        indices = list(range(len(words)))
+        sort(indices, compare)
+        return indices
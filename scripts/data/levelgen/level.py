@@ -0,0 +1,180 @@
+"""
+levelgen/level.py
+-----------------
+Port de Core/Domain/Level (DifficultyConfig, LevelData, LevelGenerator).
+Mesmo categoryId + levelNumber → mesmo seed → mesmo grid que o jogo.
+"""
+
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .dotnet import DotNetRandom, string_hash
+from .grid import GridData, GridGenerator, WordPlacement
+
+
+# LevelManager.LEVELS_PER_CATEGORY
+LEVELS_PER_CATEGORY = 15
+
+MIN_WORD_LENGTH = 3
+
+# Challenge mode (ChallengeSelectScreen / LevelManager.StartChallengeLevel)
+CHALLENGE_SIZES = [(20, 10), (20, 14), (20, 16)]
+CHALLENGE_WORDS = 10
+CHALLENGE_ID = "desafio"
+
+
+@dataclass(frozen=True)
+class DifficultyConfig:
+    grid_rows: int
+    grid_cols: int
+    min_words: int
+    max_words: int
+
+    @staticmethod
+    def for_level(level_number: int) -> "DifficultyConfig":
+        if level_number <= 5:
+            return DifficultyConfig(8, 8, 5, 6)
+        if level_number <= 10:
+            return DifficultyConfig(10, 10, 6, 8)
+        return DifficultyConfig(12, 12, 8, 10)
+
+
+@dataclass
+class LevelData:
+    category_id: str
+    level_number: int
+    seed: int
+    difficulty: DifficultyConfig
+    grid: GridData
+    placements: list[WordPlacement]
+    # Words drawn for the level whose placement failed (the C# drops them silently)
+    dropped: list[str]
+
+
+def selection_widths() -> list[int]:
+    """Every max_word_length SelectWords is called with: the grid widths of
+    DifficultyConfig.for_level (8, 10, 12) and max(rows, cols) of the
+    challenge sizes (20).
+    """
+    widths = {DifficultyConfig.for_level(n).grid_cols for n in range(1, LEVELS_PER_CATEGORY + 1)}
+    widths.update(max(rows, cols) for rows, cols in CHALLENGE_SIZES)
+    return sorted(widths)
+
+
+def generate_seed(category_id: str, level_number: int) -> int:
+    """LevelGenerator.GenerateSeed: f"{categoryId}_{levelNumber}".GetHashCode()."""
+    return string_hash(f"{category_id}_{level_number}")
+
+
+def select_words(
+    random: DotNetRandom,
+    all_normalized: list[str],
+    all_display: list[str],
+    count: int,
+    max_word_length: int,
+) -> tuple[list[str], list[str]]:
+    """Fisher-Yates over the words that fit the grid, first `count` taken."""
+    valid = [
+        i for i, w in enumerate(all_normalized)
+        if MIN_WORD_LENGTH <= len(w) <= max_word_length
+    ]
+    return select_from_bucket(random, valid, all_normalized, all_display, count)
+
+
+def select_from_bucket(
+    random: DotNetRandom,
+    bucket: list[int] | tuple[int, ...],
+    all_normalized: list[str],
+    all_display: list[str],
+    count: int,
+) -> tuple[list[str], list[str]]:
+    """select_words over a precomputed bucket (see word_shards.Shard.selectable).
+
+    The bucket must hold the positions of the words that fit the grid in
+    their original order — exactly the validIndices list SelectWords
+    builds — so the same random draws pick the same words.
+    """
+    valid = list(bucket)
+    count = min(count, len(valid))
+
+    for i in range(len(valid) - 1, 0, -1):
+        j = random.next(i + 1)
+        valid[i], valid[j] = valid[j], valid[i]
+
+    chosen = valid[:count]
+    return [all_normalized[i] for i in chosen], [all_display[i] for i in chosen]
+
+
+def generate_level(
+    category_id: str,
+    level_number: int,
+    normalized_words: list[str],
+    display_words: list[str],
+    seed: int | None = None,
+    generator: Callable[[int], GridGenerator] = GridGenerator,
+) -> LevelData:
+    """LevelGenerator.Generate. `seed` overrides the string-hash seed;
+    `generator` builds the grid placer from the seed (e.g. ConstraintPacker).
+    """
+    if not category_id:
+        raise ValueError("category_id não pode ser vazio")
+    if not normalized_words:
+        raise ValueError("normalized_words não pode ser vazio")
+    if len(normalized_words) != len(display_words):
+        raise ValueError("normalized_words e display_words devem ter o mesmo tamanho")
+
+    if seed is None:
+        seed = generate_seed(category_id, level_number)
+    difficulty = DifficultyConfig.for_level(level_number)
+
+    random = DotNetRandom(seed)
+    word_count = random.next(difficulty.min_words, difficulty.max_words + 1)
+    selected_norm, selected_disp = select_words(
+        random, normalized_words, display_words, word_count, difficulty.grid_cols
+    )
+
+    grid, placements = generator(seed).generate(
+        difficulty.grid_rows, difficulty.grid_cols, selected_norm, selected_disp
+    )
+    return LevelData(
+        category_id, level_number, seed, difficulty, grid, placements,
+        _dropped(selected_norm, placements),
+    )
+
+
+def generate_challenge(
+    normalized_words: list[str],
+    display_words: list[str],
+    rows: int,
+    cols: int,
+    seed: int,
+    word_count: int = CHALLENGE_WORDS,
+    generator: Callable[[int], GridGenerator] = GridGenerator,
+) -> LevelData:
+    """LevelManager.StartChallengeLevel for a given seed (the game uses TickCount).
+
+    The pool is desafio first, then every regular category (see
+    catalog.challenge_pool); words longer than max(rows, cols) are skipped.
+    """
+    difficulty = DifficultyConfig(rows, cols, word_count, word_count)
+    random = DotNetRandom(seed)
+    selected_norm, selected_disp = select_words(
+        random, normalized_words, display_words, word_count, max(rows, cols)
+    )
+    grid, placements = generator(seed).generate(rows, cols, selected_norm, selected_disp)
+    return LevelData(
+        CHALLENGE_ID, 1, seed, difficulty, grid, placements,
+        _dropped(selected_norm, placements),
+    )
+
+
+def _dropped(selected: list[str], placements: list[WordPlacement]) -> list[str]:
+    placed = Counter(p.normalized_word for p in placements)
+    dropped = []
+    for w in selected:
+        if placed[w]:
+            placed[w] -= 1
+        else:
+            dropped.append(w)
+    return dropped
@@ -0,0 +1,231 @@
+"""
+levelgen/packer.py
+------------------
+Posicionador por restrições — alternativa ao sorteio com repetição do
+GridGenerator (até linhas×colunas×3 tentativas por palavra, palavra
+descartada se todas falharem).
+
+  • índice de slots: todos os (início, direção) que cabem no grid, por
+    tamanho de palavra (compartilhado e memoizado), mais o índice
+    célula → slots; a ordem de desempate vem do seed (System.Random,
+    portável p/ C#)
+  • verificação adiante: cada letra gravada bloqueia, em O(1) por slot
+    afetado, os slots das outras palavras que pedem outra letra naquela célula
+  • a palavra com menos slots livres vai primeiro (mais restrita); empate →
+    a mais longa
+  • slots com mais letras em comum com o grid são tentados antes (favorece
+    cruzamentos); slot totalmente coberto por outra palavra é proibido
+  • retrocesso (backtracking) limitado a max_nodes nós; se o limite estoura,
+    fica o melhor posicionamento parcial encontrado
+
+Mesmo seed + mesmas palavras → mesmo grid. Interface igual à do
+GridGenerator, então serve de `generator` para generate_level().
+"""
+
+from functools import lru_cache
+from math import gcd
+
+from .dotnet import DotNetRandom
+from .grid import (
+    DELTAS,
+    DIRECTIONS,
+    EMPTY,
+    FILL_LETTERS,
+    Direction,
+    GridData,
+    WordPlacement,
+    get_max_start,
+)
+
+
+# Search nodes before giving up on a complete placement
+MAX_NODES = 5_000
+
+
+class _SearchBudgetExceeded(Exception):
+    pass
+
+
+class ConstraintPacker:
+    """Deterministic most-constrained-first placer with backtracking."""
+
+    def __init__(self, seed: int, max_nodes: int = MAX_NODES):
+        self._random = DotNetRandom(seed)
+        self._max_nodes = max_nodes
+
+    def generate(
+        self, rows: int, cols: int,
+        normalized_words: list[str], display_words: list[str],
+    ) -> tuple[GridData, list[WordPlacement]]:
+        if len(normalized_words) != len(display_words):
+            raise ValueError("normalized_words e display_words devem ter o mesmo tamanho")
+
+        grid = GridData(rows, cols)
+        state = _Search(grid, normalized_words, self._random, self._max_nodes)
+        chosen = state.run()
+
+        placements = []
+        for w, slot in chosen:
+            start, direction = state.slot_origin[w][slot]
+            for cell, letter in zip(state.slots[w][slot], normalized_words[w]):
+                grid.cells[cell // cols][cell % cols] = letter
+            placements.append(WordPlacement(
+                normalized_words[w], display_words[w], start // cols, start % cols, direction
+            ))
+
+        for row in grid.cells:
+            for c, letter in enumerate(row):
+                if letter == EMPTY:
+                    row[c] = FILL_LETTERS[self._random.next(len(FILL_LETTERS))]
+        return grid, placements
+
+
+@lru_cache(maxsize=256)
+def _geometry(rows: int, cols: int, length: int) -> tuple[
+    tuple[tuple[int, ...], ...], tuple[tuple[int, Direction], ...], dict[int, tuple[tuple[int, int], ...]]
+]:
+    """Slots for a word length, shared by every word of that length.
+
+    Returns (cells per slot, (start cell, direction) per slot,
+    cell → ((slot, letter position), ...)).
+    """
+    grid = GridData(rows, cols)
+    slots, origin = [], []
+    for direction in DIRECTIONS:
+        max_row, max_col = get_max_start(grid, length, direction)
+        d_row, d_col = DELTAS[direction]
+        step = d_row * cols + d_col
+        for r in range(max_row + 1):
+            for c in range(max_col + 1):
+                start = r * cols + c
+                slots.append(tuple(start + i * step for i in range(length)))
+                origin.append((start, direction))
+
+    index: dict[int, list[tuple[int, int]]] = {}
+    for s, cells in enumerate(slots):
+        for pos, cell in enumerate(cells):
+            index.setdefault(cell, []).append((s, pos))
+    return tuple(slots), tuple(origin), {cell: tuple(v) for cell, v in index.items()}
+
+
+class _Search:
+    """Slot index + forward-checking state for one grid."""
+
+    def __init__(self, grid: GridData, words: list[str], random: DotNetRandom, max_nodes: int):
+        self.words = words
+        self.cells = [EMPTY] * (grid.rows * grid.cols)
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+        geometry = [_geometry(grid.rows, grid.cols, len(w)) for w in words]
+        self.slots = [g[0] for g in geometry]
+        self.slot_origin = [g[1] for g in geometry]
+        self.cell_slots = [g[2] for g in geometry]
+
+        # Seeded tie order between equally good slots: an affine permutation
+        # rank(s) = (a·s + b) mod n — two draws per word instead of n
+        self.order: list[list[int]] = []
+        self.rank: list[list[int]] = []
+        for slots in self.slots:
+            n = len(slots)
+            a = random.next(1, n) if n > 1 else 1
+            while gcd(a, n) != 1:
+                a += 1
+            b = random.next(n) if n else 0
+            rank = [(a * s + b) % n for s in range(n)]
+            order = [0] * n
+            for s, r in enumerate(rank):
+                order[r] = s
+            self.rank.append(rank)
+            self.order.append(order)
+
+        self.blocked = [[0] * len(s) for s in self.slots]
+        self.free = [len(s) for s in self.slots]
+        self.placed = [False] * len(words)
+        self.filled: list[int] = []
+        self.chosen: list[tuple[int, int]] = []
+        self.best: list[tuple[int, int]] = []
+
+    def run(self) -> list[tuple[int, int]]:
+        try:
+            if self._search():
+                return list(self.chosen)
+        except _SearchBudgetExceeded:
+            pass
+        return self.best
+
+    # -- search ---------------------------------------------------------------
+
+    def _pick_word(self) -> int:
+        return min(
+            (w for w in range(len(self.words)) if not self.placed[w]),
+            key=lambda w: (self.free[w], -len(self.words[w]), w),
+        )
+
+    def _candidates(self, w: int) -> list[int]:
+        """Free slots, most shared letters first, then in the seeded order."""
+        word, blocked, index = self.words[w], self.blocked[w], self.cell_slots[w]
+        overlap: dict[int, int] = {}
+        for cell in self.filled:
+            letter = self.cells[cell]
+            for s, pos in index.get(cell, ()):
+                if word[pos] == letter and not blocked[s]:
+                    overlap[s] = overlap.get(s, 0) + 1
+
+        rank = self.rank[w]
+        crossing = sorted(
+            (s for s, count in overlap.items() if count < len(word)),
+            key=lambda s: (-overlap[s], rank[s]),
+        )
+        return crossing + [s for s in self.order[w] if not blocked[s] and s not in overlap]
+
+    def _search(self) -> bool:
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise _SearchBudgetExceeded
+        if len(self.chosen) > len(self.best):
+            self.best = list(self.chosen)
+        if len(self.chosen) == len(self.words):
+            return True
+
+        w = self._pick_word()
+        for s in self._candidates(w):
+            undo = self._place(w, s)
+            if self._search():
+                return True
+            self._unplace(w, undo)
+        return False
+
+    def _place(self, w: int, s: int) -> tuple[list[int], list[tuple[int, int]]]:
+        filled, newly_blocked = [], []
+        for cell, letter in zip(self.slots[w][s], self.words[w]):
+            if self.cells[cell] != EMPTY:
+                continue
+            self.cells[cell] = letter
+            filled.append(cell)
+            for u, other in enumerate(self.words):
+                if self.placed[u] or u == w:
+                    continue
+                blocked = self.blocked[u]
+                for slot, pos in self.cell_slots[u].get(cell, ()):
+                    if other[pos] != letter:
+                        if not blocked[slot]:
+                            self.free[u] -= 1
+                        blocked[slot] += 1
+                        newly_blocked.append((u, slot))
+        self.placed[w] = True
+        self.filled.extend(filled)
+        self.chosen.append((w, s))
+        return filled, newly_blocked
+
+    def _unplace(self, w: int, undo: tuple[list[int], list[tuple[int, int]]]) -> None:
+        filled, newly_blocked = undo
+        for u, slot in newly_blocked:
+            self.blocked[u][slot] -= 1
+            if not self.blocked[u][slot]:
+                self.free[u] += 1
+        for cell in filled:
+            self.cells[cell] = EMPTY
+        del self.filled[len(self.filled) - len(filled):]
+        self.placed[w] = False
+        self.chosen.pop()
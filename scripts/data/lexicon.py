@@ -0,0 +1,270 @@
+"""
+lexicon.py
+----------
+Léxico indexado (SQLite) com todas as fontes de Data/ mescladas — gerado
+por build_lexicon.py — para responder "esta palavra existe, e de onde
+vem?" sem reler centenas de milhares de linhas de texto.
+
+Tabela words (uma linha por palavra normalizada):
+
+  word     TEXT  PK   forma normalizada (A-Z)
+  display  TEXT       forma de exibição (maiúsculas com acento, ToDisplay)
+  length   INT        len(word)
+  freq     REAL       frequência ICF (menor = mais comum; NULL fora do ICF)
+  sources  INT        máscara de bits das fontes (SOURCE_BITS)
+
+Índices: (length, freq) para filtros por tamanho/frequência; a chave
+primária atende as consultas por palavra e por prefixo.
+
+Uso:
+  from lexicon import Lexicon
+  with Lexicon.open() as lex:
+      lex.lookup("ação")                        → LexiconEntry(...)
+      lex.words(length=5, sources=["icf"], max_freq=18.0)
+
+  python scripts/data/lexicon.py lookup ação mesa
+  python scripts/data/lexicon.py words --length 4 --source dic --pattern "C?S?"
+"""
+
+import argparse
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from text_normalizer import normalize
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LEXICON_FILE = REPO_ROOT / ".cache" / "lexicon" / "lexicon.sqlite"
+
+LEXICON_VERSION = 1
+
+# Stable bit of each source (build_termo.SOURCES keys); stored masks depend on it
+SOURCE_BITS = {
+    "icf":        1 << 0,
+    "conj":       1 << 1,
+    "verbos":     1 << 2,
+    "dic":        1 << 3,
+    "affix":      1 << 4,
+    "municipios": 1 << 5,
+    "paises":     1 << 6,
+    "estados":    1 << 7,
+}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE words (
+    word    TEXT PRIMARY KEY,
+    display TEXT NOT NULL,
+    length  INTEGER NOT NULL,
+    freq    REAL,
+    sources INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX words_length_freq ON words (length, freq);
+"""
+
+
+class LexiconError(Exception):
+    """Raised when the lexicon is missing or was built by another version."""
+
+
+def source_mask(names: Iterable[str]) -> int:
+    """Bitmask of source names; unknown names raise ValueError."""
+    mask = 0
+    for name in names:
+        if name not in SOURCE_BITS:
+            raise ValueError(f"fonte desconhecida: {name!r} (disponíveis: {', '.join(SOURCE_BITS)})")
+        mask |= SOURCE_BITS[name]
+    return mask
+
+
+def source_names(mask: int) -> tuple[str, ...]:
+    return tuple(name for name, bit in SOURCE_BITS.items() if mask & bit)
+
+
+@dataclass(frozen=True)
+class LexiconEntry:
+    word: str
+    display: str
+    length: int
+    freq: float | None
+    sources: tuple[str, ...]
+
+
+class Lexicon:
+    """Read-only queries over a lexicon built by build_lexicon.py."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._db = connection
+
+    @classmethod
+    def open(cls, path: Path = LEXICON_FILE) -> "Lexicon":
+        if not path.exists():
+            raise LexiconError(f"{path} não existe — rode build_lexicon.py")
+        db = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.DatabaseError as e:
+            db.close()
+            raise LexiconError(f"{path}: não é um léxico válido — {e}") from None
+        if row is None or int(row[0]) != LEXICON_VERSION:
+            db.close()
+            raise LexiconError(f"{path}: versão {row and row[0]} ≠ {LEXICON_VERSION} — rode build_lexicon.py")
+        return cls(db)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "Lexicon":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def meta(self) -> dict[str, str]:
+        return dict(self._db.execute("SELECT key, value FROM meta"))
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word) is not None
+
+    def lookup(self, word: str) -> LexiconEntry | None:
+        """The entry of `word` (normalized first), or None."""
+        row = self._db.execute(
+            "SELECT word, display, length, freq, sources FROM words WHERE word = ?",
+            (normalize(word),),
+        ).fetchone()
+        if row is None:
+            return None
+        return LexiconEntry(*row[:4], source_names(row[4]))
+
+    def _where(
+        self,
+        length: int | None,
+        sources: Iterable[str] | None,
+        exclude: Iterable[str] | None,
+        max_freq: float | None,
+        prefix: str | None,
+        pattern: str | None,
+    ) -> tuple[str, list]:
+        clauses, params = [], []
+        if length is not None:
+            clauses.append("length = ?")
+            params.append(length)
+        if sources:
+            clauses.append("sources & ? != 0")
+            params.append(source_mask(sources))
+        if exclude:
+            clauses.append("sources & ? = 0")
+            params.append(source_mask(exclude))
+        if max_freq is not None:
+            clauses.append("freq <= ?")
+            params.append(max_freq)
+        if prefix:
+            # Range over the primary key instead of LIKE (uses the index)
+            prefix = normalize(prefix)
+            clauses.append("word >= ? AND word < ?")
+            params += [prefix, prefix + "\x7f"]
+        if pattern:
+            # GLOB: "?" = one letter, "*" = any run, [..] classes; A-Z only
+            clauses.append("word GLOB ?")
+            params.append(pattern.upper())
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def words(
+        self,
+        length: int | None = None,
+        sources: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        max_freq: float | None = None,
+        prefix: str | None = None,
+        pattern: str | None = None,
+        by_freq: bool = False,
+    ) -> Iterator[str]:
+        """Normalized words matching every given filter, alphabetically
+        (or most common first with `by_freq`).
+
+        `sources` keeps words in any of the named sources, `exclude` drops
+        words in any of them.
+        """
+        where, params = self._where(length, sources, exclude, max_freq, prefix, pattern)
+        order = "freq IS NULL, freq, word" if by_freq else "word"
+        for (word,) in self._db.execute(f"SELECT word FROM words{where} ORDER BY {order}", params):
+            yield word
+
+    def count(
+        self,
+        length: int | None = None,
+        sources: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        max_freq: float | None = None,
+        prefix: str | None = None,
+        pattern: str | None = None,
+    ) -> int:
+        """Number of words matching the same filters as words()."""
+        where, params = self._where(length, sources, exclude, max_freq, prefix, pattern)
+        return self._db.execute(f"SELECT COUNT(*) FROM words{where}", params).fetchone()[0]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Consultas ao léxico indexado.")
+    parser.add_argument("--db", type=Path, default=LEXICON_FILE, help="arquivo do léxico")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_lookup = sub.add_parser("lookup", help="mostra as palavras e suas fontes")
+    p_lookup.add_argument("word", nargs="+")
+
+    p_words = sub.add_parser("words", help="lista palavras filtradas")
+    p_words.add_argument("--length", type=int)
+    p_words.add_argument("--source", action="append", choices=list(SOURCE_BITS),
+                         help="presente em alguma destas fontes (repetível)")
+    p_words.add_argument("--exclude", action="append", choices=list(SOURCE_BITS),
+                         help="ausente de todas estas fontes (repetível)")
+    p_words.add_argument("--max-freq", type=float, help="frequência ICF máxima")
+    p_words.add_argument("--prefix")
+    p_words.add_argument("--pattern", help='GLOB sobre a forma normalizada, ex.: "C?S?"')
+    p_words.add_argument("--by-freq", action="store_true", help="mais comuns primeiro")
+    p_words.add_argument("--limit", type=int, default=50, help="máximo listado (0 = todas)")
+    args = parser.parse_args()
+
+    try:
+        lex = Lexicon.open(args.db)
+    except LexiconError as e:
+        print(f"❌ {e}")
+        return 1
+
+    with lex:
+        if args.command == "lookup":
+            missing = 0
+            for word in args.word:
+                entry = lex.lookup(word)
+                if entry is None:
+                    missing += 1
+                    print(f"  ✗ {word}: não encontrada")
+                else:
+                    freq = f"{entry.freq:g}" if entry.freq is not None else "—"
+                    print(f"  ✓ {entry.display:<16} {entry.word:<16} freq {freq:<8} "
+                          f"{', '.join(entry.sources)}")
+            return 1 if missing else 0
+
+        filters = dict(length=args.length, sources=args.source, exclude=args.exclude,
+                       max_freq=args.max_freq, prefix=args.prefix, pattern=args.pattern)
+        total = lex.count(**filters)
+        for i, word in enumerate(lex.words(**filters, by_freq=args.by_freq)):
+            if args.limit and i >= args.limit:
+                break
+            print(word)
+        print(f"  {total:,} palavra(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""
+near_duplicates.py
+------------------
+Detecta quase-duplicatas nos bancos do Caça-Palavras (categorias + desafio),
+que a checagem exata do validate_words (CROSS-DUP) não vê:
+
+  • plural   — GATO / GATOS, ANIMAL / ANIMAIS, LEÃO / LEÕES
+  • gênero   — MENINO / MENINA, PROFESSOR / PROFESSORA, CAMPEÃO / CAMPEOA
+  • flexão   — plural e gênero juntos (GATO / GATAS)
+  • contida  — uma palavra dentro da outra (SOL / GIRASSOL): num nível da
+               categoria, achar a maior destaca a menor
+
+Os pares candidatos vêm de índices, nunca de comparar todos contra todos:
+
+  • índice de radicais (sufixos) — cada palavra é indexada pelos radicais
+    que sobram ao tirar as terminações de plural e de gênero
+    (PLURAL_ENDINGS, GENDER_ENDINGS); palavras que dividem um radical com marcas
+    diferentes formam par. Global, então também acha pares entre
+    categorias (que só se encontram no modo Desafio)
+  • índice de n-gramas (trigramas → palavras) por categoria — as palavras
+    que podem conter W são a interseção das listas dos trigramas de W
+    (a menor primeiro), conferidas com `in`
+
+Os pares de uma categoria viram clusters (união-busca). Gênero por
+terminação é heurístico: só vale com pelo menos MIN_GENDER_STEM letras
+antes da terminação (BOLA / BOLO, CUBA / CUBO, AMOR / AMORA não casam —
+mas GATO / GATA também não). Nenhuma fonte de Data/ marca gênero para
+confirmar os casos curtos, então o validate_words reporta tudo como aviso.
+
+Uso:
+  python scripts/data/near_duplicates.py [--category animais] [--json relatorio.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+
+NGRAM = 3
+
+# Shortest word / stem considered (same as the games' minimum word length)
+MIN_LENGTH = 3
+
+# (ending, replacement) that turn a plural into its singular; "" = already singular
+PLURAL_ENDINGS = [("", ""), ("S", ""), ("ES", ""), ("IS", "L"), ("EIS", "IL"),
+                  ("NS", "M"), ("OES", "AO"), ("AES", "AO")]
+
+# (ending, replacement) that turn a feminine singular into the masculine one
+GENDER_ENDINGS = [("", ""), ("A", "O"), ("ORA", "OR"), ("OA", "AO")]
+
+# Letters required before a gender ending: shorter words pair with unrelated
+# ones far more often than with their own feminine (BOLA / BOLO, AMOR / AMORA)
+MIN_GENDER_STEM = 4
+
+PLURAL, GENDER, INFLECTION, CONTAINED = "plural", "gênero", "flexão", "contida"
+
+# Category label for pairs whose words come from different categories
+CHALLENGE_POOL = "modo Desafio"
+
+
+@dataclass(frozen=True)
+class NearPair:
+    a: str
+    b: str
+    relation: str
+    category_a: str
+    category_b: str
+
+    @property
+    def same_category(self) -> bool:
+        return self.category_a == self.category_b
+
+
+@dataclass
+class NearDuplicates:
+    pairs: list[NearPair] = field(default_factory=list)
+
+    def clusters(self) -> dict[str, list[list[str]]]:
+        """Connected words per category (within-category pairs only)."""
+        parent: dict[tuple[str, str], tuple[str, str]] = {}
+
+        def find(x):
+            while parent.setdefault(x, x) != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for p in self.pairs:
+            if p.same_category:
+                ra, rb = find((p.category_a, p.a)), find((p.category_b, p.b))
+                if ra != rb:
+                    parent[max(ra, rb)] = min(ra, rb)
+
+        groups: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for node in parent:
+            groups[find(node)].append(node[1])
+        by_category: dict[str, list[list[str]]] = defaultdict(list)
+        for (category, _), words in sorted(groups.items()):
+            by_category[category].append(sorted(words))
+        return dict(sorted(by_category.items()))
+
+    @cached_property
+    def _within(self) -> dict[str, list[NearPair]]:
+        by_category: dict[str, list[NearPair]] = defaultdict(list)
+        for p in self.pairs:
+            if p.same_category:
+                by_category[p.category_a].append(p)
+        return by_category
+
+    def relations(self, category: str, words: Iterable[str]) -> list[NearPair]:
+        members = set(words)
+        return [p for p in self._within.get(category, []) if p.a in members]
+
+    def cross_category(self) -> list[NearPair]:
+        return [p for p in self.pairs if not p.same_category]
+
+
+# ---------------------------------------------------------------------------
+# Indexes
+# ---------------------------------------------------------------------------
+
+def inflection_keys(word: str) -> Iterator[tuple[str, bool, bool]]:
+    """(stem, was plural, was feminine) for every way of reading `word` as
+    an inflected form; the word itself is (word, False, False).
+    """
+    seen = set()
+    for p_end, p_rep in PLURAL_ENDINGS:
+        if not word.endswith(p_end):
+            continue
+        singular = word[:len(word) - len(p_end)] + p_rep if p_end else word
+        for g_end, g_rep in GENDER_ENDINGS:
+            if not singular.endswith(g_end):
+                continue
+            if g_end and len(singular) - len(g_end) < MIN_GENDER_STEM:
+                continue
+            stem = singular[:len(singular) - len(g_end)] + g_rep if g_end else singular
+            key = (stem, bool(p_end), bool(g_end))
+            if len(stem) >= MIN_LENGTH and key not in seen:
+                seen.add(key)
+                yield key
+
+
+class NgramIndex:
+    """Character n-gram → ids of the words containing it."""
+
+    def __init__(self, words: list[str], n: int = NGRAM):
+        self.words = words
+        self.n = n
+        postings: dict[str, list[int]] = defaultdict(list)
+        for i, w in enumerate(words):
+            for gram in {w[j:j + n] for j in range(len(w) - n + 1)}:
+                postings[gram].append(i)
+        self._postings = dict(postings)
+
+    def containing(self, word: str) -> Iterator[int]:
+        """Ids of the other words that contain `word` (len(word) ≥ n)."""
+        grams = {word[j:j + self.n] for j in range(len(word) - self.n + 1)}
+        lists = sorted((self._postings.get(g, []) for g in grams), key=len)
+        if not lists or not lists[0]:
+            return
+        candidates = set(lists[0])
+        for other in lists[1:]:
+            candidates.intersection_update(other)
+            if not candidates:
+                return
+        for i in sorted(candidates):
+            candidate = self.words[i]
+            if candidate != word and word in candidate:
+                yield i
+
+
+# ---------------------------------------------------------------------------
+# Detection
+# ---------------------------------------------------------------------------
+
+def _relation(plural_a: bool, feminine_a: bool, plural_b: bool, feminine_b: bool) -> str | None:
+    if plural_a != plural_b and feminine_a == feminine_b:
+        return PLURAL
+    if feminine_a != feminine_b and plural_a == plural_b:
+        return GENDER
+    if plural_a != plural_b and feminine_a != feminine_b:
+        return INFLECTION
+    return None
+
+
+def find_near_duplicates(bank: dict[str, list[str]]) -> NearDuplicates:
+    """Near-duplicate pairs of a {category: normalized words} bank.
+
+    Inflection pairs are searched across the whole bank; "contida" only
+    inside a category (one level never mixes categories, and in the
+    challenge pool short words would pair with thousands of others).
+    Words shorter than MIN_LENGTH and exact duplicates are ignored.
+    """
+    owners: dict[str, list[str]] = defaultdict(list)
+    for category, words in bank.items():
+        for w in dict.fromkeys(words):
+            if len(w) >= MIN_LENGTH:
+                owners[w].append(category)
+
+    # ── Inflections: stem index over every word ──────────────────────
+    stems: dict[str, list[tuple[str, bool, bool]]] = defaultdict(list)
+    for w in owners:
+        for stem, plural, feminine in inflection_keys(w):
+            stems[stem].append((w, plural, feminine))
+
+    found: dict[tuple[str, str, str, str], str] = {}
+    for entries in stems.values():
+        if len(entries) < 2:
+            continue
+        for i, (wa, pa, fa) in enumerate(entries):
+            for wb, pb, fb in entries[i + 1:]:
+                if wa == wb:
+                    continue
+                relation = _relation(pa, fa, pb, fb)
+                if relation is None:
+                    continue
+                a, b = sorted((wa, wb))
+                for ca in owners[a]:
+                    for cb in owners[b]:
+                        found.setdefault((a, b, ca, cb), relation)
+
+    # ── Contained words: n-gram index per category ───────────────────
+    for category, words in bank.items():
+        unique = [w for w in dict.fromkeys(words) if len(w) >= MIN_LENGTH]
+        index = NgramIndex(unique)
+        for w in unique:
+            for i in index.containing(w):
+                a, b = sorted((w, unique[i]))
+                found.setdefault((a, b, category, category), CONTAINED)
+
+    pairs = [NearPair(a, b, relation, ca, cb) for (a, b, ca, cb), relation in sorted(found.items())]
+    return NearDuplicates(pairs)
+
+
+def describe_cluster(result: NearDuplicates, category: str, words: list[str]) -> str:
+    """ "GATA · GATO · GATOS (GATO/GATOS plural, GATA/GATO gênero)"-style line."""
+    links = ", ".join(f"{p.a}/{p.b} {p.relation}" for p in result.relations(category, words))
+    return f"{' · '.join(words)} ({links})"
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    from levelgen import load_categories, load_desafio
+
+    parser = argparse.ArgumentParser(description="Quase-duplicatas entre as palavras das categorias.")
+    parser.add_argument("--category", action="append", metavar="ID",
+                        help="mostra só estas categorias (repetível; o índice usa todas)")
+    parser.add_argument("--json", type=Path, metavar="ARQ", help="grava pares e clusters em JSON")
+    args = parser.parse_args()
+
+    categories = load_categories()
+    desafio = load_desafio()
+    bank = {c.category_id: c.normalized for c in categories}
+    if desafio:
+        bank[desafio.category_id] = desafio.normalized
+
+    started = time.perf_counter()
+    result = find_near_duplicates(bank)
+    elapsed = time.perf_counter() - started
+
+    print("=" * 60)
+    print("🧬 Quase-duplicatas — categorias + desafio")
+    print("=" * 60)
+    clusters = result.clusters()
+    for category in bank:
+        if args.category and category not in args.category:
+            continue
+        groups = clusters.get(category, [])
+        print(f"\n📄 {category}: {len(bank[category])} palavras, {len(groups)} cluster(s)")
+        for words in groups:
+            print(f"   ⚠️  {describe_cluster(result, category, words)}")
+
+    cross = result.cross_category()
+    if args.category:
+        cross = [p for p in cross if p.category_a in args.category or p.category_b in args.category]
+    print(f"\n🔀 Entre categorias ({CHALLENGE_POOL}): {len(cross)} par(es)")
+    for p in cross:
+        print(f"   ⚠️  {p.a} ({p.category_a}) ~ {p.b} ({p.category_b}): {p.relation}")
+
+    total = sum(len(set(words)) for words in bank.values())
+    print(f"\n📊 {total:,} palavras, {len(result.pairs):,} par(es) em {elapsed:.2f}s")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({
+            "clusters": clusters,
+            "pairs": [vars(p) for p in result.pairs],
+        }, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"📝 Relatório JSON → {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+packed_words.py
+---------------
+Formato binário compacto para os bancos do Termo BR (words_N / valid_N).
+
+Layout (little-endian):
+
+  offset  tamanho  campo
+  0       4        magic  b"TWRD"
+  4       1        versão (PACKED_VERSION)
+  5       1        tamanho da palavra N
+  6       2        reservado (0)
+  8       4        quantidade de registros
+  12      N × qtd  registros ASCII A-Z, ordenados, sem separador
+
+Cada palavra ocupa exatamente N bytes (contra ~12 no JSON indentado) e a
+busca é binária direto sobre o buffer, sem parse. O arquivo usa a extensão
+.bytes para que o Unity o importe como TextAsset.
+
+Uso:
+  python scripts/data/packed_words.py verify words_5.bytes words_5.json
+  python scripts/data/packed_words.py verify-dir <pasta>   (todos os pares)
+"""
+
+import bisect
+import json
+import struct
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+
+MAGIC = b"TWRD"
+PACKED_VERSION = 1
+HEADER = struct.Struct("<4sBBHI")
+
+PACKED_SUFFIX = ".bytes"
+
+
+class PackedFormatError(ValueError):
+    """Raised when a packed file is truncated, corrupt or has an unknown version."""
+
+
+def encode_words(words: Iterable[str], length: int) -> bytes:
+    """Serializes `words` (all with `length` letters A-Z) into the packed layout."""
+    records = sorted(set(words))
+    for w in records:
+        if len(w) != length or not w.isascii() or not w.isalpha() or not w.isupper():
+            raise ValueError(f"palavra inválida para registro de {length} bytes: {w!r}")
+    body = "".join(records).encode("ascii")
+    return HEADER.pack(MAGIC, PACKED_VERSION, length, 0, len(records)) + body
+
+
+def write_packed(path: Path, words: Iterable[str], length: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_words(words, length))
+
+
+class PackedWords:
+    """Read-only view over a packed word file; membership is a binary search."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise PackedFormatError("arquivo menor que o cabeçalho")
+        magic, version, length, _, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise PackedFormatError(f"magic inválido: {magic!r}")
+        if version != PACKED_VERSION:
+            raise PackedFormatError(f"versão {version} não suportada")
+        if length == 0 or len(data) != HEADER.size + length * count:
+            raise PackedFormatError(
+                f"tamanho {len(data)} incompatível com {count} registros de {length} bytes"
+            )
+        self.length = length
+        self._count = count
+        self._body = memoryview(data)[HEADER.size:]
+
+    @classmethod
+    def load(cls, path: Path) -> "PackedWords":
+        return cls(path.read_bytes())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start = index * self.length
+        return bytes(self._body[start:start + self.length])
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self[i].decode("ascii")
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or len(word) != self.length or not word.isascii():
+            return False
+        key = word.encode("ascii")
+        i = bisect.bisect_left(self, key)
+        return i < self._count and self[i] == key
+
+
+# ---------------------------------------------------------------------------
+# Round-trip verification
+# ---------------------------------------------------------------------------
+
+def verify_packed(packed_path: Path, json_path: Path) -> list[str]:
+    """Checks that a packed file holds exactly the words of its JSON twin."""
+    errors: list[str] = []
+    try:
+        packed = PackedWords.load(packed_path)
+    except (OSError, PackedFormatError) as e:
+        return [f"{packed_path.name}: {e}"]
+
+    words = json.loads(json_path.read_text(encoding="utf-8"))["words"]
+    expected = sorted(set(words))
+    actual = list(packed)
+
+    if actual != sorted(actual):
+        errors.append(f"{packed_path.name}: registros fora de ordem")
+    if actual != expected:
+        missing = sorted(set(expected) - set(actual))
+        extra = sorted(set(actual) - set(expected))
+        errors.append(
+            f"{packed_path.name}: difere de {json_path.name} — "
+            f"{len(missing)} ausentes {missing[:5]}, {len(extra)} sobrando {extra[:5]}"
+        )
+    for w in expected:
+        if w not in packed:
+            errors.append(f"{packed_path.name}: busca binária não encontra {w!r}")
+            break
+    return errors
+
+
+def _pairs_in(directory: Path) -> list[tuple[Path, Path]]:
+    return [
+        (packed, packed.with_suffix(".json"))
+        for packed in sorted(directory.glob(f"*{PACKED_SUFFIX}"))
+        if packed.with_suffix(".json").exists()
+    ]
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) == 3 and argv[0] == "verify":
+        pairs = [(Path(argv[1]), Path(argv[2]))]
+    elif len(argv) == 2 and argv[0] == "verify-dir":
+        pairs = _pairs_in(Path(argv[1]))
+    else:
+        print(__doc__)
+        return 2
+
+    failed = 0
+    for packed_path, json_path in pairs:
+        errors = verify_packed(packed_path, json_path)
+        if errors:
+            failed += 1
+            for e in errors:
+                print(f"  ✗ {e}")
+        else:
+            size_json = json_path.stat().st_size
+            size_packed = packed_path.stat().st_size
+            print(f"  ✓ {packed_path.name} = {json_path.name}  ({size_packed:,} vs {size_json:,} bytes)")
+    if not pairs:
+        print("  Nenhum par .bytes/.json encontrado.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,128 @@
+"""
+plural_rules.py
+---------------
+Motor de regras de plural do português para o build_termo.py.
+
+As regras (PLURAL_RULES) são compiladas uma vez numa tabela indexada pela
+terminação da base — a terminação mais longa que casa decide a família,
+como a cadeia de if/elif original — e as formas de cada base são
+calculadas uma única vez e memorizadas, independentemente do tamanho
+pedido. Os tamanhos de base que alcançam um tamanho N saem das próprias
+regras (o quanto cada uma acrescenta à base), então regras novas para 6 e
+7 letras não exigem mudar o resto do pipeline.
+
+Bases implícitas (GATOS → GATO) são extraídas só dos buckets de tamanho
+que podem contê-las, sem varrer a fonte inteira.
+
+Uso:
+  from plural_rules import PLURALS
+  PLURALS.expand("GATO", 5)          → ["GATOS"]
+  PLURALS.base_lengths([5])          → {3, 4}
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+# Implicit bases: w[:b] of words with b+1..b+IMPLICIT_SPAN letters whose
+# b-th letter is one of IMPLICIT_VOWELS (GATOS → GATO, GATINHO ↛ GATI)
+IMPLICIT_SPAN = 4
+IMPLICIT_VOWELS = "AEIOU"
+
+VALID_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+@dataclass(frozen=True)
+class PluralRule:
+    """Bases ending in one of `endings` drop `strip` letters and take each of `suffixes`."""
+    endings: tuple[str, ...]
+    strip: int
+    suffixes: tuple[str, ...]
+
+
+# Order only matters between endings of the same length (first one wins);
+# a longer ending always beats a shorter one. "" is the fallback.
+PLURAL_RULES = [
+    PluralRule(("AL", "EL", "OL", "UL"), 1, ("IS",)),          # oral→orais
+    PluralRule(("IL",), 2, ("IS", "EIS")),                      # funil→funis, fácil→fáceis
+    PluralRule(("EM", "AM", "OM", "UM", "IM"), 1, ("NS",)),     # item→itens
+    PluralRule(("AO",), 2, ("OES", "AES", "AOS")),              # leão→leões, cão→cães, mão→mãos
+    PluralRule(("R", "Z", "S"), 0, ("ES",)),                    # mar→mares
+    PluralRule(("",), 0, ("S",)),                               # gato→gatos
+]
+
+
+class PluralEngine:
+    """Compiled PLURAL_RULES with per-base memoization."""
+
+    def __init__(self, rules: list[PluralRule]):
+        self._by_ending: dict[str, PluralRule] = {}
+        for rule in rules:
+            for ending in rule.endings:
+                self._by_ending.setdefault(ending, rule)
+        self._ending_sizes = sorted({len(e) for e in self._by_ending}, reverse=True)
+        # How many letters each rule adds to the base (0 = same length: never a target)
+        self.growths = sorted({
+            len(suffix) - rule.strip
+            for rule in rules for suffix in rule.suffixes
+            if len(suffix) > rule.strip
+        })
+        self._cache: dict[str, tuple[str, ...]] = {}
+
+    def rule_for(self, base: str) -> PluralRule | None:
+        for size in self._ending_sizes:
+            if size <= len(base):
+                rule = self._by_ending.get(base[len(base) - size:])
+                if rule is not None:
+                    return rule
+        return None
+
+    def forms(self, base: str) -> tuple[str, ...]:
+        """Every plural of `base` (any length, A-Z only), computed once per base."""
+        cached = self._cache.get(base)
+        if cached is None:
+            rule = self.rule_for(base)
+            cached = () if rule is None else tuple(
+                form
+                for form in (base[:len(base) - rule.strip] + s for s in rule.suffixes)
+                if len(form) > len(base) and VALID_CHARS.issuperset(form)
+            )
+            self._cache[base] = cached
+        return cached
+
+    def expand(self, base: str, length: int) -> list[str]:
+        """Plurals of `base` with exactly `length` letters."""
+        return [form for form in self.forms(base) if len(form) == length]
+
+    def base_lengths(self, lengths: Iterable[int]) -> set[int]:
+        """Singular lengths whose plurals can reach any of `lengths`."""
+        return {n - g for n in lengths for g in self.growths if n - g > 0}
+
+    def plurals(self, bases: Iterable[str], length: int) -> dict[str, list[str]]:
+        """{base: its `length`-letter plurals} for the bases that have any."""
+        found = {}
+        for base in bases:
+            forms = self.expand(base, length)
+            if forms:
+                found[base] = forms
+        return found
+
+
+def implicit_span(base_lengths: Iterable[int]) -> set[int]:
+    """Word lengths implicit_bases needs to look at."""
+    return {b + k for b in base_lengths for k in range(1, IMPLICIT_SPAN + 1)}
+
+
+def implicit_bases(buckets: dict[int, set[str]], base_lengths: Iterable[int]) -> dict[int, set[str]]:
+    """Implicit singular bases from length-bucketed words (see implicit_span)."""
+    bases: dict[int, set[str]] = {}
+    for b in base_lengths:
+        found = bases[b] = set()
+        for size in range(b + 1, b + IMPLICIT_SPAN + 1):
+            for w in buckets.get(size, ()):
+                if w[b - 1] in IMPLICIT_VOWELS:
+                    found.add(w[:b])
+    return bases
+
+
+PLURALS = PluralEngine(PLURAL_RULES)
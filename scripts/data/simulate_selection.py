@@ -0,0 +1,155 @@
+"""
+simulate_selection.py
+---------------------
+Prova que o sorteio de palavras a partir dos buckets de seleção dos shards
+(ver word_shards.py) é idêntico ao SelectWords atual, que filtra a
+categoria inteira a cada nível:
+
+  • campanha — todas as categorias × níveis 1–15, com o seed do jogo e
+                mais --samples seeds por nível; bucket da largura do grid
+  • desafio  — grids 20x10 / 20x14 / 20x16, --challenge seeds por tamanho;
+                o bucket do pool é a concatenação dos buckets de largura 20
+                do desafio e das categorias (na ordem do pool), deslocados
+
+Para cada seed as duas seleções consomem o mesmo System.Random; qualquer
+diferença nas palavras sorteadas é reportada e o script sai com código 1.
+
+Uso:
+  python scripts/data/simulate_selection.py [--shards pasta] [--samples 20]
+                                            [--challenge 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from levelgen import (
+    LEVELS_PER_CATEGORY,
+    Category,
+    DifficultyConfig,
+    DotNetRandom,
+    challenge_pool,
+    generate_seed,
+    load_categories,
+    load_desafio,
+    select_from_bucket,
+    select_words,
+    selection_widths,
+    string_hash,
+)
+from levelgen.level import CHALLENGE_SIZES, CHALLENGE_WORDS
+from word_shards import SHARD_SUFFIX, Shard, encode_shard
+
+
+def load_shard(category: Category, shards_dir: Path | None) -> Shard:
+    """The category's shard from `shards_dir`, or encoded in memory from the JSON."""
+    if shards_dir is not None:
+        shard = Shard.load(shards_dir / f"{category.category_id}{SHARD_SUFFIX}")
+        if list(shard) != list(zip(category.normalized, category.display)):
+            raise SystemExit(f"❌ shard de '{category.category_id}' desatualizado — rode build_shards.py")
+        return shard
+    return Shard(encode_shard(category.normalized, category.display, selection_widths()))
+
+
+def pool_bucket(sources: list[tuple[Category, Shard]], max_width: int) -> list[int]:
+    """Selection bucket of the challenge pool, built from the per-category buckets."""
+    bucket, offset = [], 0
+    for category, shard in sources:
+        bucket.extend(offset + i for i in shard.selectable(max_width))
+        offset += len(category.normalized)
+    return bucket
+
+
+def compare(seed: int, words: Category, bucket: list[int] | tuple[int, ...],
+            max_width: int, word_count: int | None = None,
+            difficulty: DifficultyConfig | None = None) -> str | None:
+    """Runs both selections for one seed; returns a description of the mismatch, if any.
+
+    Campaign levels draw the word count from the random first (pass
+    `difficulty`); challenge levels use a fixed `word_count`.
+    """
+    drawn = []
+    for select in (
+        lambda r, n: select_words(r, words.normalized, words.display, n, max_width),
+        lambda r, n: select_from_bucket(r, bucket, words.normalized, words.display, n),
+    ):
+        random = DotNetRandom(seed)
+        count = word_count
+        if difficulty is not None:
+            count = random.next(difficulty.min_words, difficulty.max_words + 1)
+        drawn.append((select(random, count), random.sample()))
+    if drawn[0] != drawn[1]:
+        (full, _), (fast, _) = drawn
+        return f"seed {seed}: {full[0]} ≠ {fast[0]}"
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simula o SelectWords sobre os buckets de seleção.")
+    parser.add_argument("--shards", type=Path,
+                        help="pasta de shards gerada por build_shards.py (padrão: codifica em memória)")
+    parser.add_argument("--samples", type=int, default=20,
+                        help="seeds por nível da campanha (o 1º é o seed do jogo; padrão: 20)")
+    parser.add_argument("--challenge", type=int, default=200,
+                        help="seeds por tamanho de grid do desafio (padrão: 200)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🎲 Simulação do SelectWords — buckets × filtro completo")
+    print("=" * 60)
+
+    categories = load_categories()
+    desafio = load_desafio()
+    shards = {c.category_id: load_shard(c, args.shards) for c in categories}
+    mismatches: list[str] = []
+    checked = 0
+
+    started = time.perf_counter()
+    for category in categories:
+        shard = shards[category.category_id]
+        for n in range(1, LEVELS_PER_CATEGORY + 1):
+            difficulty = DifficultyConfig.for_level(n)
+            bucket = shard.selectable(difficulty.grid_cols)
+            seeds = [generate_seed(category.category_id, n)]
+            seeds += [string_hash(f"{category.category_id}_{n}_{k}") for k in range(1, args.samples)]
+            for seed in seeds:
+                checked += 1
+                problem = compare(seed, category, bucket, difficulty.grid_cols, difficulty=difficulty)
+                if problem:
+                    mismatches.append(f"{category.category_id} #{n} {problem}")
+    print(f"   Campanha: {len(categories)} categorias × {LEVELS_PER_CATEGORY} níveis × "
+          f"{args.samples} seeds")
+
+    pool = challenge_pool(categories, desafio)
+    sources = ([(desafio, load_shard(desafio, args.shards))] if desafio else [])
+    sources += [(c, shards[c.category_id]) for c in categories]
+    for rows, cols in CHALLENGE_SIZES:
+        max_width = max(rows, cols)
+        bucket = pool_bucket(sources, max_width)
+        for seed in range(args.challenge):
+            checked += 1
+            problem = compare(seed, pool, bucket, max_width, word_count=CHALLENGE_WORDS)
+            if problem:
+                mismatches.append(f"desafio {rows}x{cols} {problem}")
+    print(f"   Desafio:  {len(CHALLENGE_SIZES)} tamanhos × {args.challenge} seeds, "
+          f"pool de {len(pool.normalized):,} palavras")
+    elapsed = time.perf_counter() - started
+
+    for m in mismatches[:20]:
+        print(f"   ❌ {m}")
+    if len(mismatches) > 20:
+        print(f"   … e mais {len(mismatches) - 20}")
+
+    print()
+    print("=" * 60)
+    if mismatches:
+        print(f"❌ {len(mismatches)} de {checked:,} seleções diferentes ({elapsed:.2f}s)")
+    else:
+        print(f"✅ {checked:,} seleções idênticas ({elapsed:.2f}s)")
+    print("=" * 60)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
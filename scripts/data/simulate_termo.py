@@ -0,0 +1,409 @@
+"""
+simulate_termo.py
+-----------------
+Joga o Termo contra TODOS os alvos de words_N.json, com valid_N.json como
+dicionário de palpites, para medir a dificuldade de uma versão do banco
+antes de publicá-la.
+
+Estratégias (--strategy, uma ou mais):
+
+  • entropy    — palpite que maximiza a entropia da partição dos candidatos
+  • minimax    — palpite que minimiza o maior grupo restante
+  • frequency  — candidato mais comum pela frequência ICF (a mesma do
+                 build_termo --rank): o palpite mais provável de ser o alvo;
+                 empates — e palavras fora do ICF — vão para a maior
+                 cobertura de letras entre os candidatos restantes
+
+Em empates, palpites que ainda podem ser o alvo têm preferência.
+
+Os candidatos são filtrados pela matriz de feedback palpite × alvo
+pré-computada (feedback_matrix.py, memmap): cada turno é uma comparação
+vetorizada de uma linha da matriz. O jogo é determinístico dado o
+histórico de feedbacks, então cada decisão (palpite e candidatos
+restantes) é calculada uma vez por histórico e reaproveitada por todos os
+alvos que passam por ele. Os alvos são agrupados pelo feedback da
+abertura e distribuídos entre processos (--jobs), de modo que alvos da
+mesma sub-árvore caiam no mesmo processo.
+
+Saída: distribuição do número de palpites (1…6 e "falhou"), média, taxa
+de falha em 6 palpites e os alvos mais difíceis; --json grava tudo, com
+o número de palpites de cada alvo, em .cache/termo_analysis/.
+
+Uso:
+  python scripts/data/feedback_matrix.py --length 5     (uma vez por versão)
+  python scripts/data/simulate_termo.py [--length 5] [--strategy entropy,minimax]
+                                        [--jobs N] [--limit K] [--opener PALAVRA]
+                                        [--json]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+
+from feedback_matrix import ANALYSIS_DIR, encode, open_matrix
+from target_scoring import opener_pool
+
+
+# Guesses allowed by the game; longer solves count as failures
+MAX_GUESSES = 6
+
+# Safety cap for the simulated games (every strategy always shrinks the candidates)
+MAX_TURNS = 20
+
+# Guess rows per block when counting partitions (bounds the temporary arrays)
+GUESS_CHUNK = 2048
+
+# Target groups per worker, for load balancing
+GROUPS_PER_JOB = 4
+
+# Hardest targets listed in the report
+HARDEST_SHOWN = 15
+
+
+def simulation_file(length: int) -> Path:
+    return ANALYSIS_DIR / f"simulation_{length}.json"
+
+
+# ---------------------------------------------------------------------------
+# Strategies
+# ---------------------------------------------------------------------------
+
+class Strategy(ABC):
+    """Chooses the next guess row for a set of candidate targets.
+
+    Subclasses implement choose(); candidates are target columns of the
+    feedback matrix, guesses are its rows.
+    """
+
+    name = ""
+
+    def __init__(self, matrix: np.ndarray, guesses: list[str], targets: list[str], length: int):
+        self.matrix = matrix
+        self.length = length
+        self.codes = 3 ** length
+        row_of = {w: i for i, w in enumerate(guesses)}
+        # Every target is also a valid guess (build_termo guarantees words_N ⊆ valid_N)
+        self.target_rows = np.array([row_of[w] for w in targets], dtype=np.int64)
+
+    @abstractmethod
+    def choose(self, candidates: np.ndarray) -> int:
+        """Guess row for `candidates` (target columns still possible)."""
+
+    def partition_counts(self, candidates: np.ndarray) -> np.ndarray:
+        """(guesses, feedback codes) group sizes of `candidates` under every guess."""
+        n_guess = self.matrix.shape[0]
+        counts = np.empty((n_guess, self.codes), dtype=np.int32)
+        whole = len(candidates) == self.matrix.shape[1]
+        for start in range(0, n_guess, GUESS_CHUNK):
+            rows = self.matrix[start:start + GUESS_CHUNK]
+            block = np.asarray(rows if whole else rows[:, candidates], dtype=np.int64)
+            block += (np.arange(len(block)) * self.codes)[:, None]
+            counts[start:start + len(block)] = np.bincount(
+                block.ravel(), minlength=len(block) * self.codes
+            ).reshape(len(block), self.codes)
+        return counts
+
+    def _best(self, cost: np.ndarray, candidates: np.ndarray) -> int:
+        """Row with the lowest cost; candidates first on ties, then lowest row."""
+        not_candidate = np.ones(len(cost), dtype=bool)
+        not_candidate[self.target_rows[candidates]] = False
+        return int(np.lexsort((np.arange(len(cost)), not_candidate, cost))[0])
+
+
+class EntropyStrategy(Strategy):
+    name = "entropy"
+
+    def choose(self, candidates: np.ndarray) -> int:
+        if len(candidates) <= 2:
+            return int(self.target_rows[candidates[0]])
+        m = len(candidates)
+        # c·log2(c) by table lookup: far cheaper than log2 over every (guess, code) cell
+        sizes = np.arange(1, m + 1, dtype=np.float64)
+        xlogx = np.concatenate(([0.0], sizes * np.log2(sizes)))
+        weighted = xlogx[self.partition_counts(candidates)].sum(axis=1)
+        entropy = math.log2(m) - weighted / m
+        return self._best(-np.round(entropy, 9), candidates)
+
+
+class MinimaxStrategy(Strategy):
+    name = "minimax"
+
+    def choose(self, candidates: np.ndarray) -> int:
+        if len(candidates) <= 2:
+            return int(self.target_rows[candidates[0]])
+        return self._best(self.partition_counts(candidates).max(axis=1), candidates)
+
+
+@cache
+def load_icf() -> dict[str, float]:
+    """ICF frequencies (lower = more common), read once per process."""
+    from build_termo import read_source
+
+    icf, _ = read_source("icf")
+    return icf
+
+
+class FrequencyStrategy(Strategy):
+    name = "frequency"
+
+    def __init__(self, matrix, guesses, targets, length):
+        super().__init__(matrix, guesses, targets, length)
+        self.letters = encode(targets, length)
+        icf = load_icf()
+        self.freq = np.array([icf.get(w, np.inf) for w in targets], dtype=np.float64)
+
+    def choose(self, candidates: np.ndarray) -> int:
+        freq = self.freq[candidates]
+        tied = np.flatnonzero(freq == freq.min())
+        if len(tied) == 1:
+            return int(self.target_rows[candidates[tied[0]]])
+        # Same letter-coverage score that preselects the openers in target_scoring
+        pick = opener_pool(self.letters[candidates[tied]], self.letters[candidates], 1)[0]
+        return int(self.target_rows[candidates[tied[pick]]])
+
+
+STRATEGIES: dict[str, type[Strategy]] = {
+    cls.name: cls for cls in (EntropyStrategy, MinimaxStrategy, FrequencyStrategy)
+}
+
+
+# ---------------------------------------------------------------------------
+# Games
+# ---------------------------------------------------------------------------
+
+class Solver:
+    """Plays games with one strategy, memoizing each decision by feedback history."""
+
+    def __init__(self, strategy: Strategy, opener: int):
+        self.strategy = strategy
+        self.matrix = strategy.matrix
+        all_targets = np.arange(self.matrix.shape[1], dtype=np.int64)
+        # history → (guess row, candidates before that guess)
+        self._nodes: dict[tuple[int, ...], tuple[int, np.ndarray]] = {(): (opener, all_targets)}
+
+    def play(self, target: int) -> int:
+        """Guesses used to find column `target` (MAX_TURNS + 1 if never found)."""
+        winning_row = self.strategy.target_rows[target]
+        history: tuple[int, ...] = ()
+        guess, candidates = self._nodes[()]
+        for turn in range(1, MAX_TURNS + 1):
+            if guess == winning_row:
+                return turn
+            code = int(self.matrix[guess, target])
+            history += (code,)
+            node = self._nodes.get(history)
+            if node is None:
+                remaining = candidates[np.asarray(self.matrix[guess, candidates]) == code]
+                node = self._nodes[history] = (self.strategy.choose(remaining), remaining)
+            guess, candidates = node
+        return MAX_TURNS + 1
+
+
+_worker: Solver | None = None
+
+
+def _init_worker(length: int, strategy: str, opener: int) -> None:
+    global _worker
+    matrix, guesses, targets = open_matrix(length)
+    _worker = Solver(STRATEGIES[strategy](matrix, guesses, targets, length), opener)
+
+
+def _play_group(targets: list[int]) -> list[tuple[int, int]]:
+    return [(t, _worker.play(t)) for t in targets]
+
+
+def choose_opener(strategy: Strategy) -> int:
+    """First guess of `strategy` (same for every target, computed once)."""
+    return strategy.choose(np.arange(strategy.matrix.shape[1], dtype=np.int64))
+
+
+def target_groups(matrix: np.ndarray, opener: int, targets: np.ndarray, parts: int) -> list[list[int]]:
+    """Splits `targets` into up to `parts` lists, keeping each opener feedback
+    group together (largest groups first, onto the lightest list).
+    """
+    codes = np.asarray(matrix[opener, targets])
+    groups = sorted(
+        (targets[codes == code].tolist() for code in np.unique(codes)), key=len, reverse=True
+    )
+    bins: list[list[int]] = [[] for _ in range(max(1, min(parts, len(groups))))]
+    for group in groups:
+        min(bins, key=len).extend(group)
+    return [b for b in bins if b]
+
+
+@dataclass
+class SimulationResult:
+    strategy: str
+    opener: str
+    seconds: float
+    turns: dict[str, int] = field(default_factory=dict)   # target → guesses used
+
+    def distribution(self) -> dict[str, int]:
+        counts = Counter(min(t, MAX_GUESSES + 1) for t in self.turns.values())
+        dist = {str(k): counts.get(k, 0) for k in range(1, MAX_GUESSES + 1)}
+        dist["falhou"] = counts.get(MAX_GUESSES + 1, 0)
+        return dist
+
+    @property
+    def failure_rate(self) -> float:
+        return self.distribution()["falhou"] / len(self.turns) if self.turns else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        return sum(self.turns.values()) / len(self.turns) if self.turns else 0.0
+
+    def hardest(self, count: int = HARDEST_SHOWN) -> list[tuple[str, int]]:
+        return sorted(self.turns.items(), key=lambda item: (-item[1], item[0]))[:count]
+
+    def to_dict(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "opener": self.opener,
+            "seconds": round(self.seconds, 2),
+            "targets": len(self.turns),
+            "meanGuesses": round(self.mean_guesses, 4),
+            "failureRate": round(self.failure_rate, 6),
+            "distribution": self.distribution(),
+            "turns": self.turns,
+        }
+
+
+def simulate(
+    length: int,
+    strategy_name: str,
+    jobs: int = 1,
+    limit: int | None = None,
+    opener_word: str | None = None,
+) -> SimulationResult:
+    """Plays every target (or the first `limit`) with one strategy."""
+    matrix, guesses, targets = open_matrix(length)
+    strategy = STRATEGIES[strategy_name](matrix, guesses, targets, length)
+
+    started = time.perf_counter()
+    if opener_word is None:
+        opener = choose_opener(strategy)
+    elif opener_word in guesses:
+        opener = guesses.index(opener_word)
+    else:
+        raise ValueError(f"abertura {opener_word!r} não está em valid_{length}")
+
+    columns = np.arange(len(targets) if limit is None else min(limit, len(targets)))
+    groups = target_groups(matrix, opener, columns, jobs * GROUPS_PER_JOB)
+    if jobs <= 1 or len(groups) == 1:
+        solver = Solver(strategy, opener)
+        played = [(t, solver.play(t)) for group in groups for t in group]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(groups)),
+            initializer=_init_worker,
+            initargs=(length, strategy_name, opener),
+        ) as pool:
+            played = [pair for chunk in pool.map(_play_group, groups) for pair in chunk]
+
+    return SimulationResult(
+        strategy=strategy_name,
+        opener=guesses[opener],
+        seconds=time.perf_counter() - started,
+        turns={targets[t]: turns for t, turns in sorted(played)},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def parse_strategies(text: str) -> list[str]:
+    names = [part.strip() for part in text.split(",") if part.strip()]
+    unknown = [n for n in names if n not in STRATEGIES]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(
+            f"estratégias inválidas: {unknown or text!r} (disponíveis: {', '.join(STRATEGIES)})"
+        )
+    return names
+
+
+def print_result(result: SimulationResult) -> None:
+    dist = result.distribution()
+    total = len(result.turns)
+    print()
+    print(f"  ── {result.strategy} (abertura {result.opener}, {result.seconds:.1f}s) ──")
+    widest = max(dist.values()) or 1
+    for label, count in dist.items():
+        bar = "█" * round(30 * count / widest)
+        print(f"    {label:>6} : {count:>7,}  {100 * count / total:5.1f}%  {bar}")
+    print(f"    média  : {result.mean_guesses:.3f} palpites")
+    print(f"    falhas : {100 * result.failure_rate:.2f}% (mais de {MAX_GUESSES} palpites)")
+    hardest = ", ".join(f"{w} ({t})" for w, t in result.hardest())
+    print(f"    mais difíceis: {hardest}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simula o Termo BR contra todos os alvos.")
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("--strategy", type=parse_strategies, default=list(STRATEGIES),
+                        metavar="entropy,minimax,frequency",
+                        help="estratégias a simular, separadas por vírgula (padrão: todas)")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="processos (0 = todos os núcleos; padrão: 0)")
+    parser.add_argument("--limit", type=int, metavar="K", help="simula só os K primeiros alvos")
+    parser.add_argument("--opener", help="força a primeira palavra (padrão: a da estratégia)")
+    parser.add_argument("--json", action="store_true",
+                        help="grava o resultado em .cache/termo_analysis/simulation_N.json")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    n = args.length
+    try:
+        matrix, guesses, targets = open_matrix(n)
+    except FileNotFoundError:
+        print(f"❌ Matriz de feedback ausente — rode feedback_matrix.py --length {n}")
+        return 1
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("=" * 60)
+    print(f"🎯 Simulação do Termo ({n} letras)")
+    print("=" * 60)
+    print(f"  Alvos    (words_{n}) : {len(targets):,}")
+    print(f"  Palpites (valid_{n}) : {len(guesses):,}")
+    print(f"  Processos          : {jobs}")
+    if "frequency" in args.strategy and not load_icf():
+        print("  ⚠️  ICF ausente — frequency escolhe só pela cobertura de letras")
+    del matrix
+
+    results = []
+    for name in args.strategy:
+        try:
+            result = simulate(n, name, jobs, args.limit, args.opener and args.opener.upper())
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print_result(result)
+        results.append(result)
+
+    if args.json:
+        path = simulation_file(n)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"length": n, "maxGuesses": MAX_GUESSES,
+                        "results": [r.to_dict() for r in results]}, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        print(f"\n  Resultado → {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+source_cache.py
+---------------
+Cache incremental em disco para o resultado já processado de cada fonte.
+
+Cada entrada guarda o resultado de um leitor (pickle) e um carimbo JSON com
+tamanho, mtime e SHA-256 do arquivo de origem, mais uma impressão digital
+das regras de processamento (normalização, caracteres válidos, ...):
+
+  <cache_dir>/<key>.pickle   ← resultado do leitor
+  <cache_dir>/<key>.json     ← {"size", "mtime_ns", "sha256", "fingerprint"}
+
+Se tamanho e mtime batem com o carimbo, o hash não é recalculado. Se
+mudaram, o conteúdo é re-hasheado — um `touch` sem alteração real continua
+aproveitando o cache. Mudou a impressão digital, a entrada é descartada.
+
+Uso:
+  from source_cache import cached_read, rules_fingerprint
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Bump to invalidate every cache entry when the on-disk layout changes
+CACHE_FORMAT = 1
+
+HASH_CHUNK = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def rules_fingerprint(parts: Iterable[str | bytes]) -> str:
+    """Hashes everything that changes a reader's output besides the source itself."""
+    h = hashlib.sha256(f"format={CACHE_FORMAT}".encode())
+    for part in parts:
+        h.update(b"\0")
+        h.update(part.encode("utf-8") if isinstance(part, str) else part)
+    return h.hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _write_stamp(stamp_file: Path, st: os.stat_result, digest: str, fingerprint: str) -> None:
+    stamp = {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": digest,
+        "fingerprint": fingerprint,
+    }
+    _write_atomic(stamp_file, json.dumps(stamp, indent=2).encode("utf-8"))
+
+
+def cached_read(
+    cache_dir: Path,
+    key: str,
+    path: Path,
+    fingerprint: str,
+    reader: Callable[[Path], T],
+) -> tuple[T, bool]:
+    """Returns (reader(path), hit), loading from the cache when the source is unchanged.
+
+    Missing sources are never cached — the reader decides what "missing" means.
+    """
+    if not path.exists():
+        return reader(path), False
+
+    data_file = cache_dir / f"{key}.pickle"
+    stamp_file = cache_dir / f"{key}.json"
+
+    st = path.stat()
+    stamp: dict = {}
+    if stamp_file.exists():
+        try:
+            stamp = json.loads(stamp_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            stamp = {}
+
+    same_stat = (
+        "sha256" in stamp
+        and stamp.get("size") == st.st_size
+        and stamp.get("mtime_ns") == st.st_mtime_ns
+    )
+    digest = stamp.get("sha256") if same_stat else file_digest(path)
+
+    if (
+        stamp.get("sha256") == digest
+        and stamp.get("fingerprint") == fingerprint
+        and data_file.exists()
+    ):
+        try:
+            with data_file.open("rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            result = None
+        if result is not None:
+            if not same_stat:
+                _write_stamp(stamp_file, st, digest, fingerprint)
+            return result, True
+
+    result = reader(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_atomic(data_file, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    _write_stamp(stamp_file, st, digest, fingerprint)
+    return result, False
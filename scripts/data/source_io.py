@@ -0,0 +1,54 @@
+"""
+source_io.py
+------------
+Leitura em streaming das fontes de texto de Data/ (listas de palavras,
+.aff/.dic do Hunspell), compartilhada por build_termo.py e
+hunspell_affix.py.
+
+  • decode_lines — decodifica linha a linha em modo estrito: uma linha que
+    a codificação principal rejeita é lida com as seguintes (Latin-1 por
+    último, que aceita qualquer byte) em vez de virar U+FFFD e sumir; a
+    quantidade sai num aviso
+
+Uso:
+  from source_io import decode_lines
+  with path.open("rb") as f:
+      for line in decode_lines(f, ["utf-8"], path.name): ...
+"""
+
+import codecs
+from collections.abc import Iterable, Iterator
+
+
+# Last resort when the declared / sniffed encoding does not decode a line
+# (every byte is valid Latin-1, so nothing is ever dropped)
+FALLBACK_ENCODING = "iso8859-1"
+
+
+def decode_lines(lines: Iterable[bytes], encodings: list[str], name: str) -> Iterator[str]:
+    """Decodes byte lines strictly, each in the first of `encodings` that works.
+
+    A line the main encoding rejects is decoded with the next ones
+    (FALLBACK_ENCODING last) instead of becoming U+FFFD; how many needed it
+    is printed as a warning at the end.
+    """
+    # One entry per codec ("latin-1", "iso-8859-1" and "iso8859-1" are the same)
+    by_codec: dict[str, str] = {}
+    for enc in [*encodings, FALLBACK_ENCODING]:
+        by_codec.setdefault(codecs.lookup(enc).name, enc)
+    encodings = list(by_codec.values())
+    fallback = 0
+    for line in lines:
+        if line.endswith(b"\r\n"):
+            line = line[:-2] + b"\n"
+        for i, enc in enumerate(encodings):
+            try:
+                text = line.decode(enc)
+            except UnicodeDecodeError:
+                continue
+            fallback += i > 0
+            yield text
+            break
+    if fallback:
+        print(f"  ⚠ {name}: {fallback:,} linha(s) fora de {encodings[0]} "
+              f"(lidas como {', '.join(encodings[1:])})")
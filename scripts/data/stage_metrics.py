@@ -0,0 +1,241 @@
+"""
+stage_metrics.py
+----------------
+Instrumentação por etapa para os scripts de dados (build_termo.py):
+
+  • StageMetrics.stage(nome) — context manager que mede a duração, a
+    memória da etapa (RSS no início, pico de RSS dentro da etapa e quanto
+    ele subiu sobre o início; com tracemalloc ativo, o pico alocado pelo
+    Python) e guarda itens de entrada/saída e tamanhos de conjuntos
+    preenchidos pela própria etapa. O pico por etapa só existe com
+    StageMetrics(..., per_stage_rss=True): zera o VmHWM — e o ru_maxrss —
+    do processo inteiro (/proc/self/clear_refs, Linux), então só quem é dono
+    do processo (build_termo.main) liga; por padrão, e fora do Linux, fica
+    só o pico do processo (processPeakRssMb), que nunca desce
+  • profiling(arquivo)       — cProfile + tracemalloc durante o bloco;
+    grava o .prof (snakeviz / pstats) e imprime as funções e linhas mais
+    caras
+  • StageMetrics.write_json  — saída estruturada (--metrics-json, chaves
+    em camelCase) para o CI acompanhar o custo do pipeline conforme os
+    dicionários crescem
+
+Uso:
+  from stage_metrics import StageMetrics, profiling
+
+  metrics = StageMetrics("build_termo", per_stage_rss=True)
+  with metrics.stage("icf") as st:
+      st.items_in = len(icf)
+      st.sizes["5"] = len(icf_by[5])
+  metrics.write_json(path)
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+METRICS_VERSION = 2
+
+# Lines printed by profiling() for functions (cumulative time) and allocations
+PROFILE_TOP = 20
+TRACEMALLOC_TOP = 10
+
+
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process (None where `resource` is missing)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def _proc_status_mb(field_name: str) -> float | None:
+    """A "VmXxx: N kB" line of /proc/self/status in MB (None off Linux)."""
+    try:
+        for line in PROC_STATUS.read_text().splitlines():
+            if line.startswith(f"{field_name}:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def reset_rss_peak() -> bool:
+    """Restarts the VmHWM high-water mark from the current RSS (Linux ≥ 4.0)."""
+    try:
+        PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+@dataclass
+class Stage:
+    name: str
+    duration_s: float = 0.0
+    # RSS when the stage began, and its peak during the stage (None unless
+    # per_stage_rss is on and the peak can be reset, i.e. on Linux)
+    start_rss_mb: float | None = None
+    peak_rss_mb: float | None = None
+    # Process-wide high-water mark when the stage ended: never goes down, so
+    # every stage after the heaviest one repeats its value
+    process_peak_rss_mb: float | None = None
+    # Peak traced Python memory during the stage; only while tracemalloc traces
+    peak_traced_mb: float | None = None
+    items_in: int | None = None
+    items_out: int | None = None
+    sizes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rss_growth_mb(self) -> float | None:
+        """How far the stage's peak RSS rose over its starting RSS."""
+        if self.peak_rss_mb is None or self.start_rss_mb is None:
+            return None
+        return self.peak_rss_mb - self.start_rss_mb
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "durationSeconds": self.duration_s,
+            "startRssMb": self.start_rss_mb,
+            "peakRssMb": self.peak_rss_mb,
+            "rssGrowthMb": self.rss_growth_mb,
+            "processPeakRssMb": self.process_peak_rss_mb,
+            "peakTracedMb": self.peak_traced_mb,
+            "itemsIn": self.items_in,
+            "itemsOut": self.items_out,
+            "sizes": self.sizes,
+        }
+
+
+class StageMetrics:
+    """Ordered per-stage records of one run.
+
+    per_stage_rss resets the process-wide RSS high-water mark at each stage
+    (see reset_rss_peak); leave it off when the caller measures its own peak.
+    """
+
+    def __init__(self, script: str, per_stage_rss: bool = False):
+        self.script = script
+        self.per_stage_rss = per_stage_rss
+        self.stages: list[Stage] = []
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        # reset_rss_peak() also resets ru_maxrss on Linux: keep the running max
+        self._process_peak: float | None = None
+
+    def process_peak_rss_mb(self) -> float | None:
+        """Highest RSS seen so far in the run (stage peaks included)."""
+        peaks = [p for p in (self._process_peak, peak_rss_mb()) if p is not None]
+        self._process_peak = max(peaks, default=None)
+        return self._process_peak
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """Times the block; the yielded Stage takes items_in/items_out/sizes."""
+        record = Stage(name)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        self.process_peak_rss_mb()
+        per_stage = self.per_stage_rss and reset_rss_peak()
+        record.start_rss_mb = _proc_status_mb("VmRSS")
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration_s = time.perf_counter() - started
+            if per_stage:
+                record.peak_rss_mb = _proc_status_mb("VmHWM")
+            record.process_peak_rss_mb = self.process_peak_rss_mb()
+            if tracing and tracemalloc.is_tracing():
+                record.peak_traced_mb = tracemalloc.get_traced_memory()[1] / (1 << 20)
+            self.stages.append(record)
+
+    def to_dict(self, **extra) -> dict:
+        return {
+            "version": METRICS_VERSION,
+            "script": self.script,
+            "startedAt": self.started_at.isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "totalSeconds": time.perf_counter() - self._started,
+            "processPeakRssMb": self.process_peak_rss_mb(),
+            **extra,
+            "stages": [s.to_dict() for s in self.stages],
+        }
+
+    def write_json(self, path: Path, **extra) -> None:
+        """Writes the run (plus `extra` top-level fields) as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(**extra), indent=2), encoding="utf-8")
+
+    def summary(self) -> str:
+        """One line per stage: duration, peak RSS (growth over the start) and items."""
+        lines = []
+        for s in self.stages:
+            if s.rss_growth_mb is not None:
+                rss = f"{s.peak_rss_mb:8.1f} MB {s.rss_growth_mb:+8.1f}"
+            elif s.process_peak_rss_mb is not None:
+                rss = f"{s.process_peak_rss_mb:8.1f} MB {'':>8}"
+            else:
+                rss = f"{'—':>11} {'':>8}"
+            items = ""
+            if s.items_in is not None or s.items_out is not None:
+                items = f"  {s.items_in or 0:>9,} → {s.items_out or 0:,}"
+            lines.append(f"  {s.name:<20} {s.duration_s:8.3f}s {rss}{items}")
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def profiling(output: Path | None) -> Iterator[None]:
+    """cProfile + tracemalloc over the block; no-op when `output` is None.
+
+    Only the calling process is profiled (reader workers of --jobs are not).
+    """
+    if output is None:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(output)
+
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        print()
+        print(f"  ── Perfil (cProfile, top {PROFILE_TOP} por tempo acumulado) ──")
+        print(report.getvalue().rstrip())
+        print()
+        print(f"  ── Alocações (tracemalloc, top {TRACEMALLOC_TOP} linhas) ──")
+        for stat in snapshot.statistics("lineno")[:TRACEMALLOC_TOP]:
+            print(f"    {stat.size / (1 << 20):8.1f} MB  {stat.count:>9,}  {stat.traceback[0]}")
+        print(f"  Perfil → {output}")
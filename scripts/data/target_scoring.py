@@ -0,0 +1,211 @@
+"""
+target_scoring.py
+-----------------
+Etapa de pontuação e poda das palavras-alvo do Termo BR (build_termo --rank).
+
+Cada candidato a alvo recebe três sinais, todos calculados de forma
+vetorizada (NumPy) sobre o conjunto inteiro:
+
+  • freq       — frequência ICF (menor = mais comum; ausente = mais rara)
+  • remaining  — candidatos que sobram depois da melhor abertura, i.e. o
+                 tamanho da partição do alvo sob o feedback do opener ótimo
+  • repeats    — letras repetidas (N − letras distintas)
+
+A melhor abertura é escolhida entre os OPENER_POOL palpites de maior
+cobertura de letras (pré-filtro barato), minimizando o número esperado de
+candidatos restantes Σ|partição|² / |alvos|.
+
+A dificuldade é a média ponderada (SCORE_WEIGHTS) dos postos normalizados
+dos três sinais; o words_N.json sai ordenado do mais fácil ao mais difícil,
+depois dos cortes de RankCutoffs.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from feedback_matrix import ANALYSIS_DIR, encode, feedback_block
+
+
+# Pre-selected opener candidates evaluated exactly against every target
+OPENER_POOL = 256
+
+# Targets per block when evaluating openers
+TARGET_CHUNK = 4096
+
+# Largest dense (pool × 3^L) int64 counts table in best_opener (64 MiB);
+# longer words count each opener's feedback codes with np.unique instead
+DENSE_COUNTS_MAX = 1 << 23
+
+# Weights of each normalized signal in the difficulty score
+SCORE_WEIGHTS = {"freq": 0.5, "remaining": 0.3, "repeats": 0.2}
+
+
+@dataclass
+class RankCutoffs:
+    """Cut-offs applied after scoring (None = no limit)."""
+    max_repeats: int | None = None
+    max_remaining: int | None = None
+    max_targets: int | None = None
+
+
+@dataclass
+class TargetScores:
+    words: list[str]
+    freq: np.ndarray          # float, inf when absent from ICF
+    remaining: np.ndarray     # int, partition size after the opener
+    repeats: np.ndarray       # int
+    score: np.ndarray         # float in [0, 1], higher = harder
+    opener: str
+    opener_expected: float    # expected remaining candidates after the opener
+
+
+def _normalized_rank(values: np.ndarray) -> np.ndarray:
+    """Dense rank scaled to [0, 1]; equal values share a rank."""
+    _, inverse = np.unique(values, return_inverse=True)
+    top = inverse.max() if inverse.size else 0
+    return inverse / top if top else np.zeros(values.shape, dtype=float)
+
+
+def repeated_letters(encoded: np.ndarray) -> np.ndarray:
+    """Length minus distinct letters, per row."""
+    ordered = np.sort(encoded, axis=1)
+    return (ordered[:, 1:] == ordered[:, :-1]).sum(axis=1)
+
+
+def opener_pool(guesses: np.ndarray, targets: np.ndarray, size: int) -> np.ndarray:
+    """Indices of the `size` guesses that best cover the targets' letters.
+
+    Cheap proxy: sum of the target frequency of each distinct guess letter,
+    plus positional frequency — picks the usual "AREIO"-style openers.
+    """
+    length = targets.shape[1]
+    presence = np.zeros(26)
+    for letter in range(26):
+        presence[letter] = (targets == letter).any(axis=1).mean()
+    positional = np.stack(
+        [np.bincount(targets[:, i], minlength=26) / len(targets) for i in range(length)]
+    )
+    distinct = np.sort(guesses, axis=1)
+    first = np.ones(distinct.shape, dtype=bool)
+    first[:, 1:] = distinct[:, 1:] != distinct[:, :-1]
+    coverage = (presence[distinct] * first).sum(axis=1)
+    coverage += positional[np.arange(length), guesses].sum(axis=1)
+    size = min(size, len(guesses))
+    return np.argpartition(-coverage, size - 1)[:size]
+
+
+def best_opener(guesses: np.ndarray, targets: np.ndarray) -> tuple[int, float, np.ndarray]:
+    """Evaluates every opener candidate exactly.
+
+    Returns (row in `guesses`, expected remaining, partition size per target).
+    """
+    length = targets.shape[1]
+    codes = 3 ** length
+    n_guess, n_target = len(guesses), len(targets)
+    if n_guess * codes > DENSE_COUNTS_MAX:
+        return _best_opener_sparse(guesses, targets)
+
+    counts = np.zeros((n_guess, codes), dtype=np.int64)
+    offsets = (np.arange(n_guess) * codes)[:, None]
+    for start in range(0, n_target, TARGET_CHUNK):
+        block = feedback_block(guesses, targets[start:start + TARGET_CHUNK]).astype(np.int64)
+        counts += np.bincount(
+            (block + offsets).ravel(), minlength=n_guess * codes
+        ).reshape(n_guess, codes)
+
+    expected = (counts.astype(np.float64) ** 2).sum(axis=1) / n_target
+    best = int(np.argmin(expected))
+    partition = counts[best][feedback_block(guesses[best:best + 1], targets)[0].astype(np.int64)]
+    return best, float(expected[best]), partition
+
+
+def _best_opener_sparse(guesses: np.ndarray, targets: np.ndarray) -> tuple[int, float, np.ndarray]:
+    """best_opener for long words: only the codes that occur are counted, per opener."""
+    n_target = len(targets)
+    block = np.concatenate([
+        feedback_block(guesses, targets[start:start + TARGET_CHUNK])
+        for start in range(0, n_target, TARGET_CHUNK)
+    ], axis=1)
+    best, best_expected, partition = 0, np.inf, np.zeros(n_target, dtype=np.int64)
+    for row in range(len(guesses)):
+        _, inverse, counts = np.unique(block[row], return_inverse=True, return_counts=True)
+        expected = float((counts.astype(np.float64) ** 2).sum() / n_target)
+        if expected < best_expected:
+            best, best_expected, partition = row, expected, counts[inverse].astype(np.int64)
+    return best, best_expected, partition
+
+
+def score_targets(
+    targets: list[str], valid: list[str], icf: dict[str, float], length: int
+) -> TargetScores:
+    """Scores every candidate target (see module docstring)."""
+    t_arr = encode(targets, length)
+    v_arr = encode(valid, length)
+
+    pool = opener_pool(v_arr, t_arr, OPENER_POOL)
+    best, expected, remaining = best_opener(v_arr[pool], t_arr)
+
+    freq = np.array([icf.get(w, np.inf) for w in targets], dtype=float)
+    repeats = repeated_letters(t_arr)
+
+    score = (
+        SCORE_WEIGHTS["freq"] * _normalized_rank(freq)
+        + SCORE_WEIGHTS["remaining"] * _normalized_rank(remaining)
+        + SCORE_WEIGHTS["repeats"] * _normalized_rank(repeats)
+    ) / sum(SCORE_WEIGHTS.values())
+
+    return TargetScores(
+        words=list(targets),
+        freq=freq,
+        remaining=remaining,
+        repeats=repeats,
+        score=score,
+        opener=valid[int(pool[best])],
+        opener_expected=expected,
+    )
+
+
+def rank_targets(scores: TargetScores, cutoffs: RankCutoffs) -> list[str]:
+    """Applies the cut-offs and returns the targets from easiest to hardest."""
+    keep = np.ones(len(scores.words), dtype=bool)
+    if cutoffs.max_repeats is not None:
+        keep &= scores.repeats <= cutoffs.max_repeats
+    if cutoffs.max_remaining is not None:
+        keep &= scores.remaining <= cutoffs.max_remaining
+
+    # Stable on ties: alphabetical order of the input is kept
+    order = np.argsort(scores.score, kind="stable")
+    ranked = [scores.words[i] for i in order if keep[i]]
+    if cutoffs.max_targets is not None:
+        ranked = ranked[:cutoffs.max_targets]
+    return ranked
+
+
+def report_file(length: int) -> Path:
+    return ANALYSIS_DIR / f"target_scores_{length}.json"
+
+
+def write_report(path: Path, scores: TargetScores) -> None:
+    """Per-target signals as JSON, hardest last (for tuning the cut-offs)."""
+    order = np.argsort(scores.score, kind="stable")
+    rows = [
+        {
+            "word": scores.words[i],
+            "score": round(float(scores.score[i]), 4),
+            "freq": None if np.isinf(scores.freq[i]) else float(scores.freq[i]),
+            "remaining": int(scores.remaining[i]),
+            "repeats": int(scores.repeats[i]),
+        }
+        for i in order
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {"opener": scores.opener, "opener_expected": scores.opener_expected, "targets": rows},
+            ensure_ascii=False, indent=2,
+        ),
+        encoding="utf-8",
+    )
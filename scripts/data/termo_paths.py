@@ -0,0 +1,32 @@
+"""
+termo_paths.py
+--------------
+Caminhos dos arquivos do Termo BR gerados por build_termo.py, num módulo
+sem dependências para que as análises (feedback_matrix.py, …) os achem sem
+importar o build_termo — que, rodando como __main__ com --rank, seria
+carregado uma segunda vez.
+
+Uso:
+  from termo_paths import target_file, valid_file
+"""
+
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+OUTPUT_DIR = (
+    REPO_ROOT / "TermoBR" / "Termo" / "Assets" / "_Project" / "Resources" / "Data"
+)
+
+
+def target_file(length: int) -> Path:
+    return OUTPUT_DIR / f"words_{length}.json"
+
+
+def valid_file(length: int) -> Path:
+    return OUTPUT_DIR / f"valid_{length}.json"
+
+
+def dawg_file(length: int) -> Path:
+    return OUTPUT_DIR / f"valid_{length}_dawg.bytes"
@@ -0,0 +1,124 @@
+"""
+text_normalizer.py
+------------------
+Normalização de texto compartilhada pelos scripts de dados — port de
+TextNormalizer.cs (Core/Domain/Words):
+
+  1. Decompõe (NFD) e remove marcas de acento (categoria Mn)
+  2. Remove espaços, hífens e apóstrofos
+  3. Recompõe (NFC) e converte para maiúsculas (mapeamento simples,
+     como ToUpperInvariant — "ß" continua "ß")
+
+  normalize("Coração")  → "CORACAO"
+  normalize("D'Oeste")  → "DOESTE"
+
+Caminho rápido: palavras compostas só por ASCII e pelo alfabeto acentuado
+(Latin-1 / Latin Extended-A / marcas combinantes) passam por uma única
+chamada str.translate. Qualquer outro caractere cai no algoritmo completo,
+memoizado por palavra (LRU).
+
+to_display() é o port de TextNormalizer.ToDisplay (só maiúsculas, mantém
+acentos), usado para a forma exibida das palavras.
+
+Uso:
+  from text_normalizer import normalize, normalize_batch, to_display
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache
+
+
+# Characters removed by TextNormalizer.Normalize besides accent marks
+REMOVED_CHARS = " -'"
+
+# Size of the memoization cache for words outside the fast path
+SLOW_CACHE_SIZE = 65536
+
+
+# ---------------------------------------------------------------------------
+# Reference algorithm (mirrors TextNormalizer.cs step by step)
+# ---------------------------------------------------------------------------
+
+def _upper_invariant(text: str) -> str:
+    """Simple (1:1) uppercase mapping, like .NET ToUpperInvariant."""
+    out = []
+    for c in text:
+        u = c.upper()
+        out.append(u if len(u) == 1 else c)
+    return "".join(out)
+
+
+def _normalize_reference(word: str) -> str:
+    nfd = unicodedata.normalize("NFD", word)
+    kept = "".join(
+        c for c in nfd
+        if unicodedata.category(c) != "Mn" and c not in REMOVED_CHARS
+    )
+    return _upper_invariant(unicodedata.normalize("NFC", kept))
+
+
+@lru_cache(maxsize=SLOW_CACHE_SIZE)
+def _normalize_slow(word: str) -> str:
+    return _normalize_reference(word)
+
+
+# ---------------------------------------------------------------------------
+# Translate table (fast path)
+# ---------------------------------------------------------------------------
+
+def _build_table() -> tuple[dict[int, str], re.Pattern[str]]:
+    """Maps every char whose normalized form is pure ASCII (or empty).
+
+    Only such chars are safe to normalize one at a time: their output can
+    never recompose (NFC) with a neighbour, so the per-char mapping equals
+    the whole-word algorithm.
+    """
+    table: dict[int, str] = {}
+    for code in range(0x370):
+        c = chr(code)
+        mapped = _normalize_reference(c)
+        if mapped.isascii():
+            table[code] = mapped
+    fast_chars = "".join(chr(code) for code in table)
+    return table, re.compile(f"[^{re.escape(fast_chars)}]")
+
+
+# _SLOW_CHAR matches any char outside the fast path
+_TABLE, _SLOW_CHAR = _build_table()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def normalize(word: str) -> str:
+    """Normalizes a word for the grid: no accents, no spaces/hyphens, uppercase."""
+    if not word:
+        return ""
+    if _SLOW_CHAR.search(word) is None:
+        return word.translate(_TABLE)
+    return _normalize_slow(word)
+
+
+def normalize_batch(words: Iterable[str]) -> list[str]:
+    """Normalizes a whole iterable of words, preserving order.
+
+    When every word is on the fast path the batch is translated in a single
+    call over the joined text; otherwise each word goes through normalize().
+    """
+    words = list(words)
+    if not words:
+        return []
+    blob = "\n".join(words)
+    if blob.count("\n") == len(words) - 1 and _SLOW_CHAR.search(blob) is None:
+        return blob.translate(_TABLE).split("\n")
+    return [normalize(w) for w in words]
+
+
+def to_display(word: str) -> str:
+    """Display form: uppercase with accents kept (TextNormalizer.ToDisplay)."""
+    if not word:
+        return ""
+    return _upper_invariant(word)
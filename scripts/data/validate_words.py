@@ -3,37 +3,59 @@
 Validador de integridade dos JSONs de palavras do Caça-Palavras.
 Verifica: formato, duplicatas, tamanho mínimo, consistência com categories.json.
 
+Cada arquivo é lido e validado uma única vez; o resultado (erros + palavras
+normalizadas) fica em .cache/validate_words/, chaveado pelo SHA-256 do
+conteúdo e pelas regras de validação. Nas execuções seguintes só os
+arquivos alterados são revalidados — em paralelo com --jobs — e a checagem
+entre categorias usa as palavras normalizadas guardadas.
+
+Se existir a pasta de shards (build_shards.py), cada shard também é
+validado: formato, palavras normalizadas válidas, forma de exibição
+coerente, buckets de seleção, manifest.json e se está em dia com o JSON da
+categoria.
+
+Além das duplicatas exatas (CROSS-DUP), aponta quase-duplicatas
+(near_duplicates.py): plural/gênero da mesma palavra e palavras contidas
+em outras da mesma categoria (NEAR-DUP, aviso).
+
 Uso:
-    python validate_words.py
+    python validate_words.py [--jobs N] [--no-cache] [--shards pasta]
+                             [--report-json relatorio.json] [--junit junit.xml]
 """
 
+import argparse
+import hashlib
 import json
 import os
 import sys
-import unicodedata
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import text_normalizer
+from levelgen.level import selection_widths
+from near_duplicates import describe_cluster, find_near_duplicates
+from source_cache import rules_fingerprint
+from text_normalizer import normalize, to_display
+from word_shards import MANIFEST_NAME, SHARD_SUFFIX, Shard, ShardFormatError
+
 
 # Caminhos relativos ao repositório
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = REPO_ROOT / "WordSearch" / "Assets" / "_Project" / "Resources" / "Data"
 CATEGORIES_FILE = DATA_DIR / "categories.json"
 WORDS_DIR = DATA_DIR / "words"
+SHARDS_DIR = DATA_DIR / "shards"
+CACHE_FILE = REPO_ROOT / ".cache" / "validate_words" / "results.json"
 
 MIN_WORD_LENGTH = 3
 MIN_WORDS_PER_CATEGORY = 100
 MIN_WORDS_DESAFIO = 300
 MAX_WORD_LENGTH = 19  # grid máximo: 20 colunas (challenge mode)
 
-
-def normalize(word: str) -> str:
-    """Remove acentos e converte para maiúsculas (mesmo algoritmo do C#)."""
-    nfkd = unicodedata.normalize("NFD", word)
-    without_accents = "".join(
-        c for c in nfkd
-        if unicodedata.category(c) != "Mn" and c not in (" ", "-", "'")
-    )
-    return unicodedata.normalize("NFC", without_accents).upper()
+# Bump when validate_words_file changes what it reports
+VALIDATOR_VERSION = 1
 
 
 def load_json(filepath: Path) -> dict:
@@ -42,6 +64,15 @@ def load_json(filepath: Path) -> dict:
         return json.load(f)
 
 
+def validation_fingerprint() -> str:
+    """Everything besides the file content that changes a file's result."""
+    return rules_fingerprint([
+        f"validator={VALIDATOR_VERSION}",
+        f"min={MIN_WORD_LENGTH} max={MAX_WORD_LENGTH} per_category={MIN_WORDS_PER_CATEGORY}",
+        Path(text_normalizer.__file__).read_bytes(),
+    ])
+
+
 def validate_categories(categories_data: dict) -> list[str]:
     """Valida o arquivo categories.json."""
     errors = []
@@ -71,16 +102,9 @@ def validate_categories(categories_data: dict) -> list[str]:
     return errors
 
 
-def validate_words_file(filepath: Path, expected_category_id: str) -> list[str]:
-    """Valida um arquivo de palavras."""
+def validate_words_file(data: dict, prefix: str, expected_category_id: str) -> list[str]:
+    """Valida o conteúdo (já carregado) de um arquivo de palavras."""
     errors = []
-    prefix = filepath.name
-
-    try:
-        data = load_json(filepath)
-    except json.JSONDecodeError as e:
-        errors.append(f"{prefix}: JSON inválido — {e}")
-        return errors
 
     # Campo categoryId
     if "categoryId" not in data:
@@ -141,20 +165,45 @@ def validate_words_file(filepath: Path, expected_category_id: str) -> list[str]:
     return errors
 
 
-def validate_cross_categories(words_dir: Path) -> list[str]:
-    """Verifica duplicatas entre categorias."""
+def check_file(filepath: Path, raw: bytes) -> dict:
+    """Parses and validates one words file from the bytes check_all read.
+
+    The digest and the parsed JSON come from the same bytes, so a cached
+    result always matches the content it was computed from. Returns a
+    JSON-serializable result: categoryId, word count, the (normalized,
+    original) pairs for the cross-category check and errors.
+    """
+    prefix = filepath.name
+    result = {"sha256": _digest(raw), "categoryId": filepath.stem, "wordCount": 0,
+              "entries": [], "errors": []}
+    try:
+        data = json.loads(raw.decode("utf-8-sig"))
+    except ValueError as e:  # JSONDecodeError, UnicodeDecodeError
+        result["errors"] = [f"{prefix}: JSON inválido — {e}"]
+        return result
+
+    result["errors"] = validate_words_file(data, prefix, filepath.stem)
+    result["categoryId"] = data.get("categoryId", filepath.stem)
+    words = data.get("words", [])
+    if isinstance(words, list):
+        result["wordCount"] = len(words)
+        result["entries"] = [(normalize(w), w) for w in words if isinstance(w, str)]
+    return result
+
+
+def _check_file_job(args: tuple[Path, bytes]) -> dict:
+    return check_file(*args)
+
+
+def validate_cross_categories(results: dict[str, dict]) -> list[str]:
+    """Verifica duplicatas entre categorias (a partir dos resultados por arquivo)."""
     errors = []
     all_words = {}  # normalized -> (category, original)
 
-    for filepath in sorted(words_dir.glob("*.json")):
-        try:
-            data = load_json(filepath)
-        except json.JSONDecodeError:
-            continue
-
-        cat_id = data.get("categoryId", filepath.stem)
-        for word in data.get("words", []):
-            norm = normalize(word)
+    for name in sorted(results):
+        result = results[name]
+        cat_id = result["categoryId"]
+        for norm, word in result["entries"]:
             if norm in all_words:
                 other_cat, other_word = all_words[norm]
                 if other_cat != cat_id:
@@ -167,7 +216,200 @@ def validate_cross_categories(words_dir: Path) -> list[str]:
     return errors
 
 
+def validate_near_duplicates(results: dict[str, dict]) -> list[str]:
+    """Plural/gênero e palavras contidas: clusters por categoria + pares entre categorias."""
+    bank: dict[str, list[str]] = {}
+    display: dict[tuple[str, str], str] = {}
+    for name in sorted(results):
+        cat_id = results[name]["categoryId"]
+        for norm, word in results[name]["entries"]:
+            bank.setdefault(cat_id, []).append(norm)
+            display.setdefault((cat_id, norm), word)
+
+    near = find_near_duplicates(bank)
+    warnings = [
+        f"NEAR-DUP: [{cat_id}] {describe_cluster(near, cat_id, words)}"
+        for cat_id, groups in near.clusters().items()
+        for words in groups
+    ]
+    for p in near.cross_category():
+        warnings.append(
+            f"NEAR-DUP: '{display[p.category_a, p.a]}' ({p.category_a}) ~ "
+            f"'{display[p.category_b, p.b]}' ({p.category_b}) → {p.relation}"
+        )
+    return warnings
+
+
+def validate_shard(path: Path, result: dict | None) -> list[str]:
+    """Valida um shard e compara com o resultado do JSON da categoria."""
+    prefix = f"shards/{path.name}"
+    try:
+        shard = Shard.load(path)
+    except (OSError, ShardFormatError) as e:
+        return [f"{prefix}: {e}"]
+
+    errors = []
+    for i, (norm, display) in enumerate(shard):
+        if not (MIN_WORD_LENGTH <= len(norm) <= MAX_WORD_LENGTH):
+            errors.append(f"{prefix}[{i}]: '{norm}' tem {len(norm)} letras")
+        if not (norm.isascii() and norm.isalpha() and norm.isupper()):
+            errors.append(f"{prefix}[{i}]: '{norm}' não é A-Z")
+        if normalize(display) != norm:
+            errors.append(f"{prefix}[{i}]: exibição '{display}' não normaliza para '{norm}'")
+
+    missing = sorted(set(selection_widths()) - set(shard.selection_widths))
+    if missing:
+        errors.append(f"{prefix}: sem bucket de seleção para a(s) largura(s) {missing} "
+                      "— rode build_shards.py")
+
+    if result is not None:
+        # WordDatabase.AddCategory: < 3 letters dropped, display = ToDisplay
+        expected = [(n, to_display(w)) for n, w in result["entries"] if len(n) >= MIN_WORD_LENGTH]
+        if list(shard) != expected:
+            errors.append(
+                f"{prefix}: desatualizado em relação a {path.stem}.json "
+                f"({len(shard)} × {len(expected)} palavras) — rode build_shards.py"
+            )
+    return errors
+
+
+def validate_shards(shards_dir: Path, results: dict[str, dict],
+                    shard_ids: list[str]) -> tuple[dict[str, list[str]], list[str]]:
+    """Valida manifest.json e cada shard. Retorna (erros por shard, avisos)."""
+    cases: dict[str, list[str]] = {}
+    warnings = []
+
+    manifest_path = shards_dir / MANIFEST_NAME
+    try:
+        manifest = load_json(manifest_path)
+        listed = {e["id"]: e for e in manifest["categories"]}
+        manifest_errors = []
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        listed, manifest_errors = {}, [f"shards/{MANIFEST_NAME}: inválido — {e}"]
+
+    for cat_id in shard_ids:
+        path = shards_dir / f"{cat_id}{SHARD_SUFFIX}"
+        name = f"shards/{path.name}"
+        if not path.exists():
+            cases[name] = [f"{name}: shard ausente — rode build_shards.py"]
+            continue
+        errors = validate_shard(path, results.get(f"{cat_id}.json"))
+        entry = listed.get(cat_id)
+        if entry is None:
+            manifest_errors.append(f"shards/{MANIFEST_NAME}: '{cat_id}' não listado")
+        elif entry.get("sha256") != hashlib.sha256(path.read_bytes()).hexdigest():
+            manifest_errors.append(f"shards/{MANIFEST_NAME}: SHA-256 de '{cat_id}' não confere")
+        cases[name] = errors
+
+    for path in sorted(shards_dir.glob(f"*{SHARD_SUFFIX}")):
+        if path.stem not in shard_ids:
+            warnings.append(f"ORPHAN: shards/{path.name} sem categoria em categories.json")
+
+    cases[f"shards/{MANIFEST_NAME}"] = manifest_errors
+    return cases, warnings
+
+
+# ---------------------------------------------------------------------------
+# Incremental cache
+# ---------------------------------------------------------------------------
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_cache(fingerprint: str) -> dict[str, dict]:
+    """Cached results per file name; empty when missing or built with other rules."""
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache.get("files", {})
+
+
+def save_cache(fingerprint: str, results: dict[str, dict]) -> None:
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps({"fingerprint": fingerprint, "files": results}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    os.replace(tmp, CACHE_FILE)
+
+
+def check_all(paths: list[Path], cached: dict[str, dict], jobs: int) -> tuple[dict[str, dict], list[str]]:
+    """Results for every file, revalidating only those whose content changed.
+
+    Returns (results by file name, names that were revalidated).
+    """
+    results, pending = {}, []
+    for path in paths:
+        # Read once: hashed here, parsed from the same bytes by check_file
+        raw = path.read_bytes()
+        hit = cached.get(path.name)
+        if hit is not None and hit.get("sha256") == _digest(raw):
+            results[path.name] = hit
+        else:
+            pending.append((path, raw))
+
+    if len(pending) > 1 and jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            fresh = list(pool.map(_check_file_job, pending))
+    else:
+        fresh = [check_file(path, raw) for path, raw in pending]
+    for (path, _), result in zip(pending, fresh):
+        results[path.name] = result
+    return results, [path.name for path, _ in pending]
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+def write_json_report(path: Path, report: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def write_junit_report(path: Path, cases: dict[str, list[str]], warnings: list[str],
+                       elapsed: float) -> None:
+    """JUnit XML: one test case per checked item, errors as failures."""
+    failures = sum(1 for errors in cases.values() if errors)
+    suite = ET.Element("testsuite", {
+        "name": "validate_words",
+        "tests": str(len(cases)),
+        "failures": str(failures),
+        "errors": "0",
+        "time": f"{elapsed:.3f}",
+    })
+    for name, errors in cases.items():
+        case = ET.SubElement(suite, "testcase", {"classname": "validate_words", "name": name})
+        if errors:
+            failure = ET.SubElement(case, "failure", {
+                "message": f"{len(errors)} erro(s)", "type": "ValidationError",
+            })
+            failure.text = "\n".join(errors)
+    if warnings:
+        ET.SubElement(suite, "system-out").text = "\n".join(warnings)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Valida os JSONs de palavras do Caça-Palavras.")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="processos para validar arquivos alterados (0 = todos os núcleos)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="revalida todos os arquivos, ignorando o cache")
+    parser.add_argument("--shards", type=Path, default=SHARDS_DIR, metavar="PASTA",
+                        help="pasta de shards a validar, se existir (padrão: Resources/Data/shards)")
+    parser.add_argument("--report-json", type=Path, metavar="ARQ", help="grava relatório JSON")
+    parser.add_argument("--junit", type=Path, metavar="ARQ", help="grava relatório JUnit XML")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    started = time.perf_counter()
+
     print("=" * 60)
     print("🔍 Validador de Dados — Caça-Palavras")
     print("=" * 60)
@@ -175,6 +417,7 @@ def main():
 
     all_errors = []
     all_warnings = []
+    cases: dict[str, list[str]] = {}
 
     # 1. Verificar existência dos arquivos
     if not CATEGORIES_FILE.exists():
@@ -187,58 +430,101 @@ def main():
     categories_data = load_json(CATEGORIES_FILE)
     errors = validate_categories(categories_data)
     all_errors.extend(errors)
+    cases["categories.json"] = errors
 
     category_ids = [c["id"] for c in categories_data.get("categories", [])]
     print(f"   {len(category_ids)} categorias encontradas: {', '.join(category_ids)}")
 
-    # 3. Validar cada arquivo de palavras
+    # 3. Ler e validar cada arquivo de palavras uma única vez (só os alterados)
+    fingerprint = validation_fingerprint()
+    cached = {} if args.no_cache else load_cache(fingerprint)
+    paths = sorted(WORDS_DIR.glob("*.json"))
+    results, rechecked = check_all(paths, cached, jobs)
+    save_cache(fingerprint, results)
+    print(f"\n♻️  {len(paths) - len(rechecked)} arquivo(s) do cache, {len(rechecked)} revalidado(s)")
+
     total_words = 0
     for cat_id in category_ids:
-        filepath = WORDS_DIR / f"{cat_id}.json"
-        print(f"\n📄 Validando {cat_id}.json...")
+        name = f"{cat_id}.json"
+        print(f"\n📄 Validando {name}...")
 
-        if not filepath.exists():
-            all_errors.append(f"{cat_id}.json: arquivo não encontrado em {WORDS_DIR}")
+        if name not in results:
+            errors = [f"{name}: arquivo não encontrado em {WORDS_DIR}"]
+            all_errors.extend(errors)
+            cases[name] = errors
             continue
 
-        errors = validate_words_file(filepath, cat_id)
+        errors = results[name]["errors"]
         all_errors.extend(errors)
-
-        data = load_json(filepath)
-        word_count = len(data.get("words", []))
-        total_words += word_count
-        print(f"   {word_count} palavras")
+        cases[name] = errors
+        total_words += results[name]["wordCount"]
+        print(f"   {results[name]['wordCount']} palavras")
 
     # 4. Validar desafio.json (banco exclusivo do modo Desafio)
-    desafio_path = WORDS_DIR / "desafio.json"
-    if desafio_path.exists():
+    if "desafio.json" in results:
         print(f"\n📄 Validando desafio.json...")
-        desafio_data = load_json(desafio_path)
-        desafio_words = desafio_data.get("words", [])
-        total_words += len(desafio_words)
-        print(f"   {len(desafio_words)} palavras")
-        if len(desafio_words) < MIN_WORDS_DESAFIO:
-            all_errors.append(f"desafio.json: apenas {len(desafio_words)} palavras (mínimo: {MIN_WORDS_DESAFIO})")
-        errors = validate_words_file(desafio_path, "desafio")
+        desafio = results["desafio.json"]
+        total_words += desafio["wordCount"]
+        print(f"   {desafio['wordCount']} palavras")
+        errors = list(desafio["errors"])
+        if desafio["wordCount"] < MIN_WORDS_DESAFIO:
+            errors.insert(0, f"desafio.json: apenas {desafio['wordCount']} palavras (mínimo: {MIN_WORDS_DESAFIO})")
         all_errors.extend(errors)
+        cases["desafio.json"] = errors
     else:
         all_warnings.append("desafio.json: arquivo não encontrado (modo Desafio sem banco exclusivo)")
 
     # 5. Verificar duplicatas entre categorias (inclui desafio)
     print(f"\n🔀 Verificando duplicatas entre categorias...")
-    cross_errors = validate_cross_categories(WORDS_DIR)
+    cross_errors = validate_cross_categories(results)
     # Cross-dups são warnings, não errors (podem ser intencionais)
     all_warnings.extend(cross_errors)
 
+    print(f"\n🧬 Verificando quase-duplicatas (plural, gênero, contidas)...")
+    near_warnings = validate_near_duplicates(results)
+    all_warnings.extend(near_warnings)
+    print(f"   {len(near_warnings)} cluster(s)/par(es)")
+
     # 6. Verificar arquivos órfãos (sem categoria correspondente)
     known_ids = set(category_ids) | {"desafio"}
-    for filepath in sorted(WORDS_DIR.glob("*.json")):
+    for filepath in paths:
         if filepath.stem not in known_ids:
             all_warnings.append(f"ORPHAN: {filepath.name} sem categoria em categories.json")
 
+    # 7. Validar shards pré-normalizados (se gerados)
+    if args.shards.is_dir():
+        print(f"\n🧩 Validando shards em {args.shards.name}/...")
+        shard_ids = category_ids + (["desafio"] if "desafio.json" in results else [])
+        shard_cases, shard_warnings = validate_shards(args.shards, results, shard_ids)
+        for name, errors in shard_cases.items():
+            all_errors.extend(errors)
+            cases[name] = errors
+        all_warnings.extend(shard_warnings)
+        print(f"   {len(shard_cases) - 1} shards")
+
     # Resultado
     print()
     print_results(all_errors, all_warnings, total_words, len(category_ids))
+    elapsed = time.perf_counter() - started
+
+    if args.report_json:
+        write_json_report(args.report_json, {
+            "ok": not all_errors,
+            "errors": all_errors,
+            "warnings": all_warnings,
+            "files": {
+                name: {"words": r["wordCount"], "errors": len(r["errors"]),
+                       "cached": name not in rechecked}
+                for name, r in results.items()
+            },
+            "totalWords": total_words,
+            "categories": len(category_ids),
+            "seconds": round(elapsed, 3),
+        })
+        print(f"📝 Relatório JSON → {args.report_json}")
+    if args.junit:
+        write_junit_report(args.junit, cases, all_warnings, elapsed)
+        print(f"📝 Relatório JUnit → {args.junit}")
 
     return 1 if all_errors else 0
 
@@ -0,0 +1,106 @@
+"""
+word_codes.py
+-------------
+Representação compacta dos conjuntos de palavras do build_termo.py: cada
+palavra de N letras A-Z vira um inteiro de 5·N bits (5 bits por letra, a
+primeira nos bits mais altos) e um conjunto vira um array NumPy ordenado e
+sem repetições.
+
+  • uint32 até 6 letras (30 bits), uint64 até 12 (60 bits)
+  • ~4–8 bytes por palavra, contra ~70–80 de uma str num set do Python
+  • a ordem numérica é a ordem alfabética, então decode_words() de um
+    array já sai ordenado (mesma saída que sorted(set))
+  • união, diferença, interseção e pertinência são operações vetorizadas
+    sobre arrays ordenados (np.unique / np.isin com assume_unique)
+
+Uso:
+  from word_codes import decode_words, difference, encode_words, union
+  a = encode_words(["GATOS", "CASAS"], 5)
+  decode_words(union(a, encode_words(["MUNDO"], 5)), 5)  → ["CASAS", "GATOS", "MUNDO"]
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+
+LETTER_BITS = 5
+LETTER_MASK = (1 << LETTER_BITS) - 1
+
+# Longest word that fits a uint64 code
+MAX_LENGTH = 64 // LETTER_BITS
+
+
+def code_dtype(length: int) -> np.dtype:
+    """Smallest unsigned dtype holding a `length`-letter code."""
+    if not 0 < length <= MAX_LENGTH:
+        raise ValueError(f"tamanho {length} fora de 1..{MAX_LENGTH}")
+    return np.dtype(np.uint32) if length * LETTER_BITS <= 32 else np.dtype(np.uint64)
+
+
+def empty(length: int) -> np.ndarray:
+    return np.zeros(0, dtype=code_dtype(length))
+
+
+def encode_words(words: Iterable[str], length: int) -> np.ndarray:
+    """Sorted, duplicate-free codes of `words` (all `length` letters A-Z)."""
+    words = list(words)
+    if not words:
+        return empty(length)
+    data = "".join(words).encode("ascii")
+    if len(data) != len(words) * length:
+        raise ValueError(f"todas as palavras devem ter {length} letras")
+    letters = np.frombuffer(data, dtype=np.uint8).reshape(len(words), length) - ord("A")
+    if letters.max() > 25:
+        raise ValueError("palavras devem conter só letras A-Z")
+    dtype = code_dtype(length)
+    codes = np.zeros(len(words), dtype=dtype)
+    shift = dtype.type(LETTER_BITS)
+    for i in range(length):
+        codes = (codes << shift) | letters[:, i].astype(dtype)
+    return np.unique(codes)
+
+
+def decode_words(codes: np.ndarray, length: int) -> list[str]:
+    """Codes back to words, in the order given."""
+    if len(codes) == 0:
+        return []
+    dtype = code_dtype(length)
+    codes = codes.astype(dtype)
+    letters = np.empty((len(codes), length), dtype=np.uint8)
+    shift = dtype.type(LETTER_BITS)
+    for i in reversed(range(length)):
+        letters[:, i] = (codes & dtype.type(LETTER_MASK)) + ord("A")
+        codes = codes >> shift
+    text = letters.tobytes().decode("ascii")
+    return [text[i:i + length] for i in range(0, len(text), length)]
+
+
+# ---------------------------------------------------------------------------
+# Set algebra (inputs and outputs: sorted, duplicate-free code arrays)
+# ---------------------------------------------------------------------------
+
+def union(*arrays: np.ndarray) -> np.ndarray:
+    """a | b | … in one sort (cheaper than chaining np.union1d)."""
+    filled = [a for a in arrays if len(a)]
+    if len(filled) <= 1:
+        return filled[0] if filled else arrays[0]
+    return np.unique(np.concatenate(filled))
+
+
+def difference(a: np.ndarray, *others: np.ndarray) -> np.ndarray:
+    """a - b - …"""
+    for other in others:
+        if len(a) and len(other):
+            a = a[~np.isin(a, other, assume_unique=True)]
+    return a
+
+
+def intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """a & b"""
+    return np.intersect1d(a, b, assume_unique=True)
+
+
+def contains(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Boolean mask over `a`: which codes are in `b`."""
+    return np.isin(a, b, assume_unique=True)
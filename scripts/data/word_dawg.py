@@ -0,0 +1,406 @@
+"""
+word_dawg.py
+------------
+DAWG minimizado (autômato acíclico de palavras) do dicionário do Termo BR,
+com consultas de pertinência, prefixo e padrão — e serialização num array
+plano de uint32 que o Unity pode mapear em memória sem parse.
+
+Layout (little-endian):
+
+  offset  tamanho  campo
+  0       4        magic  b"TDWG"
+  4       1        versão (DAWG_VERSION)
+  5       1        tamanho das palavras (0 = misto)
+  6       2        reservado (0)
+  8       4        quantidade de palavras
+  12      4        quantidade de arestas E (inclui a sentinela 0)
+  16      4 × E    arestas uint32
+
+  Cada aresta (uint32):
+    bits 0-4   letra (0 = A … 25 = Z)
+    bit  5     fim de palavra ao seguir esta aresta
+    bit  6     última aresta da lista do nó
+    bits 7-31  índice da primeira aresta do nó filho (0 = sem filhos)
+
+  A aresta 0 é sentinela; a lista da raiz começa em ROOT_INDEX (1). As
+  arestas de cada nó são contíguas e ordenadas por letra.
+
+Uso:
+  python scripts/data/word_dawg.py build valid_5.json valid_5_dawg.bytes
+  python scripts/data/word_dawg.py query valid_5_dawg.bytes "C?S?S" [--exclude XYZ]
+                                         [--require A] [--misplaced 0:A,2:E]
+"""
+
+import argparse
+import json
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+
+MAGIC = b"TDWG"
+DAWG_VERSION = 1
+HEADER = struct.Struct("<4sBBHII")
+
+ROOT_INDEX = 1
+
+LETTER_BITS = 0x1F
+FINAL_BIT = 1 << 5
+LAST_BIT = 1 << 6
+CHILD_SHIFT = 7
+MAX_EDGES = 1 << (32 - CHILD_SHIFT)
+
+ALL_LETTERS = (1 << 26) - 1
+
+# Pattern wildcards accepted by Dawg.match
+WILDCARDS = "?._"
+
+
+class DawgFormatError(ValueError):
+    """Raised when a serialized DAWG is truncated, corrupt or has an unknown version."""
+
+
+# ---------------------------------------------------------------------------
+# Build (Daciuk et al. — incremental construction from sorted input)
+# ---------------------------------------------------------------------------
+
+class _Node:
+    __slots__ = ("edges", "final", "uid")
+
+    def __init__(self):
+        self.edges: dict[str, "_Node"] = {}
+        self.final = False
+        self.uid = -1
+
+    def signature(self) -> tuple:
+        return (self.final, tuple((c, n.uid) for c, n in sorted(self.edges.items())))
+
+
+def _build_graph(words: list[str]) -> _Node:
+    root = _Node()
+    register: dict[tuple, _Node] = {}
+    unchecked: list[tuple[_Node, str, _Node]] = []
+
+    def minimize(down_to: int) -> None:
+        while len(unchecked) > down_to:
+            parent, letter, child = unchecked.pop()
+            sig = child.signature()
+            existing = register.get(sig)
+            if existing is not None:
+                parent.edges[letter] = existing
+            else:
+                child.uid = len(register)
+                register[sig] = child
+
+    previous = ""
+    for word in words:
+        common = 0
+        for a, b in zip(previous, word):
+            if a != b:
+                break
+            common += 1
+        minimize(common)
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common:]:
+            child = _Node()
+            node.edges[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.final = True
+        previous = word
+    minimize(0)
+    return root
+
+
+def encode_words(words: Iterable[str]) -> bytes:
+    """Builds the minimized DAWG of `words` (A-Z only) and serializes it."""
+    ordered = sorted(set(words))
+    for w in ordered:
+        if not w or not w.isascii() or not w.isalpha() or not w.isupper():
+            raise ValueError(f"palavra inválida para o DAWG: {w!r}")
+    lengths = {len(w) for w in ordered}
+    word_length = lengths.pop() if len(lengths) == 1 else 0
+
+    root = _build_graph(ordered)
+
+    # Lay out every node's edge list contiguously, root first
+    edges: list[int] = [0]
+    start_of: dict[int, int] = {}
+    pending: list[_Node] = [root]
+    fixups: list[tuple[int, _Node]] = []
+    while pending:
+        node = pending.pop()
+        start_of[id(node)] = len(edges)
+        items = sorted(node.edges.items())
+        for i, (letter, child) in enumerate(items):
+            value = ord(letter) - 65
+            if child.final:
+                value |= FINAL_BIT
+            if i == len(items) - 1:
+                value |= LAST_BIT
+            if child.edges:
+                fixups.append((len(edges), child))
+                if id(child) not in start_of:
+                    start_of[id(child)] = -1
+                    pending.append(child)
+            edges.append(value)
+    for index, child in fixups:
+        edges[index] |= start_of[id(child)] << CHILD_SHIFT
+
+    if len(edges) >= MAX_EDGES:
+        raise ValueError(f"DAWG com {len(edges):,} arestas excede o limite de {MAX_EDGES:,}")
+
+    body = array("I", edges)
+    if sys.byteorder != "little":
+        body.byteswap()
+    header = HEADER.pack(MAGIC, DAWG_VERSION, word_length, 0, len(ordered), len(edges))
+    return header + body.tobytes()
+
+
+def write_dawg(path: Path, words: Iterable[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_words(words))
+
+
+# ---------------------------------------------------------------------------
+# Query API (reads the flat array — same semantics as a memory-mapped reader)
+# ---------------------------------------------------------------------------
+
+def _check_letters(letters: str, what: str, wildcards: str = "") -> None:
+    for c in letters:
+        if not ("A" <= c <= "Z" or c in wildcards):
+            allowed = f"A-Z ou um de {wildcards!r}" if wildcards else "A-Z"
+            raise ValueError(f"{what}: caractere inválido {c!r} (use {allowed})")
+
+
+def letter_mask(letters: Iterable[str]) -> int:
+    mask = 0
+    for c in letters:
+        mask |= 1 << (ord(c) - 65)
+    return mask
+
+
+class Dawg:
+    """Read-only DAWG over the flat edge array."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise DawgFormatError("arquivo menor que o cabeçalho")
+        magic, version, word_length, _, word_count, edge_count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise DawgFormatError(f"magic inválido: {magic!r}")
+        if version != DAWG_VERSION:
+            raise DawgFormatError(f"versão {version} não suportada")
+        if len(data) != HEADER.size + 4 * edge_count:
+            raise DawgFormatError(f"tamanho {len(data)} incompatível com {edge_count} arestas")
+
+        edges = array("I")
+        edges.frombytes(data[HEADER.size:])
+        if sys.byteorder != "little":
+            edges.byteswap()
+
+        self.word_length = word_length
+        self._count = word_count
+        # Decoded once into parallel lists: indexing them is what the queries do
+        self._letters = [e & LETTER_BITS for e in edges]
+        self._finals = [bool(e & FINAL_BIT) for e in edges]
+        self._lasts = [bool(e & LAST_BIT) for e in edges]
+        self._children = [e >> CHILD_SHIFT for e in edges]
+        self._root = ROOT_INDEX if edge_count > ROOT_INDEX else 0
+
+    @classmethod
+    def load(cls, path: Path) -> "Dawg":
+        return cls(path.read_bytes())
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "Dawg":
+        return cls(encode_words(words))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._letters)
+
+    def _find_edge(self, start: int, letter: int) -> int:
+        """Index of the edge for `letter` in the list starting at `start`, or 0."""
+        e = start
+        letters, lasts = self._letters, self._lasts
+        while e:
+            if letters[e] == letter:
+                return e
+            if lasts[e] or letters[e] > letter:
+                return 0
+            e += 1
+        return 0
+
+    def _walk(self, prefix: str) -> int:
+        """Edge reached by the last letter of `prefix`, or 0 if absent."""
+        e, start = 0, self._root
+        for c in prefix:
+            if not start or not "A" <= c <= "Z":
+                return 0
+            e = self._find_edge(start, ord(c) - 65)
+            if not e:
+                return 0
+            start = self._children[e]
+        return e
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        e = self._walk(word)
+        return bool(e) and self._finals[e]
+
+    def contains(self, word: str) -> bool:
+        return word in self
+
+    def _iter_from(self, start: int, prefix: str) -> Iterator[str]:
+        """Words below the edge list at `start`, in lexicographic order."""
+        letters, finals, lasts, children = self._letters, self._finals, self._lasts, self._children
+        stack: list[tuple[int, str]] = [(start, prefix)] if start else []
+        while stack:
+            e, base = stack.pop()
+            # Yield this list in order, descending depth-first into each child
+            word = base + chr(65 + letters[e])
+            if not lasts[e]:
+                stack.append((e + 1, base))
+            if children[e]:
+                stack.append((children[e], word))
+            if finals[e]:
+                yield word
+
+    def __iter__(self) -> Iterator[str]:
+        return self._iter_from(self._root, "")
+
+    def prefix_iter(self, prefix: str) -> Iterator[str]:
+        """Every word starting with `prefix` (including `prefix` itself), sorted."""
+        if not prefix:
+            yield from self
+            return
+        e = self._walk(prefix)
+        if not e:
+            return
+        if self._finals[e]:
+            yield prefix
+        yield from self._iter_from(self._children[e], prefix)
+
+    def match(
+        self,
+        pattern: str,
+        exclude: Iterable[str] = "",
+        require: Iterable[str] = "",
+        misplaced: dict[int, Iterable[str]] | None = None,
+    ) -> list[str]:
+        """Words matching a Termo-style pattern, sorted.
+
+        pattern   — one char per position: a letter (fixed) or one of WILDCARDS
+        exclude   — letters that appear nowhere in the word
+        require   — letters that must appear (repeat a letter to require it twice)
+        misplaced — {position: letters} not allowed at that position (yellows)
+        """
+        pattern = pattern.upper()
+        exclude, require = "".join(exclude).upper(), "".join(require).upper()
+        misplaced = {i: "".join(ls).upper() for i, ls in (misplaced or {}).items()}
+        _check_letters(pattern, "padrão", WILDCARDS)
+        _check_letters(exclude, "letras excluídas")
+        _check_letters(require, "letras exigidas")
+        for i, ls in misplaced.items():
+            _check_letters(ls, f"letras fora do lugar na posição {i}")
+
+        size = len(pattern)
+        if size == 0:
+            return []
+        banned = letter_mask(exclude)
+        allowed: list[int] = []
+        for i, c in enumerate(pattern):
+            if c in WILDCARDS:
+                m = ALL_LETTERS & ~banned
+                if misplaced and i in misplaced:
+                    m &= ~letter_mask(misplaced[i])
+            else:
+                m = 1 << (ord(c) - 65)
+            allowed.append(m)
+        need = list(Counter(require).items())
+
+        letters, finals, lasts, children = self._letters, self._finals, self._lasts, self._children
+        last_depth = size - 1
+        results: list[str] = []
+        stack: list[tuple[int, int, str]] = [(self._root, 0, "")] if self._root else []
+        while stack:
+            e, depth, base = stack.pop()
+            m = allowed[depth]
+            while True:
+                letter = letters[e]
+                if m >> letter & 1:
+                    word = base + chr(65 + letter)
+                    if depth == last_depth:
+                        if finals[e] and all(word.count(c) >= k for c, k in need):
+                            results.append(word)
+                    elif children[e]:
+                        stack.append((children[e], depth + 1, word))
+                if lasts[e]:
+                    break
+                e += 1
+        results.sort()
+        return results
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _parse_misplaced(text: str) -> dict[int, str]:
+    result: dict[int, str] = {}
+    for part in filter(None, text.split(",")):
+        pos, letters = part.split(":")
+        result[int(pos)] = result.get(int(pos), "") + letters.upper()
+    return result
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="DAWG do dicionário do Termo BR.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="gera o DAWG a partir de um words/valid_N.json")
+    p_build.add_argument("json_file", type=Path)
+    p_build.add_argument("output", type=Path)
+
+    p_query = sub.add_parser("query", help="consulta por padrão (ex.: C?S?S)")
+    p_query.add_argument("dawg_file", type=Path)
+    p_query.add_argument("pattern")
+    p_query.add_argument("--exclude", default="")
+    p_query.add_argument("--require", default="")
+    p_query.add_argument("--misplaced", default="", help="posição:letras, ex.: 0:A,2:E")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        words = json.loads(args.json_file.read_text(encoding="utf-8"))["words"]
+        write_dawg(args.output, words)
+        dawg = Dawg.load(args.output)
+        print(f"  {len(dawg):,} palavras, {dawg.edge_count:,} arestas → {args.output}")
+        print(f"  {args.output.stat().st_size:,} bytes (JSON: {args.json_file.stat().st_size:,})")
+        return 0
+
+    dawg = Dawg.load(args.dawg_file)
+    try:
+        found = dawg.match(
+            args.pattern,
+            exclude=args.exclude,
+            require=args.require,
+            misplaced=_parse_misplaced(args.misplaced),
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    print(f"  {len(found):,} palavras: {' '.join(found[:50])}{' …' if len(found) > 50 else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,245 @@
+"""
+word_shards.py
+--------------
+Formato binário por categoria (shard) com as palavras já normalizadas,
+para o jogo carregar categorias sob demanda sem normalizar palavra por
+palavra (WordDatabase.AddCategory).
+
+Layout (little-endian):
+
+  offset  tamanho      campo
+  0       4            magic b"WSHD"
+  4       1            versão (SHARD_VERSION)
+  5       1            maior tamanho normalizado M
+  6       1            largura dos índices do length index (2 ou 4 bytes)
+  7       1            quantidade K de buckets de seleção
+  8       4            quantidade de palavras N
+  12      4            bytes do bloco normalizado
+  16      4            bytes do bloco de exibição
+  20      N            tamanho de cada palavra normalizada (uint8)
+  …       N            tamanho em bytes de cada forma de exibição (uint8)
+  …                    bloco normalizado (ASCII A-Z, concatenado)
+  …                    bloco de exibição (UTF-8, concatenado)
+  …       4 × (M+1)    length index: quantas palavras têm cada tamanho 0..M
+  …       w × N        length index: posições das palavras, agrupadas por
+                       tamanho (crescente), na ordem original dentro do grupo
+  …       8 × K        buckets de seleção: (largura W, quantidade) em uint32
+  …       w × Σ        buckets de seleção: posições das palavras com
+                       3 ≤ tamanho ≤ W, na ordem original, bucket a bucket
+
+Os buckets de seleção são a lista validIndices que o SelectWords monta a
+cada nível (varrendo a categoria inteira) para as larguras em que ele é
+chamado (levelgen.level.selection_widths: 8, 10, 12 e 20): com eles o
+sorteio começa direto do Fisher-Yates e dá as mesmas palavras para o mesmo
+seed (ver simulate_selection.py).
+
+As palavras ficam na ordem do JSON (a mesma do WordDatabase — o
+SelectWords sorteia sobre essa ordem). O arquivo usa a extensão .bytes
+para que o Unity o importe como TextAsset.
+
+Uso:
+  from word_shards import Shard, write_shard
+  (gerar: build_shards.py — validar: validate_words.py)
+"""
+
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from levelgen.level import MIN_WORD_LENGTH
+
+
+MAGIC = b"WSHD"
+SHARD_VERSION = 2
+HEADER = struct.Struct("<4sBBBBIII")
+BUCKET = struct.Struct("<II")
+
+SHARD_SUFFIX = ".bytes"
+
+# Lists every shard of a folder (see build_shards.py)
+MANIFEST_NAME = "manifest.json"
+
+# Per-record lengths are stored as uint8
+MAX_RECORD_BYTES = 255
+
+
+class ShardFormatError(ValueError):
+    """Raised when a shard is truncated, corrupt or has an unknown version."""
+
+
+def _index_format(count: int) -> str:
+    return "H" if count <= 0xFFFF else "I"
+
+
+def encode_shard(
+    normalized: list[str], display: list[str], widths: Iterable[int] = ()
+) -> bytes:
+    """Serializes one category (normalized and display forms, same order)
+    with a selection bucket for each grid width in `widths`.
+    """
+    if len(normalized) != len(display):
+        raise ValueError("normalized e display devem ter o mesmo tamanho")
+
+    norm_bytes = [w.encode("ascii") for w in normalized]
+    disp_bytes = [w.encode("utf-8") for w in display]
+    for n, d in zip(norm_bytes, disp_bytes):
+        if not (n.isalpha() and n.isupper()):
+            raise ValueError(f"palavra normalizada inválida: {n!r}")
+        if len(n) > MAX_RECORD_BYTES or len(d) > MAX_RECORD_BYTES:
+            raise ValueError(f"palavra longa demais para o shard: {d!r}")
+
+    max_len = max((len(n) for n in norm_bytes), default=0)
+    buckets: list[list[int]] = [[] for _ in range(max_len + 1)]
+    for i, n in enumerate(norm_bytes):
+        buckets[len(n)].append(i)
+
+    widths = sorted(set(widths))
+    if len(widths) > 0xFF or any(not 0 < w <= 0xFFFFFFFF for w in widths):
+        raise ValueError(f"larguras de seleção inválidas: {widths}")
+    selection = [
+        [i for i, n in enumerate(norm_bytes) if MIN_WORD_LENGTH <= len(n) <= w]
+        for w in widths
+    ]
+
+    fmt = _index_format(len(normalized))
+    norm_blob = b"".join(norm_bytes)
+    disp_blob = b"".join(disp_bytes)
+    return b"".join([
+        HEADER.pack(MAGIC, SHARD_VERSION, max_len, struct.calcsize(fmt), len(widths),
+                    len(normalized), len(norm_blob), len(disp_blob)),
+        bytes(len(n) for n in norm_bytes),
+        bytes(len(d) for d in disp_bytes),
+        norm_blob,
+        disp_blob,
+        struct.pack(f"<{max_len + 1}I", *(len(b) for b in buckets)),
+        struct.pack(f"<{len(normalized)}{fmt}", *(i for b in buckets for i in b)),
+        b"".join(BUCKET.pack(w, len(b)) for w, b in zip(widths, selection)),
+        struct.pack(f"<{sum(map(len, selection))}{fmt}", *(i for b in selection for i in b)),
+    ])
+
+
+def write_shard(
+    path: Path, normalized: list[str], display: list[str], widths: Iterable[int] = ()
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_shard(normalized, display, widths))
+
+
+class Shard:
+    """Decoded shard: both word lists, the length index and the selection buckets."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise ShardFormatError("arquivo menor que o cabeçalho")
+        magic, version, max_len, width, n_buckets, count, norm_size, disp_size = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ShardFormatError(f"magic inválido: {magic!r}")
+        if version != SHARD_VERSION:
+            raise ShardFormatError(f"versão {version} não suportada")
+        if width not in (2, 4):
+            raise ShardFormatError(f"largura de índice inválida: {width}")
+
+        index_end = HEADER.size + 2 * count + norm_size + disp_size + 4 * (max_len + 1) + width * count
+        if len(data) < index_end + BUCKET.size * n_buckets:
+            raise ShardFormatError(f"tamanho {len(data)} menor que o esperado pelo cabeçalho")
+        bucket_table = [BUCKET.unpack_from(data, index_end + BUCKET.size * k) for k in range(n_buckets)]
+        expected = index_end + BUCKET.size * n_buckets + width * sum(n for _, n in bucket_table)
+        if len(data) != expected:
+            raise ShardFormatError(f"tamanho {len(data)} ≠ {expected} esperado pelo cabeçalho")
+
+        pos = HEADER.size
+        norm_lens = data[pos:pos + count]
+        disp_lens = data[pos + count:pos + 2 * count]
+        pos += 2 * count
+        if sum(norm_lens) != norm_size or sum(disp_lens) != disp_size:
+            raise ShardFormatError("tamanhos dos registros não batem com os blocos")
+
+        try:
+            norm_blob = data[pos:pos + norm_size].decode("ascii")
+            pos += norm_size
+            disp_blob = data[pos:pos + disp_size]
+            self.display = []
+            start = 0
+            for size in disp_lens:
+                self.display.append(disp_blob[start:start + size].decode("utf-8"))
+                start += size
+        except UnicodeDecodeError as e:
+            raise ShardFormatError(f"texto inválido no shard: {e}") from None
+        pos += disp_size
+
+        self.normalized = []
+        start = 0
+        for size in norm_lens:
+            self.normalized.append(norm_blob[start:start + size])
+            start += size
+
+        counts = struct.unpack_from(f"<{max_len + 1}I", data, pos)
+        pos += 4 * (max_len + 1)
+        fmt = 'H' if width == 2 else 'I'
+        positions = struct.unpack_from(f"<{count}{fmt}", data, pos)
+        pos += width * count
+        if sum(counts) != count:
+            raise ShardFormatError("length index não cobre todas as palavras")
+
+        self.max_length = max_len
+        self._by_length: list[tuple[int, ...]] = []
+        start = 0
+        for length, n in enumerate(counts):
+            bucket = positions[start:start + n]
+            if any(i >= count or len(self.normalized[i]) != length for i in bucket):
+                raise ShardFormatError(f"length index inconsistente no tamanho {length}")
+            self._by_length.append(bucket)
+            start += n
+
+        pos += BUCKET.size * n_buckets
+        self._selection: dict[int, tuple[int, ...]] = {}
+        for max_width, n in bucket_table:
+            bucket = struct.unpack_from(f"<{n}{fmt}", data, pos)
+            pos += width * n
+            if max_width in self._selection or bucket != self._fits(max_width):
+                raise ShardFormatError(f"bucket de seleção inconsistente na largura {max_width}")
+            self._selection[max_width] = bucket
+
+    @classmethod
+    def load(cls, path: Path) -> "Shard":
+        return cls(path.read_bytes())
+
+    def __len__(self) -> int:
+        return len(self.normalized)
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(zip(self.normalized, self.display))
+
+    def with_length(self, length: int) -> tuple[int, ...]:
+        """Positions (original order) of the words with `length` letters."""
+        if 0 <= length <= self.max_length:
+            return self._by_length[length]
+        return ()
+
+    def up_to_length(self, max_length: int) -> list[int]:
+        """Positions of the words with ≤ max_length letters, in original order."""
+        found = [i for length in range(min(max_length, self.max_length) + 1)
+                 for i in self._by_length[length]]
+        return sorted(found)
+
+    @property
+    def selection_widths(self) -> list[int]:
+        """Grid widths with a precomputed selection bucket."""
+        return sorted(self._selection)
+
+    def selectable(self, max_width: int) -> tuple[int, ...]:
+        """SelectWords' validIndices for `max_width`: positions of the words
+        with MIN_WORD_LENGTH..max_width letters, in original order.
+
+        Precomputed for the shard's selection widths; any other width is
+        merged from the length index.
+        """
+        if max_width in self._selection:
+            return self._selection[max_width]
+        return self._fits(max_width)
+
+    def _fits(self, max_width: int) -> tuple[int, ...]:
+        return tuple(sorted(
+            i for length in range(MIN_WORD_LENGTH, min(max_width, self.max_length) + 1)
+            for i in self._by_length[length]
+        ))